@@ -0,0 +1,7 @@
+"""
+Offline benchmark suite for the scrapers.
+
+Run from the repository root:
+
+    python -m benchmarks.run
+"""
@@ -0,0 +1,58 @@
+"""
+Module listing the (series, category, year) cases covered by the benchmarks.
+"""
+
+CASES = [
+    ("f1", "drivers", 1950),
+    ("f1", "races", 1950),
+    ("f1", "fastest_laps", 1950),
+    ("f1", "teams", 1958),
+    ("f1", "drivers", 1988),
+    ("f1", "races", 1988),
+    ("f1", "teams", 1988),
+    ("f1", "fastest_laps", 1988),
+    ("f1", "drivers", 2021),
+    ("f1", "races", 2021),
+    ("f1", "teams", 2021),
+    ("f1", "fastest_laps", 2021),
+    ("f1", "race_results", 2021),
+    ("f1academy", "drivers", 2023),
+    ("f1academy", "races", 2023),
+    ("f1academy", "teams", 2023),
+    ("f2", "drivers", 2021),
+    ("f2", "races", 2021),
+    ("f2", "teams", 2021),
+    ("f3", "drivers", 2021),
+    ("f3", "races", 2021),
+    ("f3", "teams", 2021),
+    ("fe", "drivers", 2016),
+    ("fe", "races", 2016),
+    ("fe", "teams", 2016),
+    ("fe", "drivers", 2023),
+    ("fe", "races", 2023),
+    ("fe", "teams", 2023),
+    ("fe", "race_results", 2023),
+]
+
+
+def fixture_path(url):
+    """
+    Return the fixture file of a scraper URL, relative to the fixtures
+    directory.
+
+    The scheme is dropped and the query string is appended to the file name
+    after "__", e.g. "www.fiaformula2.com/Standings/Driver__seasonId=178".
+    A path with neither a query nor an extension also ends with "__", so it can
+    be the parent of other fixtures, e.g. ".../sessions__" next to
+    ".../sessions/<id>/results__".
+
+    Args:
+        url: The URL built by a scraper.
+
+    Returns:
+        The relative path of the fixture.
+    """
+    path = url.split("://", 1)[1]
+    if "?" not in path and "." not in path.rsplit("/", 1)[-1]:
+        return path + "__"
+    return path.replace("?", "__")
@@ -0,0 +1,346 @@
+"""
+Script writing the benchmark fixtures.
+
+By default the fixtures are generated: deterministic pages reproducing the
+results-table markup the extractors target, padded with navigation and
+footer markup to a realistic page weight. With ``--record`` the pages are
+downloaded from the live websites instead.
+
+    python -m benchmarks.make_fixtures [--record]
+"""
+import argparse
+import json
+import os
+import random
+
+from formulascraper import SCRAPERS, HTTPTransport
+from formulascraper.scrapers import _advance
+
+from .cases import CASES, fixture_path
+from .server import FIXTURES
+
+_FIRST_NAMES = ["Lewis", "Max", "Charles", "Juan Manuel", "Alain", "Ayrton", "Nino",
+                "Sebastian", "Fernando", "Kimi", "Jenson", "Nelson", "Gerhard", "Valtteri"]
+_LAST_NAMES = ["Hamilton", "Verstappen", "Leclerc", "Fangio", "Prost", "Senna", "Farina",
+               "Vettel", "Alonso", "Räikkönen", "Button", "Piquet", "Berger", "Bottas"]
+_TEAMS = ["Mercedes", "Red Bull Racing Honda", "Ferrari", "McLaren Honda", "Alfa Romeo",
+          "Williams Mercedes", "Alpine Renault", "Lotus Ford", "Maserati", "Aston Martin"]
+_NATIONS = ["GBR", "NED", "MON", "ARG", "FRA", "BRA", "ITA", "GER", "ESP", "FIN"]
+_GRANDS_PRIX = ["Bahrain", "Emilia Romagna", "Portugal", "Spain", "Monaco", "Azerbaijan",
+                "France", "Styria", "Austria", "Great Britain", "Hungary", "Belgium",
+                "Netherlands", "Italy", "Russia", "Turkey", "United States", "Mexico",
+                "Brazil", "Qatar", "Saudi Arabia", "Abu Dhabi"]
+_MONTHS = ["Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+# Number of drivers, races and teams per generated season.
+_SIZES = {
+    ("f1", 1950): (81, 7, 0),
+    ("f1", 1958): (60, 11, 10),
+    ("f1", 1988): (48, 16, 18),
+    ("f1", 2021): (21, 22, 10),
+    ("f1academy", 2023): (15, 21, 5),
+    ("f2", 2021): (22, 24, 11),
+    ("f3", 2021): (30, 27, 10),
+    ("fe", 2016): (20, 11, 10),
+    ("fe", 2023): (22, 16, 11),
+}
+
+
+def _chrome(random_):
+    links = "".join(
+        f'<li class="nav-item"><a href="/en/page-{random_.randrange(10 ** 6)}.html">'
+        f'Link {index}</a></li>\n'
+        for index in range(400)
+    )
+    return f'<nav class="site-navigation"><ul>\n{links}</ul></nav>\n'
+
+
+def _driver(random_):
+    return random_.choice(_FIRST_NAMES), random_.choice(_LAST_NAMES)
+
+
+def _f1_page(category, year, random_):
+    drivers, races, teams = _SIZES[("f1", year)]
+    rows = []
+    if category == "drivers":
+        for position in range(1, drivers + 1):
+            first, last = _driver(random_)
+            team = random_.choice(_TEAMS)
+            rows.append(
+                '<tr>\n<td class="limiter"></td>\n'
+                f'<td class="dark">{position}</td>\n'
+                f'<td><a class="dark bold ItemLink" href="/en/results.html/{year}/drivers/X{position}.html">\n'
+                f'<span class="hide-for-tablet">{first}</span>\n'
+                f'<span class="hide-for-mobile">{last}</span>\n'
+                f'<span class="uppercase hide-for-desktop">{last[:3].upper()}</span>\n</a></td>\n'
+                f'<td class="dark semi-bold uppercase">{random_.choice(_NATIONS)}</td>\n'
+                f'<td><a class="grey semi-bold uppercase ArchiveLink" '
+                f'href="/en/results.html/{year}/team/{team.lower().replace(" ", "_")}.html">{team}</a></td>\n'
+                f'<td class="dark bold">{max(0, 400 - position * 17.5):g}</td>\n'
+                '<td class="limiter"></td>\n</tr>\n'
+            )
+    elif category == "races":
+        for index in range(races):
+            first, last = _driver(random_)
+            grandprix = _GRANDS_PRIX[index % len(_GRANDS_PRIX)]
+            rows.append(
+                '<tr>\n<td class="limiter"></td>\n'
+                f'<td class="dark bold"><a class="dark bold ArchiveLink" '
+                f'href="/en/results.html/{year}/races/{1000 + index}/{grandprix.lower().replace(" ", "-")}/race-result.html">\n'
+                f'{" " * 24}{grandprix}\n{" " * 20}</a></td>\n'
+                f'<td class="dark hide-for-mobile">{1 + index % 28:02d} {_MONTHS[index % 10]} {year}</td>\n'
+                f'<td class="dark bold"><span class="hide-for-tablet">{first}</span>\n'
+                f'<span class="hide-for-mobile">{last}</span></td>\n'
+                f'<td class="semi-bold uppercase">{random_.choice(_TEAMS)}</td>\n'
+                f'<td class="bold hide-for-mobile">{random_.randrange(40, 80)}</td>\n'
+                '<td class="limiter"></td>\n</tr>\n'
+            )
+    elif category == "teams":
+        for position in range(1, teams + 1):
+            team = _TEAMS[(position - 1) % len(_TEAMS)]
+            rows.append(
+                '<tr>\n<td class="limiter"></td>\n'
+                f'<td class="dark">{position}</td>\n'
+                f'<td><a class="dark bold uppercase ArchiveLink" '
+                f'href="/en/results.html/{year}/team/{team.lower().replace(" ", "_")}.html">{team}</a>\n</td>\n'
+                f'<td class="dark bold">{max(0, 600 - position * 55)}</td>\n'
+                '<td class="limiter"></td>\n</tr>\n'
+            )
+    else:
+        for index in range(races):
+            first, last = _driver(random_)
+            rows.append(
+                '<tr>\n<td class="limiter"></td>\n'
+                f'<td class="width30 dark">{_GRANDS_PRIX[index % len(_GRANDS_PRIX)]}</td>\n'
+                f'<td class="dark bold"><span class="hide-for-tablet">{first}</span>\n'
+                f'<span class="hide-for-mobile">{last}</span></td>\n'
+                f'<td class="width25 semi-bold uppercase">{random_.choice(_TEAMS)}</td>\n'
+                f'<td class="dark bold">1:{random_.randrange(10, 59)}.{random_.randrange(1000):03d}</td>\n'
+                '<td class="limiter"></td>\n</tr>\n'
+            )
+
+    chrome = _chrome(random_)
+    return (
+        f"<!DOCTYPE html>\n<html><head><title>{year} results</title></head><body>\n{chrome}"
+        '<table class="resultsarchive-table">\n<thead>\n<tr><th>Pos</th><th>Name</th></tr>\n</thead>\n'
+        f'<tbody>\n{"".join(rows)}</tbody>\n</table>\n<footer>{chrome}</footer>\n</body></html>\n'
+    )
+
+
+def _standings_page(series, category, year, random_):
+    drivers, races, teams = _SIZES[(series, year)]
+    headers = "".join(
+        f'<th><div class="country-name"><span>{_GRANDS_PRIX[index % len(_GRANDS_PRIX)]}</span></div>'
+        f'<div class="dates">{1 + index % 26}-{3 + index % 26} {_MONTHS[index % 10]}</div></th>'
+        for index in range(races)
+    )
+    count = teams if category == "teams" else drivers
+    rows = []
+    for position in range(1, count + 1):
+        if category == "teams":
+            name = _TEAMS[(position - 1) % len(_TEAMS)]
+        else:
+            name = " ".join(_driver(random_))
+        results = "".join(f"<td>{random_.randrange(0, 26)}</td>" for _ in range(races))
+        rows.append(
+            f'<tr><td><div class="pos">{position}</div></td>'
+            f'<td><span class="visible-desktop-up">{name}</span></td>{results}'
+            f'<td><div class="total-points">{max(0, 250 - position * 9)}</div></td></tr>\n'
+        )
+
+    chrome = _chrome(random_)
+    return (
+        f"<!DOCTYPE html>\n<html><head><title>{year} standings</title></head><body>\n{chrome}"
+        f'<table class="table table-bordered">\n<thead><tr><th>Pos</th><th>Name</th>{headers}</tr></thead>\n'
+        f'<tbody>\n{"".join(rows)}</tbody>\n</table>\n<footer>{chrome}</footer>\n</body></html>\n'
+    )
+
+
+def _fe_page(category, year, random_):
+    drivers, races, teams = _SIZES[("fe", year)]
+    if category == "drivers":
+        data = []
+        for position in range(1, drivers + 1):
+            first, last = _driver(random_)
+            data.append({
+                "driverId": f"{random_.getrandbits(64):016x}",
+                "driverTeamName": random_.choice(_TEAMS),
+                "driverPosition": position,
+                "driverFirstName": first,
+                "driverLastName": last,
+                "driverCountry": random_.choice(_NATIONS),
+                "driverPoints": max(0, 200 - position * 8),
+                "driverTLA": last[:3].upper(),
+            })
+    elif category == "teams":
+        data = [{
+            "teamId": f"{random_.getrandbits(64):016x}",
+            "teamName": _TEAMS[(position - 1) % len(_TEAMS)],
+            "teamPosition": position,
+            "teamPoints": max(0, 300 - position * 25),
+        } for position in range(1, teams + 1)]
+    else:
+        data = {"races": [{
+            "id": f"{random_.getrandbits(128):032x}",
+            "name": f"{_GRANDS_PRIX[index % len(_GRANDS_PRIX)]} E-Prix",
+            "date": f"{year}-{1 + index % 12:02d}-{1 + index % 28:02d}",
+            "sequence": index + 1,
+        } for index in range(races)]}
+    return json.dumps(data, indent=1, ensure_ascii=False)
+
+
+def _f1_race_result_page(year, random_):
+    drivers = _SIZES[("f1", year)][0]
+    rows = []
+    for position in range(1, drivers + 1):
+        first, last = _driver(random_)
+        classified = position <= drivers - 3
+        if position == 1:
+            result = f"1:{random_.randrange(25, 59)}:{random_.randrange(60):02d}.{random_.randrange(1000):03d}"
+        elif classified:
+            result = f"+{position * 3 + random_.randrange(3)}.{random_.randrange(1000):03d}s"
+        else:
+            result = "DNF"
+        rows.append(
+            '<tr>\n<td class="limiter"></td>\n'
+            f'<td class="dark">{position if classified else "NC"}</td>\n'
+            f'<td class="dark hide-for-mobile">{random_.randrange(1, 100)}</td>\n'
+            f'<td class="dark bold">\n<span class="hide-for-tablet">{first}</span>\n'
+            f'<span class="hide-for-mobile">{last}</span>\n'
+            f'<span class="uppercase hide-for-desktop">{last[:3].upper()}</span>\n</td>\n'
+            f'<td class="semi-bold uppercase hide-for-tablet">{random_.choice(_TEAMS)}</td>\n'
+            f'<td class="dark hide-for-mobile">{random_.randrange(50, 72) if classified else random_.randrange(1, 50)}</td>\n'
+            f'<td class="dark bold">{result}</td>\n'
+            f'<td class="bold">{max(0, 26 - position * 2) if classified else 0}</td>\n'
+            '<td class="limiter"></td>\n</tr>\n'
+        )
+
+    chrome = _chrome(random_)
+    return (
+        f"<!DOCTYPE html>\n<html><head><title>Race result</title></head><body>\n{chrome}"
+        '<table class="resultsarchive-table">\n<thead>\n<tr><th>Pos</th><th>No</th><th>Driver</th></tr>\n'
+        f'</thead>\n<tbody>\n{"".join(rows)}</tbody>\n</table>\n<footer>{chrome}</footer>\n</body></html>\n'
+    )
+
+
+def _fe_race_page(url, year, random_):
+    if url.endswith("/sessions"):
+        return json.dumps({"sessions": [
+            {"id": f"{random_.getrandbits(64):016x}", "sessionName": name}
+            for name in ("Free Practice 1", "Free Practice 2", "Qualifying", "Race")
+        ]}, indent=1)
+    drivers = _SIZES[("fe", year)][0]
+    results = []
+    for position in range(1, drivers + 1):
+        first, last = _driver(random_)
+        results.append({
+            "driverPosition": position,
+            "driverNumber": random_.randrange(1, 100),
+            "driverFirstName": first,
+            "driverLastName": last,
+            "driverTeamName": random_.choice(_TEAMS),
+            "laps": random_.randrange(30, 45),
+            "sessionTime": f"{random_.randrange(40, 50)}:{random_.randrange(60):02d}.{random_.randrange(1000):03d}",
+            "points": max(0, 25 - position * 2),
+        })
+    return json.dumps({"results": results}, indent=1, ensure_ascii=False)
+
+
+def generate_race_page(series, year, url):
+    """
+    Generate a page a scraper downloads for one race of an
+    ``extra_categories`` case, e.g. an F1 race result page.
+
+    Args:
+        series: The series name, "f1" or "fe".
+        year: The year.
+        url: The URL of the race page.
+
+    Returns:
+        The page body as a string.
+    """
+    random_ = random.Random(url)
+    if series == "f1":
+        return _f1_race_result_page(year, random_)
+    return _fe_race_page(url, year, random_)
+
+
+def race_pages(scraper, category, year, text, download):
+    """
+    Collect the per-race pages of an ``extra_categories`` case.
+
+    The races are listed from the season page and each race is followed
+    the way the scraper does, so the pages and their URLs match.
+
+    Args:
+        scraper: The scraper of the series.
+        category: The category, e.g. "race_results".
+        year: The year.
+        text: The body of the season page.
+        download: Function returning the body of a race page URL.
+
+    Returns:
+        A dictionary mapping each race page URL to its body.
+    """
+    pages = {}
+    for race in scraper._unique_races(category, text, year):
+        steps = scraper._race_steps(category, race, year)
+        done, value = _advance(steps, None)
+        while not done:
+            pages[value] = download(value)
+            done, value = _advance(steps, pages[value])
+    return pages
+
+
+def generate(series, category, year):
+    """
+    Generate the page a scraper downloads for a case.
+
+    Args:
+        series: The series name, e.g. "f1".
+        category: The category, e.g. "drivers".
+        year: The year.
+
+    Returns:
+        The page body as a string.
+    """
+    if category == "race_results":
+        category = "races"
+    random_ = random.Random(f"{series}-{category}-{year}")
+    if series == "f1":
+        return _f1_page(category, year, random_)
+    if series == "fe":
+        return _fe_page(category, year, random_)
+    return _standings_page(series, category, year, random_)
+
+
+def main():
+    """
+    Write the fixture of every benchmark case.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--record", action="store_true", help="download the live pages")
+    arguments = parser.parse_args()
+
+    transport = HTTPTransport(timeout=30) if arguments.record else None
+    for series, category, year in CASES:
+        scraper = SCRAPERS[series](transport=transport)
+        url = scraper._build_url(category, year)
+        if arguments.record:
+            pages = {url: transport.get(url).text}
+            download = lambda url: transport.get(url).text
+        else:
+            pages = {url: generate(series, category, year)}
+            download = lambda url, series=series, year=year: generate_race_page(series, year, url)
+        if category in scraper.extra_categories:
+            pages.update(race_pages(scraper, category, year, pages[url], download))
+        for page_url, body in pages.items():
+            path = os.path.join(FIXTURES, fixture_path(page_url))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(body)
+            print(f"{path} ({len(body.encode('utf-8'))} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Script running the offline benchmarks against the recorded fixtures.
+
+For every case it reports the page size, parse time per page, rows per
+second, peak memory of one parse and the end-to-end latency of the
+``get_*_data`` method through a local stand-in server.
+
+    python -m benchmarks.run [--parser lxml] [--repeat 20] [--json]
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+import tracemalloc
+
+from formulascraper import SCRAPERS, HTTPTransport
+from formulascraper.scrapers import _advance
+
+from .cases import CASES, fixture_path
+from .server import FIXTURES, FixtureServer
+
+
+class _Fixtures(dict):
+    # Fixture bodies keyed by URL, read on first use.
+    def __missing__(self, url):
+        with open(os.path.join(FIXTURES, fixture_path(url)), encoding="utf-8") as file:
+            text = self[url] = file.read()
+        return text
+
+
+def _parse(scraper, category, year, text, pages):
+    # Per-race categories parse the season page and every race page.
+    if category not in scraper.extra_categories:
+        return scraper._parse_page(category, text, year)
+    rows = []
+    for race in scraper._unique_races(category, text, year):
+        steps = scraper._race_steps(category, race, year)
+        done, value = _advance(steps, None)
+        while not done:
+            done, value = _advance(steps, pages[value])
+        rows.extend(value)
+    return rows
+
+
+def _timed(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return result, timings
+
+
+def run_case(scraper, series, category, year, repeat):
+    """
+    Benchmark one case.
+
+    Args:
+        scraper: A scraper whose transport points at the fixture server.
+        series: The series name, e.g. "f1".
+        category: The category, e.g. "drivers".
+        year: The year.
+        repeat: Number of measured repetitions.
+
+    Returns:
+        A dictionary with the measurements.
+    """
+    pages = _Fixtures()
+    text = pages[scraper._build_url(category, year)]
+    parse = lambda: _parse(scraper, category, year, text, pages)
+    parse()
+
+    rows, parse_timings = _timed(parse, repeat)
+
+    tracemalloc.start()
+    parse()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    _, latencies = _timed(lambda: scraper.get_data(category, year), repeat)
+
+    parse_time = statistics.median(parse_timings)
+    return {
+        "series": series,
+        "category": category,
+        "year": year,
+        "bytes": sum(len(page.encode("utf-8")) for page in pages.values()),
+        "rows": len(rows),
+        "parse_ms": parse_time * 1000,
+        "rows_per_sec": len(rows) / parse_time if parse_time else 0.0,
+        "peak_kib": peak / 1024,
+        "latency_ms": statistics.median(latencies) * 1000,
+        "latency_p95_ms": sorted(latencies)[int(0.95 * (len(latencies) - 1))] * 1000,
+    }
+
+
+def main():
+    """
+    Run every benchmark case and print the report.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--parser", default="html.parser", help="HTML parser backend")
+    parser.add_argument("--repeat", type=int, default=10, help="repetitions per measurement")
+    parser.add_argument("--series", action="append", help="only run these series")
+    parser.add_argument("--json", action="store_true", help="print JSON lines instead of a table")
+    arguments = parser.parse_args()
+
+    with FixtureServer() as server:
+        transport = HTTPTransport(rewrite=server.rewrite)
+        scrapers = {}
+        results = []
+        for series, category, year in CASES:
+            if arguments.series and series not in arguments.series:
+                continue
+            if series not in scrapers:
+                scrapers[series] = SCRAPERS[series](transport=transport, parser=arguments.parser)
+            results.append(run_case(scrapers[series], series, category, year, arguments.repeat))
+        transport.close()
+
+    if arguments.json:
+        for result in results:
+            print(json.dumps(result))
+        return
+
+    print(f"parser: {arguments.parser}, repeat: {arguments.repeat}")
+    print(f"{'case':<26}{'bytes':>9}{'rows':>6}{'parse ms':>10}{'rows/s':>10}"
+          f"{'peak KiB':>10}{'e2e ms':>9}{'p95 ms':>9}")
+    for result in results:
+        case = f"{result['series']} {result['category']} {result['year']}"
+        print(f"{case:<26}{result['bytes']:>9}{result['rows']:>6}{result['parse_ms']:>10.2f}"
+              f"{result['rows_per_sec']:>10.0f}{result['peak_kib']:>10.0f}"
+              f"{result['latency_ms']:>9.2f}{result['latency_p95_ms']:>9.2f}")
+    total_rows = sum(result["rows"] for result in results)
+    total_parse = sum(result["parse_ms"] for result in results) / 1000
+    print(f"total: {total_rows} rows, {total_parse * 1000:.1f} ms parse, "
+          f"{total_rows / total_parse if total_parse else 0:.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Module containing the local HTTP stand-in server serving the fixtures.
+"""
+import hashlib
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .cases import fixture_path
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        relative = os.path.normpath(fixture_path(f"https://{self.path.lstrip('/')}"))
+        path = os.path.join(self.server.root, relative)
+        if relative.startswith("..") or not os.path.isfile(path):
+            self.send_error(404)
+            return
+
+        with open(path, "rb") as file:
+            body = file.read()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        content_type = "application/json" if body[:1] in (b"[", b"{") else "text/html"
+        self.send_response(200)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class FixtureServer:
+    """
+    Threaded HTTP server answering scraper URLs with the recorded fixtures.
+
+    ``https://<host>/<path>?<query>`` is served from
+    ``<root>/<host>/<path>__<query>``, see ``cases.fixture_path``. Pass ``rewrite`` to an
+    ``HTTPTransport`` to send every scraper request to the server.
+    """
+    def __init__(self, root=FIXTURES, host="127.0.0.1", port=0):
+        """
+        Bind the server.
+
+        Args:
+            root: Directory holding the fixtures.
+            host: Interface to listen on.
+            port: Port to listen on, 0 picks a free port.
+        """
+        self._server = ThreadingHTTPServer((host, port), _FixtureHandler)
+        self._server.daemon_threads = True
+        self._server.root = root
+        self._thread = None
+
+    @property
+    def url(self):
+        """
+        Base URL of the running server.
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def rewrite(self):
+        """
+        URL prefix rewrite sending every https request to the server.
+        """
+        return {"https://": f"{self.url}/"}
+
+    def start(self):
+        """
+        Serve requests in a background thread.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Shut the server down.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the benchmark fixtures over HTTP.")
+    parser.add_argument("--port", type=int, default=8000)
+    arguments = parser.parse_args()
+    server = FixtureServer(port=arguments.port)
+    print(f"Serving {FIXTURES} on {server.url}, rewrite: {server.rewrite}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
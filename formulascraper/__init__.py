@@ -0,0 +1,58 @@
+"""
+Package containing classes for scraping data from Formula websites.
+
+The public names are imported from their modules on first access, so
+``import formulascraper`` does not load requests, BeautifulSoup or asyncio
+until they are needed.
+"""
+import importlib
+
+_EXPORTS = {
+    "Formula1Scraper": "scrapers",
+    "Formula1AcademyScraper": "scrapers",
+    "Formula2Scraper": "scrapers",
+    "Formula3Scraper": "scrapers",
+    "FormulaEScraper": "scrapers",
+    "SCRAPERS": "scrapers",
+    "MultiSeriesScraper": "multi",
+    "MultiSeriesResult": "multi",
+    "AsyncHTTPTransport": "aio",
+    "aclose_default_async_transport": "aio",
+    "gather_data": "aio",
+    "CrawlResult": "bulk",
+    "crawl": "bulk",
+    "ResponseCache": "cache",
+    "get_default_cache": "cache",
+    "set_default_cache": "cache",
+    "ScrapeEvent": "metrics",
+    "StatsCollector": "metrics",
+    "Memo": "memo",
+    "SingleFlight": "memo",
+    "RateLimiter": "ratelimit",
+    "RetryPolicy": "ratelimit",
+    "DriverStanding": "records",
+    "RaceResult": "records",
+    "TeamStanding": "records",
+    "FastestLap": "records",
+    "RaceClassification": "records",
+    "to_record": "records",
+    "HTTPStatusError": "transport",
+    "HTTPTransport": "transport",
+    "get_default_transport": "transport",
+    "set_default_transport": "transport",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,8 @@
+"""
+Entry point of ``python -m formulascraper``.
+"""
+import sys
+
+from .cli import main
+
+sys.exit(main())
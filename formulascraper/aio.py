@@ -0,0 +1,226 @@
+"""
+Module containing the asyncio HTTP transport and gather helper.
+
+The transport is built on aiohttp, which is an optional dependency:
+
+    pip install formulascraper[async]
+"""
+import asyncio
+import time
+import weakref
+
+from .ratelimit import RetryPolicy, parse_retry_after
+from .transport import HTTPStatusError, Response
+
+
+class AsyncHTTPTransport:
+    """
+    Connection-pooled asyncio HTTP transport built on an aiohttp session.
+
+    The session is created lazily inside the running event loop, so the
+    transport can be constructed anywhere. Any object with a compatible
+    coroutine ``get(url, **kwargs)`` method can be injected into the scrapers
+    instead. Failed requests are retried and paced like with ``HTTPTransport``.
+    """
+    def __init__(self, timeout=5, limit=100, limit_per_host=10, keep_alive=True,
+                 headers=None, rewrite=None, retry=None, limiter=None):
+        """
+        Initialize the transport.
+
+        Args:
+            timeout: Total request timeout in seconds.
+            limit: Maximum number of simultaneous connections.
+            limit_per_host: Maximum number of simultaneous connections per host.
+            keep_alive: Whether to keep connections open between requests.
+            headers: Optional headers sent with every request.
+            rewrite: Optional mapping of URL prefix to replacement prefix, see
+                ``HTTPTransport``.
+            retry: ``RetryPolicy`` for failed requests, defaults to 3 retries.
+            limiter: Optional ``RateLimiter`` shared by the requests.
+        """
+        self.timeout = timeout
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.limiter = limiter
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keep_alive = keep_alive
+        self.headers = dict(headers or {})
+        self.rewrite = dict(rewrite or {})
+        self._session = None
+
+    def resolve(self, url):
+        """
+        Apply the configured prefix rewrites to a URL.
+
+        Args:
+            url: The URL requested by a scraper.
+
+        Returns:
+            The URL that is actually fetched.
+        """
+        for prefix, replacement in self.rewrite.items():
+            if url.startswith(prefix):
+                return replacement + url[len(prefix):]
+        return url
+
+    async def get(self, url, **kwargs):
+        """
+        Send a GET request through the pooled session.
+
+        Args:
+            url: The URL to fetch.
+            **kwargs: Extra keyword arguments passed to ``aiohttp.ClientSession.get``.
+
+        Returns:
+            A ``Response`` holding the downloaded body, with the seconds
+            taken by the last attempt in ``latency``.
+
+        Raises:
+            HTTPStatusError: The retries were exhausted on a retried status.
+        """
+        session = self._ensure_session()
+        import aiohttp
+
+        target = self.resolve(url)
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                await self.limiter.aacquire(target)
+            start = time.monotonic()
+            latency = retry_after = None
+            throttled = False
+            try:
+                try:
+                    async with session.get(target, **kwargs) as response:
+                        content = await response.read()
+                        result = Response(url, response.status, response.headers, content,
+                                          response.charset)
+                except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+                    throttled = True
+                    delay = self.retry.delay(attempt)
+                    if delay is None:
+                        raise
+                else:
+                    latency = result.latency = time.monotonic() - start
+                    throttled = result.status_code in self.retry.statuses
+                    retry_after = parse_retry_after(result.headers.get("Retry-After")) if throttled else None
+                    delay = self.retry.delay(attempt, retry_after) if throttled else None
+                    if delay is None:
+                        if throttled:
+                            raise HTTPStatusError(result, attempt)
+                        return result
+            finally:
+                if self.limiter is not None:
+                    self.limiter.release(target, latency, throttled, retry_after)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self):
+        """
+        Close the session and all pooled connections.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def _ensure_session(self):
+        if self._session is None:
+            try:
+                import aiohttp
+            except ImportError as error:
+                raise ImportError(
+                    "AsyncHTTPTransport requires aiohttp: pip install formulascraper[async]"
+                ) from error
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host,
+                                             force_close=not self.keep_alive)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=self.headers,
+            )
+        return self._session
+
+
+# Maps each event loop to its default transport and the async generator
+# closing it when the loop shuts down.
+_default_transports = weakref.WeakKeyDictionary()
+
+
+async def _close_at_shutdown(transport):
+    # asyncio.run() closes the async generators still suspended in its loop
+    # before closing the loop, which runs this finally block.
+    try:
+        yield
+    finally:
+        await transport.aclose()
+
+
+async def _start(generator):
+    await generator.__anext__()
+
+
+def get_default_async_transport():
+    """
+    Return the async transport shared by scrapers in the running event loop.
+
+    The transport is closed when ``asyncio.run()`` shuts the loop down, or
+    earlier with ``aclose_default_async_transport``.
+
+    Returns:
+        The ``AsyncHTTPTransport`` of the running loop, created on first use.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _default_transports.get(loop)
+    if entry is None:
+        transport = AsyncHTTPTransport()
+        closer = _close_at_shutdown(transport)
+        entry = _default_transports[loop] = (transport, closer)
+        loop.create_task(_start(closer))
+    return entry[0]
+
+
+async def aclose_default_async_transport():
+    """
+    Close the shared async transport of the running event loop, if any.
+    """
+    entry = _default_transports.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[0].aclose()
+
+
+async def gather_data(items, concurrency=10, return_exceptions=False, transport=None):
+    """
+    Fetch many (series, category, year) combinations concurrently.
+
+    Args:
+        items: Iterable of (series, category, year) tuples, where series is a
+            key of ``SCRAPERS`` such as "f1" or "fe".
+        concurrency: Maximum number of pages fetched at the same time.
+        return_exceptions: If True, failed items yield their exception instead
+            of cancelling the whole gather.
+        transport: Optional async transport shared by all scrapers.
+
+    Returns:
+        A list with the data of each item, in the order of ``items``.
+    """
+    from .scrapers import SCRAPERS
+
+    semaphore = asyncio.Semaphore(concurrency)
+    scrapers = {}
+
+    async def fetch(series, category, year):
+        if series not in scrapers:
+            if series not in SCRAPERS:
+                raise ValueError(f"Invalid series: {series}")
+            scrapers[series] = SCRAPERS[series](async_transport=transport)
+        async with semaphore:
+            return await scrapers[series].aget_data(category, year)
+
+    tasks = [fetch(series, category, year) for series, category, year in items]
+    return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
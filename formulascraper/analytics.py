@@ -0,0 +1,441 @@
+"""
+Module containing vectorized analytics over scraped seasons.
+
+A ``Table`` holds one category of many seasons and series as NumPy arrays:
+lap times in seconds and points as floats (NaN when missing), positions,
+laps and years as ints (``MISSING`` when missing), dates as
+``datetime64[D]`` and names as int codes into a sorted array of labels.
+The aggregates group rows with ``bincount`` and sorting instead of Python
+loops, so whole-history queries take milliseconds.
+
+The analytics need NumPy:
+
+    pip install formulascraper[analytics]
+"""
+import datetime
+
+from .export import _require, collect_columns
+from .packed import _NULL_INT, _NULL_STRING, _column_type
+from .records import FIELD_TYPES, RECORD_TYPES, to_record
+
+MISSING = -1
+
+
+class Table:
+    """
+    One category of several seasons and series as NumPy columns.
+
+    Text columns (series, names, teams, grands prix, ...) hold int codes;
+    ``labels[name]`` is the sorted array of their values and ``MISSING``
+    marks missing values. ``decode(name)`` turns them back into strings.
+    """
+    def __init__(self, category, columns, labels):
+        """
+        Initialize the table from already converted arrays.
+
+        Args:
+            category: The category of the rows, e.g. "drivers".
+            columns: Dictionary mapping column names to equally long arrays.
+            labels: Dictionary mapping text column names to their labels.
+        """
+        self.category = category
+        self.columns = columns
+        self.labels = labels
+
+    def __len__(self):
+        return len(self.columns["year"])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __repr__(self):
+        return f"Table(category={self.category!r}, rows={len(self)}, columns={list(self.columns)})"
+
+    def code(self, name, value):
+        """
+        Return the code of a value in a text column, ``MISSING`` if absent.
+        """
+        np = _require("numpy", "analytics")
+        labels = self.labels[name]
+        index = int(np.searchsorted(labels, value))
+        return index if index < len(labels) and labels[index] == value else MISSING
+
+    def decode(self, name):
+        """
+        Return a text column as an object array of strings, None for missing.
+        """
+        np = _require("numpy", "analytics")
+        codes = self.columns[name]
+        values = np.empty(len(codes), dtype=object)
+        present = codes != MISSING
+        values[present] = self.labels[name][codes[present]]
+        return values
+
+    def where(self, mask):
+        """
+        Return the rows selected by a boolean mask or an index array.
+        """
+        return Table(self.category, {name: values[mask] for name, values in self.columns.items()},
+                     self.labels)
+
+    def select(self, series=None, years=None):
+        """
+        Return the rows of some series and years.
+
+        Args:
+            series: Optional series name or iterable of names.
+            years: Optional iterable of years.
+        """
+        np = _require("numpy", "analytics")
+        mask = np.ones(len(self), dtype=bool)
+        if series is not None:
+            names = [series] if isinstance(series, str) else list(series)
+            mask &= np.isin(self.columns["series"], [self.code("series", name) for name in names])
+        if years is not None:
+            mask &= np.isin(self.columns["year"], list(years))
+        return self.where(mask)
+
+
+def from_columns(category, columns):
+    """
+    Build a table from lists of values.
+
+    Args:
+        category: The category of the rows, e.g. "fastest_laps".
+        columns: Dictionary of column lists with record values (e.g. points
+            as floats, lap times in seconds), as returned by
+            ``export.collect_columns``.
+
+    Returns:
+        A ``Table``.
+    """
+    np = _require("numpy", "analytics")
+    arrays = {}
+    labels = {}
+    for name, values in columns.items():
+        if FIELD_TYPES.get(name) == "int":
+            arrays[name] = np.array([MISSING if value is None else value for value in values],
+                                    dtype=np.int32)
+        elif FIELD_TYPES.get(name) == "float":
+            arrays[name] = np.array([np.nan if value is None else value for value in values],
+                                    dtype=np.float64)
+        elif FIELD_TYPES.get(name) == "date":
+            arrays[name] = np.array([None if value is None else value.isoformat() for value in values],
+                                    dtype="datetime64[D]")
+        else:
+            labels[name] = np.array(sorted({value for value in values if value is not None}),
+                                    dtype=object)
+            codes = {value: index for index, value in enumerate(labels[name])}
+            arrays[name] = np.array([MISSING if value is None else codes[value] for value in values],
+                                    dtype=np.int32)
+    return Table(category, arrays, labels)
+
+
+def from_history(series, category, history):
+    """
+    Build a table from the result of ``get_history``.
+
+    Args:
+        series: The series name of the crawled scraper.
+        category: The category to take from the crawl.
+        history: A ``CrawlResult`` mapping (year, category) to rows.
+
+    Returns:
+        A ``Table``.
+    """
+    fields = [name for name in RECORD_TYPES[category].__slots__ if name != "series"]
+    columns = {name: [] for name in ["series", "year"] + fields}
+    for (year, row_category), rows in history.items():
+        if row_category != category:
+            continue
+        for row in rows:
+            record = to_record(series, category, row)
+            columns["series"].append(series)
+            columns["year"].append(year)
+            for field in fields:
+                columns[field].append(getattr(record, field))
+    return from_columns(category, columns)
+
+
+def from_packed(archive, category, series=None, years=None):
+    """
+    Build a table from a ``PackedArchive`` without scraping.
+
+    Numeric columns are read straight from the memory-mapped file and text
+    columns keep the archive's string ids until they are re-coded.
+
+    Args:
+        archive: An open ``packed.PackedArchive``.
+        category: The category to load, e.g. "drivers".
+        series: Optional series name or iterable of names.
+        years: Optional iterable of years.
+
+    Returns:
+        A ``Table``.
+    """
+    np = _require("numpy", "analytics")
+    names = None if series is None else {series} if isinstance(series, str) else set(series)
+    wanted = None if years is None else set(years)
+    seasons = [key for key in archive.seasons()
+               if key[1] == category and (names is None or key[0] in names)
+               and (wanted is None or key[2] in wanted)]
+    seasons.sort(key=lambda key: (key[0], key[2]))
+
+    fields = [name for name in RECORD_TYPES[category].__slots__ if name != "series"]
+    parts = {name: [] for name in fields}
+    series_parts = []
+    years_parts = []
+    for key in seasons:
+        rows = 0
+        for name in fields:
+            kind, buffer = archive.column_buffer(*key, name)
+            if kind == "d":
+                values = np.frombuffer(buffer, dtype="<f8").copy()
+            elif kind == "s":
+                values = np.frombuffer(buffer, dtype="<u4").astype(np.int64)
+            else:
+                values = np.frombuffer(buffer, dtype="<i4").astype(np.int32)
+            buffer.release()
+            parts[name].append(values)
+            rows = len(values)
+        series_parts.append(np.full(rows, key[0], dtype=object))
+        years_parts.append(np.full(rows, key[2], dtype=np.int32))
+
+    def concatenate(arrays, dtype):
+        return np.concatenate(arrays) if arrays else np.empty(0, dtype=dtype)
+
+    columns = {"year": concatenate(years_parts, np.int32)}
+    labels = {}
+    series_values = concatenate(series_parts, object)
+    labels["series"], codes = np.unique(series_values, return_inverse=True)
+    columns["series"] = codes.astype(np.int32)
+    epoch = datetime.date(1970, 1, 1).toordinal()
+    for name in fields:
+        kind = _column_type(name)
+        if kind == "d":
+            columns[name] = concatenate(parts[name], np.float64)
+        elif kind == "t":
+            days = concatenate(parts[name], np.int32)
+            dates = (days.astype("int64") - epoch).astype("datetime64[D]")
+            dates[days == _NULL_INT] = np.datetime64("NaT")
+            columns[name] = dates
+        elif kind == "i":
+            values = concatenate(parts[name], np.int32)
+            values[values == _NULL_INT] = MISSING
+            columns[name] = values
+        else:
+            ids = concatenate(parts[name], np.int64)
+            present = ids != _NULL_STRING
+            unique, inverse = np.unique(ids[present], return_inverse=True)
+            strings = np.array([archive.string(int(identifier)) for identifier in unique], dtype=object)
+            order = np.argsort(strings, kind="stable")
+            rank = np.empty(len(order), dtype=np.int32)
+            rank[order] = np.arange(len(order), dtype=np.int32)
+            codes = np.full(len(ids), MISSING, dtype=np.int32)
+            codes[present] = rank[inverse]
+            labels[name] = strings[order]
+            columns[name] = codes
+    return Table(category, columns, labels)
+
+
+def load(category, years, series=None, **kwargs):
+    """
+    Scrape a category over a range of years and series into a table.
+
+    Args:
+        category: The category to load, e.g. "fastest_laps".
+        years: Iterable of years, e.g. ``range(1950, 2024)``.
+        series: Series name(s), see ``export.collect_columns``.
+        **kwargs: Extra arguments passed to ``export.collect_columns``.
+
+    Returns:
+        A ``Table``.
+    """
+    return from_columns(category, collect_columns(category, years, series, **kwargs))
+
+
+def lap_time_matrix(table):
+    """
+    Arrange the fastest lap of every grand prix and year in a matrix.
+
+    Args:
+        table: A "fastest_laps" table.
+
+    Returns:
+        A (grandprix, years, matrix) tuple: the grand prix names, the sorted
+        years and a float matrix of lap times in seconds with one row per
+        grand prix and one column per year, NaN where the grand prix was not
+        held or has no time.
+    """
+    np = _require("numpy", "analytics")
+    grandprix = table["grandprix"]
+    valid = (grandprix != MISSING) & ~np.isnan(table["lap_time"])
+    years, year_index = np.unique(table["year"][valid], return_inverse=True)
+    matrix = np.full((len(table.labels["grandprix"]), len(years)), np.inf)
+    np.minimum.at(matrix, (grandprix[valid], year_index), table["lap_time"][valid])
+    matrix[np.isinf(matrix)] = np.nan
+    held = ~np.isnan(matrix).all(axis=1)
+    return table.labels["grandprix"][held], years, matrix[held]
+
+
+def lap_time_trend(table):
+    """
+    Summarize how the fastest lap of every grand prix evolved over the years.
+
+    Args:
+        table: A "fastest_laps" table.
+
+    Returns:
+        A dictionary of equally long arrays, one entry per grand prix:
+        "grandprix", "seasons" (years with a time), "best" and "best_year",
+        "latest" and "latest_year", and "slope", the least-squares change of
+        the lap time in seconds per year (NaN with fewer than two seasons).
+    """
+    np = _require("numpy", "analytics")
+    names, years, matrix = lap_time_matrix(table)
+    if matrix.size == 0:
+        empty = np.empty(0)
+        return {"grandprix": names, "seasons": np.zeros(0, dtype=np.int64), "best": empty,
+                "best_year": years[:0], "latest": empty, "latest_year": years[:0], "slope": empty}
+    present = ~np.isnan(matrix)
+    seasons = present.sum(axis=1)
+    x = np.where(present, years.astype(np.float64), 0.0)
+    y = np.where(present, matrix, 0.0)
+    sum_x = x.sum(axis=1)
+    sum_y = y.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = ((seasons * (x * y).sum(axis=1) - sum_x * sum_y)
+                 / (seasons * (x * x).sum(axis=1) - sum_x * sum_x))
+    slope[seasons < 2] = np.nan
+
+    best_index = np.argmin(np.where(present, matrix, np.inf), axis=1)
+    latest_index = len(years) - 1 - np.argmax(present[:, ::-1], axis=1)
+    rows = np.arange(len(names))
+    return {
+        "grandprix": names,
+        "seasons": seasons,
+        "best": matrix[rows, best_index],
+        "best_year": years[best_index],
+        "latest": matrix[rows, latest_index],
+        "latest_year": years[latest_index],
+        "slope": slope,
+    }
+
+
+def points_distribution(table):
+    """
+    Describe the distribution of points in every season.
+
+    Args:
+        table: A "drivers" or "teams" table.
+
+    Returns:
+        A dictionary of equally long arrays, one entry per series and year:
+        "series", "year", "entries" (rows with points), "total", "mean",
+        "std", "min", "median", "p90", "max" and "leader_share", the share of
+        the season's points scored by the leader.
+    """
+    np = _require("numpy", "analytics")
+    points = table["points"]
+    valid = ~np.isnan(points)
+    keys, group = np.unique(np.stack([table["series"][valid], table["year"][valid]], axis=1),
+                            axis=0, return_inverse=True)
+    group = group.reshape(-1)
+    values = points[valid]
+    order = np.lexsort((values, group))
+    ordered = values[order]
+    counts = np.bincount(group, minlength=len(keys))
+    if counts.size == 0:
+        empty = np.empty(0)
+        return {"series": table.labels["series"][keys[:, 0]], "year": keys[:, 1], "entries": counts,
+                **{name: empty for name in ("total", "mean", "std", "min", "median", "p90", "max",
+                                            "leader_share")}}
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+    total = np.bincount(group, weights=values, minlength=len(keys))
+    squares = np.bincount(group, weights=values * values, minlength=len(keys))
+    mean = total / counts
+    maximum = ordered[starts + counts - 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        leader_share = np.where(total > 0, maximum / total, np.nan)
+
+    def quantile(q):
+        position = starts + (counts - 1) * q
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, starts + counts - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+    return {
+        "series": table.labels["series"][keys[:, 0]],
+        "year": keys[:, 1],
+        "entries": counts,
+        "total": total,
+        "mean": mean,
+        "std": np.sqrt(np.maximum(squares / counts - mean * mean, 0.0)),
+        "min": ordered[starts],
+        "median": quantile(0.5),
+        "p90": quantile(0.9),
+        "max": maximum,
+        "leader_share": leader_share,
+    }
+
+
+def teammate_comparison(table):
+    """
+    Compare every driver with their teammates across all seasons.
+
+    Drivers are compared within the same series, year and team (and grand
+    prix for race classifications). A driver is "ahead" when no teammate
+    finished in a better position.
+
+    Args:
+        table: A "drivers" or "race_results" table.
+
+    Returns:
+        A dictionary of equally long arrays, one entry per driver with at
+        least one teammate: "driver", "comparisons" (seasons or races shared
+        with a teammate), "ahead", "ahead_ratio", "points", "teammate_points"
+        and "share", the driver's share of the points of their teams.
+    """
+    np = _require("numpy", "analytics")
+    driver_column = "name" if "name" in table else "driver"
+    drivers = table[driver_column]
+    teams = table["team"]
+    valid = (drivers != MISSING) & (teams != MISSING)
+    key_columns = [table["series"], table["year"], teams]
+    if table.category == "race_results":
+        key_columns.insert(2, table["grandprix"])
+    keys = np.stack([column[valid] for column in key_columns], axis=1)
+    _, group = np.unique(keys, axis=0, return_inverse=True)
+    group = group.reshape(-1)
+    drivers = drivers[valid]
+    points = np.nan_to_num(table["points"][valid])
+    positions = table["position"][valid]
+
+    sizes = np.bincount(group)
+    shared = sizes[group] >= 2
+    team_points = np.bincount(group, weights=points)[group]
+    ranked = np.where(positions == MISSING, np.iinfo(np.int32).max, positions)
+    best = np.full(len(sizes), np.iinfo(np.int32).max)
+    np.minimum.at(best, group, ranked)
+    ahead = (ranked == best[group]) & (positions != MISSING)
+
+    codes, driver_index = np.unique(drivers[shared], return_inverse=True)
+    comparisons = np.bincount(driver_index, minlength=len(codes))
+    ahead_count = np.bincount(driver_index, weights=ahead[shared], minlength=len(codes)).astype(np.int64)
+    own = np.bincount(driver_index, weights=points[shared], minlength=len(codes))
+    team_total = np.bincount(driver_index, weights=team_points[shared], minlength=len(codes))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = np.where(team_total > 0, own / team_total, np.nan)
+    return {
+        "driver": table.labels[driver_column][codes],
+        "comparisons": comparisons,
+        "ahead": ahead_count,
+        "ahead_ratio": ahead_count / comparisons,
+        "points": own,
+        "teammate_points": team_total - own,
+        "share": share,
+    }
+
@@ -0,0 +1,285 @@
+"""
+Module containing the bulk multi-season crawler.
+"""
+import contextlib
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+from .metrics import _CallStats, current_call, end_call, start_call
+
+
+class CrawlResult(dict):
+    """
+    Results of a bulk crawl, keyed by (year, category).
+
+    Items that failed are left out of the mapping and reported in ``errors``
+    with the exception they raised.
+    """
+    def __init__(self):
+        super().__init__()
+        self.errors = {}
+
+    @property
+    def ok(self):
+        """
+        Whether every requested item was scraped successfully.
+        """
+        return not self.errors
+
+
+class _HostLimiter:
+    """
+    Per-host semaphores capping the number of requests in flight.
+    """
+    def __init__(self, per_host):
+        self._lock = threading.Lock()
+        self._semaphores = defaultdict(lambda: threading.BoundedSemaphore(per_host))
+
+    def __call__(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            return self._semaphores[host]
+
+
+_worker_scrapers = {}
+
+
+def _discard(event):
+    pass
+
+
+def parse_page(series, parser, category, text, year):
+    """
+    Parse a downloaded page in a worker process.
+
+    The scraper of each series and parser is created once per process and
+    reused for every page the worker receives.
+
+    Args:
+        series: The series name, e.g. "f1".
+        parser: The HTML parser backend.
+        category: The category of the page, e.g. "drivers".
+        text: The page body.
+        year: The year of the page.
+
+    Returns:
+        The list of dictionaries returned by the scraper for the page.
+    """
+    scraper = _worker_scrapers.get((series, parser))
+    if scraper is None:
+        from .scrapers import SCRAPERS
+        # The collector only lets _timed_parse measure the observed calls.
+        scraper = _worker_scrapers[(series, parser)] = SCRAPERS[series](parser=parser, collector=_discard)
+    return scraper._parse_page(category, text, year)
+
+
+def _parse_observed(series, parser, category, text, year):
+    stats, token = start_call(category, year)
+    start = time.perf_counter()
+    try:
+        rows = parse_page(series, parser, category, text, year)
+    finally:
+        end_call(token)
+    return rows, stats.parse, time.perf_counter() - start
+
+
+def _process_pool(processes):
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Forking while the download threads hold locks could leave them held
+    # in the workers, so the workers never start from a fork.
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context(method))
+
+
+def _emit_item(scraper, category, year, network, parse, duration, rows, error):
+    stats = _CallStats(category, year)
+    stats.network = network
+    stats.parse = parse
+    scraper._emit_call(stats, duration, rows, error)
+
+
+def crawl(scraper, years, categories=None, max_workers=8, per_host=4, processes=None):
+    """
+    Scrape many (year, category) combinations of one scraper in parallel.
+
+    Categories served by the same page (e.g. F2 drivers and races) download
+    that page only once. With ``processes``, threads only download the pages
+    and the CPU-bound parsing runs in a process pool, so it is not limited
+    to one core by the GIL.
+
+    Args:
+        scraper: The scraper instance to crawl with.
+        years: Iterable of years, e.g. ``range(1950, 2024)``.
+        categories: Iterable of category names, defaults to all categories
+            supported by the scraper.
+        max_workers: Number of threads fetching and parsing pages.
+        per_host: Maximum number of requests in flight per host.
+        processes: Number of worker processes parsing the pages, or an
+            existing ``concurrent.futures.Executor`` to reuse. Defaults to
+            parsing in the download threads. New workers are started with
+            "forkserver" or "spawn", so the calling script needs an
+            ``if __name__ == "__main__":`` guard.
+
+    Returns:
+        A ``CrawlResult`` mapping (year, category) to the scraped data, in the
+        order of ``years`` and ``categories``.
+    """
+    categories = tuple(scraper.categories if categories is None else categories)
+    items = [(year, category) for year in years for category in categories]
+    limiter = _HostLimiter(per_host)
+    if processes is not None:
+        return _crawl_processes(scraper, items, max_workers, limiter, processes)
+
+    pages = {}
+    pages_lock = threading.Lock()
+
+    def fetch_page(url, year):
+        with limiter(url):
+            return scraper._fetch(url, year)
+
+    def fetch(year, category):
+        if scraper.collector is None:
+            return scrape(category, year)
+        return scraper._observed(scrape, category, year)
+
+    def scrape(category, year):
+        url = scraper._build_url(category, year)
+        with pages_lock:
+            page = pages.get(url)
+            if page is None:
+                page = pages[url] = Future()
+                owner = True
+            else:
+                owner = False
+        if owner:
+            try:
+                page.set_result(fetch_page(url, year).text)
+            except Exception as error:  # pylint: disable=broad-except
+                page.set_exception(error)
+        stats = current_call()
+        if stats is not None and not owner:
+            start = time.perf_counter()
+            page.result()
+            stats.network += time.perf_counter() - start
+        if category in scraper.extra_categories:
+            return list(scraper._iter_races(category, page.result(), year, fetch_page))
+        return scraper._parse_page(category, page.result(), year)
+
+    result = CrawlResult()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [(item, executor.submit(fetch, *item)) for item in items]
+        for item, future in futures:
+            try:
+                result[item] = future.result()
+            except Exception as error:  # pylint: disable=broad-except
+                result.errors[item] = error
+
+    return result
+
+
+def _crawl_processes(scraper, items, max_workers, limiter, processes):
+    observed = scraper.collector is not None
+    outcomes = {}
+    urls = defaultdict(list)
+    for year, category in items:
+        try:
+            url = scraper._build_url(category, year)
+        except Exception as error:  # pylint: disable=broad-except
+            outcomes[(year, category)] = error
+            if observed:
+                _emit_item(scraper, category, year, 0.0, 0.0, 0.0, None, error)
+        else:
+            urls[url].append((year, category))
+
+    # Seconds spent downloading each page, shared by the items it serves.
+    networks = {}
+    item_networks = {}
+
+    def fetch_page(url, year):
+        with limiter(url):
+            return scraper._fetch(url, year)
+
+    def download(url, year, category):
+        # The requests are reported under the first item served by the page.
+        stats, token = start_call(category, year)
+        try:
+            return fetch_page(url, year).text
+        finally:
+            end_call(token)
+            networks[url] = stats.network
+
+    def scrape_races(category, text, year, network):
+        if not observed:
+            return list(scraper._iter_races(category, text, year, fetch_page))
+        stats, token = start_call(category, year)
+        stats.network = network
+        start = time.perf_counter()
+        rows = error = None
+        try:
+            rows = list(scraper._iter_races(category, text, year, fetch_page))
+            return rows
+        except Exception as exception:
+            error = exception
+            raise
+        finally:
+            end_call(token)
+            scraper._emit_call(stats, network + time.perf_counter() - start, rows, error)
+
+    if isinstance(processes, Executor):
+        pool_context = contextlib.nullcontext(processes)
+    else:
+        pool_context = _process_pool(processes)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, pool_context as pool:
+        downloads = {
+            executor.submit(download, url, url_items[0][0], url_items[0][1]): (url, url_items)
+            for url, url_items in urls.items()
+        }
+        for future in as_completed(downloads):
+            url, url_items = downloads[future]
+            try:
+                text = future.result()
+            except Exception as error:  # pylint: disable=broad-except
+                network = networks[url]
+                for year, category in url_items:
+                    outcomes[(year, category)] = error
+                    if observed:
+                        _emit_item(scraper, category, year, network, 0.0, network, None, error)
+                continue
+            for year, category in url_items:
+                item_networks[(year, category)] = networks[url]
+                if category in scraper.extra_categories:
+                    outcomes[(year, category)] = executor.submit(scrape_races, category, text, year,
+                                                                 networks[url])
+                else:
+                    outcomes[(year, category)] = pool.submit(
+                        _parse_observed if observed else parse_page,
+                        scraper.series, scraper.parser, category, text, year)
+
+        result = CrawlResult()
+        for item in items:
+            year, category = item
+            outcome = outcomes[item]
+            if isinstance(outcome, Exception):
+                result.errors[item] = outcome
+                continue
+            try:
+                value = outcome.result()
+            except Exception as error:  # pylint: disable=broad-except
+                result.errors[item] = error
+                if observed and category not in scraper.extra_categories:
+                    network = item_networks[item]
+                    _emit_item(scraper, category, year, network, 0.0, network, None, error)
+                continue
+            if observed and category not in scraper.extra_categories:
+                value, parse, elapsed = value
+                network = item_networks[item]
+                _emit_item(scraper, category, year, network, parse, network + elapsed, value, None)
+            result[item] = value
+
+    return result
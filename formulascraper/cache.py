@@ -0,0 +1,224 @@
+"""
+Module containing the persistent on-disk HTTP response cache.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+from .transport import Response
+
+
+class ResponseCache:
+    """
+    On-disk cache of scraped pages with season-aware expiry.
+
+    Pages of completed seasons never change and are served from disk
+    forever. Pages of the current season are served for ``current_ttl``
+    seconds and then revalidated with a conditional request
+    (``If-None-Match``/``If-Modified-Since``). When the cache grows past
+    ``max_bytes`` the least recently used pages are evicted. The scrapers
+    call ``lookup`` before a request and ``update`` with its response.
+    """
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024, current_ttl=300):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding the cached pages, created if missing.
+                A leading "~" is expanded to the home directory.
+            max_bytes: Maximum total size of the cached page bodies.
+            current_ttl: Seconds a page of the current season is served
+                before it is revalidated.
+        """
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self.current_ttl = current_ttl
+        self._lock = threading.Lock()
+        self._usage = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    def lookup(self, url):
+        """
+        Look up a page without touching the network.
+
+        Only pages stored as final are served without revalidation: a page
+        stored while its season was running is revalidated once older than
+        ``current_ttl``, even after the season finished, and ``update``
+        then marks it final.
+
+        Args:
+            url: The URL of the page.
+
+        Returns:
+            A (response, headers) tuple. ``response`` is the cached page if it
+            can be served as is, otherwise None and ``headers`` holds the
+            conditional request headers to revalidate a stale copy.
+        """
+        meta = self._read_meta(url)
+        if meta is None:
+            return None, {}
+        if meta["final"] or time.time() - meta["stored_at"] < self.current_ttl:
+            response = self._read_response(url, meta)
+            if response is not None:
+                return response, {}
+            return None, {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return None, headers
+
+    def update(self, url, response, final=False):
+        """
+        Store a downloaded page, or refresh a revalidated one.
+
+        Args:
+            url: The URL of the page.
+            response: The response of the download or conditional request.
+            final: Whether the page belongs to a completed season.
+
+        Returns:
+            The response to hand to the scraper. A ``304 Not Modified`` answer
+            is replaced by the cached page; it is returned as is if the page
+            was evicted in the meantime, and must then be fetched again
+            without validators.
+        """
+        if response.status_code == 304:
+            meta = self._read_meta(url)
+            if meta is not None:
+                meta["stored_at"] = time.time()
+                meta["final"] = meta["final"] or final
+                self._write_meta(url, meta)
+                cached = self._read_response(url, meta)
+                if cached is not None:
+                    return cached
+        elif response.status_code == 200:
+            self.store(url, response, final)
+        return response
+
+    def store(self, url, response, final=False):
+        """
+        Write a page to the cache and evict old pages when over the size cap.
+
+        Args:
+            url: The URL of the page.
+            response: The response holding the page.
+            final: Whether the page belongs to a completed season.
+        """
+        body = response.text.encode("utf-8")
+        meta = {
+            "url": url,
+            "stored_at": time.time(),
+            "final": final,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "size": len(body),
+        }
+        path = self._path(url)
+        with self._lock:
+            usage = self._current_usage()
+            if os.path.exists(path + ".body"):
+                usage -= os.path.getsize(path + ".body")
+            self._write_file(path + ".body", body)
+            self._write_meta(url, meta)
+            self._usage = usage + len(body)
+            self._evict()
+
+    def clear(self):
+        """
+        Remove every cached page.
+        """
+        with self._lock:
+            for name in os.listdir(self.directory):
+                if name.endswith((".body", ".json")):
+                    os.remove(os.path.join(self.directory, name))
+            self._usage = 0
+
+    def _path(self, url):
+        return os.path.join(self.directory, hashlib.sha256(url.encode("utf-8")).hexdigest())
+
+    def _read_meta(self, url):
+        try:
+            with open(self._path(url) + ".json", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, url, meta):
+        self._write_file(self._path(url) + ".json", json.dumps(meta).encode("utf-8"))
+
+    def _read_response(self, url, meta):
+        path = self._path(url) + ".body"
+        try:
+            with open(path, "rb") as file:
+                body = file.read()
+            os.utime(path)
+        except OSError:
+            return None
+        headers = {}
+        if meta.get("etag"):
+            headers["ETag"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["Last-Modified"] = meta["last_modified"]
+        return Response(url, 200, headers, body, "utf-8")
+
+    def _write_file(self, path, data):
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(data)
+        os.replace(temporary, path)
+
+    def _current_usage(self):
+        if self._usage is None:
+            self._usage = sum(
+                entry.stat().st_size for entry in os.scandir(self.directory)
+                if entry.name.endswith(".body")
+            )
+        return self._usage
+
+    def _evict(self):
+        if self._usage <= self.max_bytes:
+            return
+        bodies = sorted(
+            (entry for entry in os.scandir(self.directory) if entry.name.endswith(".body")),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        for entry in bodies:
+            if self._usage <= self.max_bytes:
+                break
+            size = entry.stat().st_size
+            base = entry.path[:-len(".body")]
+            for path in (entry.path, base + ".json"):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            self._usage -= size
+
+
+_default_cache = None
+
+
+def get_default_cache():
+    """
+    Return the cache shared by scrapers created without one.
+
+    Returns:
+        The module-wide ``ResponseCache``, or None when caching is disabled.
+    """
+    return _default_cache
+
+
+def set_default_cache(cache):
+    """
+    Set the cache shared by scrapers created without one.
+
+    Args:
+        cache: A ``ResponseCache``, or None to disable caching.
+    """
+    global _default_cache
+    _default_cache = cache
@@ -0,0 +1,159 @@
+"""
+Module containing the ``formulascraper`` command-line interface.
+
+    formulascraper f1 drivers 1950-2024 --format ndjson > drivers.ndjson
+    formulascraper fe teams 2021,2023 --format csv
+
+Only argparse is imported up front, the scrapers and their HTTP and HTML
+dependencies are imported once the arguments have been parsed.
+"""
+import argparse
+import os
+import sys
+
+from .parsing import PARSERS
+
+SERIES = ("f1", "f1academy", "f2", "f3", "fe")
+
+
+def parse_years(value):
+    """
+    Parse a years argument such as "2021", "1950-2024" or "2019,2021-2023".
+
+    Args:
+        value: The argument given on the command line.
+
+    Returns:
+        The list of years, in the given order and without duplicates.
+    """
+    years = []
+    for part in value.split(","):
+        first, _, last = part.strip().partition("-")
+        try:
+            start = int(first)
+            end = int(last) if last else start
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid years: {value!r}") from None
+        step = 1 if end >= start else -1
+        for year in range(start, end + step, step):
+            if year not in years:
+                years.append(year)
+    return years
+
+
+def build_parser():
+    """
+    Build the argument parser of the command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="formulascraper",
+        description="Scrape Formula racing data and write it to stdout.",
+    )
+    parser.add_argument("series", choices=SERIES, help="racing series")
+    parser.add_argument("category", help="category, e.g. drivers, races, teams, fastest_laps or race_results")
+    parser.add_argument("years", type=parse_years, help='years, e.g. "2021", "1950-2024" or "2019,2021-2023"')
+    parser.add_argument("--format", choices=("ndjson", "csv"), default="ndjson", help="output format")
+    parser.add_argument("--workers", type=int, default=8, help="number of seasons fetched in parallel")
+    parser.add_argument("--unordered", action="store_true",
+                        help="write each season as soon as it is scraped instead of in year order")
+    parser.add_argument("--parser", choices=PARSERS, default="html.parser", help="HTML parser backend")
+    parser.add_argument("--cache", metavar="DIRECTORY", help="keep downloaded pages in this directory")
+    parser.add_argument("--archive", metavar="FILE", help="append every downloaded page to this page archive")
+    return parser
+
+
+class _CSVOutput:
+    def __init__(self, stream):
+        self.stream = stream
+        self.writer = None
+
+    def write(self, row):
+        if self.writer is None:
+            import csv
+            self.writer = csv.DictWriter(self.stream, fieldnames=list(row), extrasaction="ignore")
+            self.writer.writeheader()
+        self.writer.writerow(row)
+
+
+class _NDJSONOutput:
+    def __init__(self, stream):
+        import json
+        self.stream = stream
+        self.encoder = json.JSONEncoder(ensure_ascii=False, default=str)
+
+    def write(self, row):
+        self.stream.write(self.encoder.encode(row))
+        self.stream.write("\n")
+
+
+def _scrape(scraper, category, years, workers, unordered):
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {executor.submit(scraper.get_data, category, year): year for year in years}
+        done = as_completed(futures) if unordered else futures
+        try:
+            for future in done:
+                year = futures[future]
+                try:
+                    yield year, future.result(), None
+                except Exception as error:  # pylint: disable=broad-except
+                    yield year, None, error
+        finally:
+            # Seasons not started yet are dropped when the output stops early.
+            executor.shutdown(cancel_futures=True)
+
+
+def main(argv=None):
+    """
+    Run the command.
+
+    Args:
+        argv: The arguments, defaults to ``sys.argv[1:]``.
+
+    Returns:
+        The exit status: 0 on success, 1 if some seasons failed.
+    """
+    parser = build_parser()
+    arguments = parser.parse_args(argv)
+
+    from .scrapers import SCRAPERS
+
+    options = {"parser": arguments.parser}
+    if arguments.cache:
+        from .cache import ResponseCache
+        options["cache"] = ResponseCache(arguments.cache)
+    if arguments.archive:
+        from .pagearchive import PageArchive
+        options["archive"] = PageArchive(arguments.archive)
+    scraper = SCRAPERS[arguments.series](**options)
+    if not scraper.supports(arguments.category):
+        categories = scraper.categories + scraper.extra_categories
+        parser.error(f"{arguments.series} has no category {arguments.category!r}, "
+                     f"choose from {', '.join(categories)}")
+
+    years = scraper.available_years(arguments.category, arguments.years)
+    for year in arguments.years:
+        if year not in years:
+            print(f"formulascraper: skipping {year}, no {arguments.category} data for "
+                  f"{arguments.series}", file=sys.stderr)
+
+    output = (_CSVOutput if arguments.format == "csv" else _NDJSONOutput)(sys.stdout)
+    status = 0
+    results = _scrape(scraper, arguments.category, years, arguments.workers, arguments.unordered)
+    try:
+        for year, rows, error in results:
+            if error is not None:
+                print(f"formulascraper: {year}: {error}", file=sys.stderr)
+                status = 1
+                continue
+            for row in rows:
+                output.write({"series": arguments.series, "year": year, **row})
+            sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader went away, e.g. "| head". Python flushes stdout again
+        # at exit, so point it to devnull instead of failing a second time.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    finally:
+        results.close()
+    return status
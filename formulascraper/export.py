@@ -0,0 +1,199 @@
+"""
+Module containing the columnar export of scraped data.
+
+The exports need optional dependencies:
+
+    pip install formulascraper[pandas]   # to_pandas
+    pip install formulascraper[arrow]    # to_arrow, write_parquet
+"""
+import importlib
+import warnings
+
+from .records import FIELD_TYPES, RECORD_TYPES, to_record
+from .scrapers import SCRAPERS
+
+
+class Columns(dict):
+    """
+    Columns returned by ``collect_columns``, keyed by column name.
+
+    Seasons that failed to scrape are left out of the columns and reported
+    in ``errors``, keyed by (series, year), with the exception they raised.
+    """
+    def __init__(self, names):
+        super().__init__((name, []) for name in names)
+        self.errors = {}
+
+
+def collect_columns(category, years, series=None, scrapers=None, max_workers=8):
+    """
+    Scrape a category over a range of years and series into columns.
+
+    Years a series has no data for are skipped. Failed seasons do not abort
+    the export, they are reported in the ``errors`` attribute of the result.
+
+    Args:
+        category: The category to export, e.g. "drivers".
+        years: Iterable of years, e.g. ``range(1950, 2024)``.
+        series: A series name such as "f1", an iterable of names, or None for
+            every series with the category.
+        scrapers: Optional mapping of series name to scraper instance, used
+            instead of new scrapers with default options.
+        max_workers: Number of threads fetching pages per series.
+
+    Returns:
+        A ``Columns`` dictionary mapping each column name ("series", "year"
+        and the fields of the category's record type) to a list of values.
+    """
+    if category not in RECORD_TYPES:
+        raise ValueError(f"Invalid category: {category}")
+    if series is None:
+        series = [name for name, scraper in SCRAPERS.items()
+                  if category in scraper.categories or category in scraper.extra_categories]
+    elif isinstance(series, str):
+        series = [series]
+    years = list(years)
+    scrapers = scrapers or {}
+
+    fields = [name for name in RECORD_TYPES[category].__slots__ if name != "series"]
+    columns = Columns(["series", "year"] + fields)
+    for name in series:
+        if name not in SCRAPERS:
+            raise ValueError(f"Invalid series: {name}")
+        scraper = scrapers.get(name) or SCRAPERS[name]()
+        if not scraper.supports(category):
+            continue
+        result = scraper.get_history(scraper.available_years(category, years), [category],
+                                     max_workers=max_workers)
+        for (year, _), error in result.errors.items():
+            columns.errors[(name, year)] = error
+
+        for (year, _), rows in result.items():
+            for row in rows:
+                record = to_record(name, category, row)
+                columns["series"].append(name)
+                columns["year"].append(year)
+                for field in fields:
+                    columns[field].append(getattr(record, field))
+
+    return columns
+
+
+def to_arrow(category, years, series=None, **kwargs):
+    """
+    Scrape a category into a pyarrow Table with typed columns.
+
+    Seasons that fail to scrape are skipped with a warning.
+
+    Args:
+        category: The category to export, e.g. "drivers".
+        years: Iterable of years.
+        series: Series name(s), see ``collect_columns``.
+        **kwargs: Extra arguments passed to ``collect_columns``.
+
+    Returns:
+        A ``pyarrow.Table``.
+    """
+    pa = _require("pyarrow", "arrow")
+    return _arrow_table(pa, _collect(category, years, series, **kwargs))
+
+
+def to_pandas(category, years, series=None, **kwargs):
+    """
+    Scrape a category into a pandas DataFrame with typed columns.
+
+    Integer columns use the nullable ``Int64`` dtype, dates use
+    ``datetime64`` and text columns use the ``string`` dtype. Seasons that
+    fail to scrape are skipped with a warning.
+
+    Args:
+        category: The category to export, e.g. "drivers".
+        years: Iterable of years.
+        series: Series name(s), see ``collect_columns``.
+        **kwargs: Extra arguments passed to ``collect_columns``.
+
+    Returns:
+        A ``pandas.DataFrame``.
+    """
+    pd = _require("pandas", "pandas")
+    columns = _collect(category, years, series, **kwargs)
+    frame = {}
+    for name, values in columns.items():
+        if FIELD_TYPES.get(name) == "int":
+            frame[name] = pd.array(values, dtype="Int64")
+        elif FIELD_TYPES.get(name) == "float":
+            frame[name] = pd.array(values, dtype="float64")
+        elif FIELD_TYPES.get(name) == "date":
+            frame[name] = pd.to_datetime(pd.Series(values, dtype="object"))
+        else:
+            frame[name] = pd.array(values, dtype="string")
+    return pd.DataFrame(frame)
+
+
+def write_parquet(root, categories, years, series=None, **kwargs):
+    """
+    Scrape categories into a Parquet dataset partitioned by
+    series/category/year.
+
+    The partitions written replace the ones already in the dataset, so
+    exporting the same seasons again does not duplicate their rows.
+
+    Args:
+        root: Directory of the dataset, e.g. "formula.parquet".
+        categories: A category name or an iterable of names.
+        years: Iterable of years.
+        series: Series name(s), see ``collect_columns``.
+        **kwargs: Extra arguments passed to ``collect_columns``.
+
+    Returns:
+        The number of rows written.
+    """
+    pa = _require("pyarrow", "arrow")
+    import pyarrow.parquet as pq
+
+    if isinstance(categories, str):
+        categories = [categories]
+    years = list(years)
+    rows = 0
+    for category in categories:
+        table = _arrow_table(pa, _collect(category, years, series, **kwargs))
+        if table.num_rows == 0:
+            continue
+        table = table.append_column("category", pa.array([category] * table.num_rows, pa.string()))
+        pq.write_to_dataset(table, root, partition_cols=["series", "category", "year"],
+                            existing_data_behavior="delete_matching",
+                            basename_template="part-{i}.parquet")
+        rows += table.num_rows
+    return rows
+
+
+def _collect(category, years, series, **kwargs):
+    columns = collect_columns(category, years, series, **kwargs)
+    if columns.errors:
+        failed = ", ".join(f"{name} {year}" for name, year in columns.errors)
+        warnings.warn(f"Skipped {category} seasons that failed to scrape: {failed}", stacklevel=3)
+    return columns
+
+
+def _arrow_table(pa, columns):
+    return pa.table({name: pa.array(values, type=_arrow_type(pa, name))
+                     for name, values in columns.items()})
+
+
+def _arrow_type(pa, name):
+    if name == "year":
+        return pa.int16()
+    if FIELD_TYPES.get(name) == "int":
+        return pa.int32()
+    if FIELD_TYPES.get(name) == "float":
+        return pa.float64()
+    if FIELD_TYPES.get(name) == "date":
+        return pa.date32()
+    return pa.string()
+
+
+def _require(module, extra):
+    try:
+        return importlib.import_module(module)
+    except ImportError as error:
+        raise ImportError(f"{module} is required: pip install formulascraper[{extra}]") from error
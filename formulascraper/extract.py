@@ -0,0 +1,50 @@
+"""
+Module containing the declarative row extraction used by the HTML scrapers.
+"""
+import html
+import re
+
+
+class RowSpec:
+    """
+    Precompiled field patterns extracted from one table row.
+
+    Each field is a (name, pattern, strip) tuple, where ``pattern`` has one
+    capturing group and ``strip`` (default True) trims the captured text. The
+    row is serialized once and every pattern is searched in that string.
+    Character references in the captured text (``&amp;``, ``&nbsp;``) are
+    decoded, since the parser backends do not serialize them the same way.
+    """
+    def __init__(self, *fields):
+        """
+        Compile the field patterns.
+
+        Args:
+            *fields: (name, pattern) or (name, pattern, strip) tuples, in the
+                order their values are returned by ``extract``.
+        """
+        self.names = tuple(field[0] for field in fields)
+        self._fields = tuple(
+            (field[0], re.compile(field[1]), field[2] if len(field) > 2 else True)
+            for field in fields
+        )
+
+    def extract(self, row):
+        """
+        Extract the field values from a row.
+
+        Args:
+            row: A BeautifulSoup tag or the row markup as a string.
+
+        Returns:
+            A list with the value of each field, in declaration order.
+        """
+        markup = row if isinstance(row, str) else str(row)
+        values = []
+        for name, pattern, strip in self._fields:
+            match = pattern.search(markup)
+            if match is None:
+                raise ValueError(f"Field {name!r} not found in row")
+            value = html.unescape(match.group(1))
+            values.append(value.strip() if strip else value)
+        return values
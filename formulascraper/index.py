@@ -0,0 +1,246 @@
+"""
+Module containing the in-memory cross-season index of drivers and teams.
+"""
+import bisect
+import datetime
+import itertools
+import unicodedata
+from collections import defaultdict
+
+from .records import Record, to_record
+
+
+def normalize_name(name):
+    """
+    Normalize a driver or team name for lookups.
+
+    Accents are removed, case is folded and whitespace is collapsed, so
+    "Kimi Räikkönen" and "kimi  raikkonen" give the same key.
+
+    Args:
+        name: The name as scraped.
+
+    Returns:
+        The normalized key.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+class Career:
+    """
+    Aggregated career of a driver or team across seasons and series.
+
+    ``seasons`` maps (series, year) to the championship standing record of
+    that season. ``points``, ``wins`` and ``championships`` map each series
+    to the career total in that series.
+    """
+    __slots__ = ("name", "seasons", "points", "wins", "championships")
+
+    def __init__(self, name):
+        self.name = name
+        self.seasons = {}
+        self.points = defaultdict(float)
+        self.wins = defaultdict(int)
+        self.championships = defaultdict(int)
+
+    @property
+    def total_points(self):
+        """
+        Points scored across all series.
+        """
+        return sum(self.points.values())
+
+    @property
+    def total_wins(self):
+        """
+        Race wins across all series.
+        """
+        return sum(self.wins.values())
+
+    @property
+    def total_championships(self):
+        """
+        Championships won across all series.
+        """
+        return sum(self.championships.values())
+
+    @property
+    def series(self):
+        """
+        The series the driver or team appears in, sorted by name.
+        """
+        return sorted({series for series, _ in self.seasons} | set(self.wins))
+
+    def __repr__(self):
+        return (f"Career(name={self.name!r}, seasons={len(self.seasons)}, "
+                f"points={self.total_points}, wins={self.total_wins}, "
+                f"championships={self.total_championships})")
+
+
+class CareerIndex:
+    """
+    Index of driver and team careers built from scraped seasons.
+
+    Lookups by normalized name are dictionary lookups, prefix searches use
+    a sorted key list, and the career aggregates are updated as seasons are
+    added. Adding a season again replaces its previous contribution.
+    """
+    def __init__(self):
+        self._drivers = {}
+        self._teams = {}
+        self._driver_keys = []
+        self._team_keys = []
+        self._contributions = {}
+
+    def add_season(self, series, year, drivers=None, teams=None, races=None, final=None):
+        """
+        Add or replace the data of one season.
+
+        Args:
+            series: The series name, e.g. "f1".
+            year: The season year.
+            drivers: Rows of the "drivers" category (dictionaries or records).
+            teams: Rows of the "teams" category.
+            races: Rows of the "races" category, used for race wins.
+            final: Whether the season is over, so its leaders count as
+                champions. Defaults to seasons before the current year.
+        """
+        if final is None:
+            final = year < datetime.date.today().year
+        if drivers is not None:
+            self._replace(series, year, "drivers", self._standings(series, "drivers", drivers, final))
+        if teams is not None:
+            self._replace(series, year, "teams", self._standings(series, "teams", teams, final))
+        if races is not None:
+            self._replace(series, year, "races", self._wins(series, races))
+
+    def add_history(self, series, history):
+        """
+        Add every season of a bulk crawl.
+
+        Championships are only counted for the seasons before the current
+        year, see ``add_season``.
+
+        Args:
+            series: The series name of the crawled scraper.
+            history: A ``CrawlResult`` as returned by ``get_history``.
+        """
+        for (year, category), rows in history.items():
+            if category in ("drivers", "teams", "races"):
+                self.add_season(series, year, **{category: rows})
+
+    def driver(self, name):
+        """
+        Return the career of a driver, or None if unknown.
+        """
+        return self._drivers.get(normalize_name(name))
+
+    def team(self, name):
+        """
+        Return the career of a team, or None if unknown.
+        """
+        return self._teams.get(normalize_name(name))
+
+    def search_drivers(self, prefix, limit=None):
+        """
+        Return the careers of the drivers whose name starts with a prefix.
+
+        Args:
+            prefix: The beginning of the name, matched after normalization.
+            limit: Maximum number of careers to return.
+
+        Returns:
+            A list of ``Career`` objects sorted by normalized name.
+        """
+        return self._search(self._drivers, self._driver_keys, prefix, limit)
+
+    def search_teams(self, prefix, limit=None):
+        """
+        Return the careers of the teams whose name starts with a prefix.
+
+        Args:
+            prefix: The beginning of the name, matched after normalization.
+            limit: Maximum number of careers to return.
+
+        Returns:
+            A list of ``Career`` objects sorted by normalized name.
+        """
+        return self._search(self._teams, self._team_keys, prefix, limit)
+
+    def drivers(self):
+        """
+        Return every driver career.
+        """
+        return [self._drivers[key] for key in self._driver_keys]
+
+    def teams(self):
+        """
+        Return every team career.
+        """
+        return [self._teams[key] for key in self._team_keys]
+
+    def _standings(self, series, category, rows, final):
+        contributions = []
+        for row in rows:
+            record = row if isinstance(row, Record) else to_record(series, category, row)
+            name = record.name if category == "drivers" else record.team
+            if name:
+                contributions.append((category, name, record.points or 0.0, 0,
+                                      int(final and record.position == 1), record))
+        return contributions
+
+    def _wins(self, series, rows):
+        contributions = []
+        for row in rows:
+            record = row if isinstance(row, Record) else to_record(series, "races", row)
+            if record.winner:
+                contributions.append(("drivers", record.winner, 0.0, 1, 0, None))
+            if record.team:
+                contributions.append(("teams", record.team, 0.0, 1, 0, None))
+        return contributions
+
+    def _replace(self, series, year, kind, contributions):
+        previous = self._contributions.pop((series, year, kind), ())
+        for category, name, points, wins, championships, record in previous:
+            self._apply(series, year, category, name, -points, -wins, -championships, record, False)
+        for category, name, points, wins, championships, record in contributions:
+            self._apply(series, year, category, name, points, wins, championships, record, True)
+        self._contributions[(series, year, kind)] = contributions
+
+    def _apply(self, series, year, category, name, points, wins, championships, record, adding):
+        careers, keys = ((self._drivers, self._driver_keys) if category == "drivers"
+                         else (self._teams, self._team_keys))
+        key = normalize_name(name)
+        career = careers.get(key)
+        if career is None:
+            career = careers[key] = Career(name)
+            bisect.insort(keys, key)
+
+        if record is not None:
+            if adding:
+                career.seasons[(series, year)] = record
+            else:
+                career.seasons.pop((series, year), None)
+        # Rounded so removing a season leaves no float residue behind.
+        career.points[series] = round(career.points[series] + points, 6)
+        career.wins[series] += wins
+        career.championships[series] += championships
+        for totals in (career.points, career.wins, career.championships):
+            if not totals[series]:
+                del totals[series]
+
+        if not adding and not career.seasons and not career.wins:
+            del careers[key]
+            del keys[bisect.bisect_left(keys, key)]
+
+    def _search(self, careers, keys, prefix, limit):
+        prefix = normalize_name(prefix)
+        start = bisect.bisect_left(keys, prefix)
+        found = []
+        for key in itertools.islice(keys, start, None):
+            if not key.startswith(prefix) or (limit is not None and len(found) >= limit):
+                break
+            found.append(careers[key])
+        return found
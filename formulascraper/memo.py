@@ -0,0 +1,256 @@
+"""
+Module containing request coalescing and the in-process result memo.
+
+``SingleFlight`` lets concurrent callers asking for the same key share one
+computation: the first caller runs it and the others wait for its result.
+Threads and coroutines share the same flights, so a coroutine can wait for
+a scrape started by a thread and the other way round. ``Memo`` keeps the
+results for a while, bounded in size, and counts hits, misses and
+evictions.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key into one.
+
+    ``flights`` counts the calls that ran, ``coalesced`` the calls that
+    waited for a call already in flight instead.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.flights = 0
+        self.coalesced = 0
+
+    def do(self, key, function, *args):
+        """
+        Call ``function(*args)``, or wait for the call in flight for the key.
+
+        Args:
+            key: Hashable key identifying the call.
+            function: The function to call.
+            *args: Arguments passed to the function.
+
+        Returns:
+            The result of the call, shared by every caller of the flight.
+            Exceptions are raised to every caller too.
+        """
+        thread = threading.get_ident()
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                leader = self._start(key, thread, None)
+            else:
+                leader = None
+                shared = flight[1] != thread
+                if shared:
+                    self.coalesced += 1
+        if leader is None:
+            # A thread cannot wait for a flight it runs itself, e.g. on its event loop.
+            return flight[0].result() if shared else function(*args)
+
+        try:
+            result = function(*args)
+        except BaseException as error:
+            self._finish(key, leader, error=error)
+            raise
+        self._finish(key, leader, result)
+        return result
+
+    async def ado(self, key, function, *args):
+        """
+        Asynchronous counterpart of ``do`` for coroutine functions.
+
+        The call runs in its own task, so cancelling one waiting caller does
+        not cancel the others.
+
+        Args:
+            key: Hashable key identifying the call.
+            function: The coroutine function to call.
+            *args: Arguments passed to the function.
+
+        Returns:
+            The result of the call, shared by every caller of the flight.
+        """
+        import asyncio
+
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                task = asyncio.ensure_future(function(*args))
+                flight = self._start(key, threading.get_ident(), task)
+                task.add_done_callback(lambda task: self._finish_task(key, flight, task))
+            else:
+                self.coalesced += 1
+        return await asyncio.wrap_future(flight[0])
+
+    def in_flight(self):
+        """
+        Return the number of calls currently running.
+        """
+        with self._lock:
+            return len(self._flights)
+
+    def _start(self, key, thread, task):
+        future = Future()
+        future.set_running_or_notify_cancel()
+        flight = self._flights[key] = (future, thread, task)
+        self.flights += 1
+        return flight
+
+    def _finish(self, key, flight, result=None, error=None):
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        if error is not None:
+            flight[0].set_exception(error)
+        else:
+            flight[0].set_result(result)
+
+    def _finish_task(self, key, flight, task):
+        import asyncio
+
+        if task.cancelled():
+            self._finish(key, flight, error=asyncio.CancelledError())
+        else:
+            self._finish(key, flight, task.result() if task.exception() is None else None,
+                         task.exception())
+
+
+class Memo:
+    """
+    Bounded in-process memo of scraped results with LRU eviction and TTL.
+
+    Pass one to the scrapers with ``memo=`` to reuse results for ``ttl``
+    seconds; it can be shared by several scrapers, results are keyed by
+    (series, category, year). Misses are computed through a
+    ``SingleFlight``, so concurrent misses for the same key scrape once.
+    """
+    def __init__(self, max_entries=256, ttl=60.0):
+        """
+        Initialize the memo.
+
+        Args:
+            max_entries: Maximum number of results kept, the least recently
+                used ones are evicted first.
+            ttl: Seconds a result is served, None to keep it until evicted.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return a memoized result, or ``default`` if missing or expired.
+        """
+        found, value = self._lookup(key)
+        return value if found else default
+
+    def set(self, key, value):
+        """
+        Store a result, evicting the least recently used ones over the limit.
+        """
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key):
+        """
+        Drop a memoized result.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """
+        Drop every memoized result.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_compute(self, key, function, *args):
+        """
+        Return the memoized result, computing it once on a miss.
+
+        Args:
+            key: Hashable key of the result.
+            function: Function computing the result.
+            *args: Arguments passed to the function.
+
+        Returns:
+            The memoized or computed result.
+        """
+        found, value = self._lookup(key)
+        if found:
+            return value
+        return self.flight.do(key, self._compute, key, function, *args)
+
+    async def aget_or_compute(self, key, function, *args):
+        """
+        Asynchronous counterpart of ``get_or_compute`` for coroutine functions.
+        """
+        found, value = self._lookup(key)
+        if found:
+            return value
+        return await self.flight.ado(key, self._acompute, key, function, *args)
+
+    def stats(self):
+        """
+        Return the counters of the memo.
+
+        Returns:
+            A dictionary with "entries", "hits", "misses", "evictions",
+            "expirations" and "coalesced", the misses that waited for a
+            scrape already in flight.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "coalesced": self.flight.coalesced,
+            }
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] is None or entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, entry[1]
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+
+    def _compute(self, key, function, *args):
+        value = function(*args)
+        self.set(key, value)
+        return value
+
+    async def _acompute(self, key, function, *args):
+        value = await function(*args)
+        self.set(key, value)
+        return value
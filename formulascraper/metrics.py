@@ -0,0 +1,177 @@
+"""
+Module containing the instrumentation events and the stats collector.
+
+A scraper created with ``collector=callback`` calls ``callback(event)`` with
+a ``ScrapeEvent`` for every request, parse, extraction and getter call.
+Without a collector no timing is done at all.
+"""
+import contextvars
+import threading
+from collections import defaultdict
+
+_CALL = contextvars.ContextVar("formulascraper_call", default=None)
+
+
+class ScrapeEvent:
+    """
+    A measurement emitted by an instrumented scraper.
+
+    ``kind`` is one of:
+
+    - "request": one download, with ``url``, ``status``, ``bytes``,
+      ``duration`` (total network time), ``ttfb`` (time until the response
+      headers arrived, including DNS, connect and TLS) and ``transfer``
+      (time spent reading the body). When a request was retried, only
+      the last attempt is timed.
+    - "cache_hit": a page served by the ``ResponseCache`` without any
+      request, with ``url``, ``bytes`` and ``duration``.
+    - "parse": building the HTML tree or decoding the JSON of a call.
+    - "extract": turning the parsed page into rows, with ``rows``.
+    - "call": a whole getter call, with ``rows`` and ``error`` if it failed.
+    """
+    __slots__ = ("kind", "series", "category", "year", "url", "status", "bytes",
+                 "duration", "ttfb", "transfer", "rows", "error")
+
+    def __init__(self, kind, series, category=None, year=None, **values):
+        self.kind = kind
+        self.series = series
+        self.category = category
+        self.year = year
+        for name in self.__slots__[4:]:
+            setattr(self, name, values.get(name))
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__
+                           if getattr(self, name) is not None)
+        return f"ScrapeEvent({values})"
+
+
+class _CallStats:
+    """
+    Timings accumulated during one getter call.
+    """
+    __slots__ = ("category", "year", "network", "parse")
+
+    def __init__(self, category, year):
+        self.category = category
+        self.year = year
+        self.network = 0.0
+        self.parse = 0.0
+
+
+def current_call():
+    """
+    Return the timings of the getter call running in this context, if any.
+    """
+    return _CALL.get()
+
+
+def start_call(category, year):
+    """
+    Start accumulating the timings of a getter call.
+
+    Returns:
+        A (stats, token) tuple, pass the token to ``end_call``.
+    """
+    stats = _CallStats(category, year)
+    return stats, _CALL.set(stats)
+
+
+def end_call(token):
+    """
+    Stop accumulating the timings started by ``start_call``.
+    """
+    _CALL.reset(token)
+
+
+class StatsCollector:
+    """
+    Thread-safe collector aggregating events per series and category.
+
+    Pass an instance as the ``collector`` option of the scrapers, then read
+    ``snapshot()`` or export ``to_openmetrics()``.
+    """
+    def __init__(self, prefix="formulascraper"):
+        """
+        Initialize empty counters.
+
+        Args:
+            prefix: Prefix of the exported metric names.
+        """
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._counters = defaultdict(float)
+
+    def __call__(self, event):
+        labels = (event.series or "", event.category or "")
+        with self._lock:
+            counters = self._counters
+            if event.kind == "request":
+                counters[("requests_total", labels + (str(event.status),))] += 1
+                counters[("response_bytes_total", labels)] += event.bytes or 0
+                counters[("network_seconds_total", labels)] += event.duration or 0.0
+                counters[("ttfb_seconds_total", labels)] += event.ttfb or 0.0
+            elif event.kind == "cache_hit":
+                counters[("cache_hits_total", labels)] += 1
+            elif event.kind == "parse":
+                counters[("parse_seconds_total", labels)] += event.duration
+            elif event.kind == "extract":
+                counters[("extract_seconds_total", labels)] += event.duration
+                counters[("rows_total", labels)] += event.rows or 0
+            elif event.kind == "call":
+                counters[("calls_total", labels + ("error" if event.error else "ok",))] += 1
+                counters[("call_seconds_total", labels)] += event.duration
+
+    def snapshot(self):
+        """
+        Return the current counters.
+
+        Returns:
+            A dictionary mapping (metric, labels) to the value, where labels
+            is a (series, category[, status or outcome]) tuple.
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def reset(self):
+        """
+        Reset every counter to zero.
+        """
+        with self._lock:
+            self._counters.clear()
+
+    def to_openmetrics(self):
+        """
+        Export the counters in the Prometheus/OpenMetrics text format.
+
+        Returns:
+            The exposition text, terminated by "# EOF".
+        """
+        label_names = {
+            "requests_total": ("series", "category", "status"),
+            "calls_total": ("series", "category", "outcome"),
+        }
+        metrics = defaultdict(list)
+        for (metric, labels), value in sorted(self.snapshot().items()):
+            names = label_names.get(metric, ("series", "category"))
+            rendered = ",".join(f'{name}="{_escape(label)}"' for name, label in zip(names, labels))
+            metrics[metric].append(f"{self.prefix}_{metric}{{{rendered}}} {_number(value)}")
+
+        lines = []
+        for metric, samples in metrics.items():
+            family = metric[:-len("_total")]
+            lines.append(f"# TYPE {self.prefix}_{family} counter")
+            lines.extend(samples)
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def _number(value):
+    # Counts are written as ints, other values without losing precision.
+    if value.is_integer() and abs(value) < 2 ** 53:
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
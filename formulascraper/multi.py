@@ -0,0 +1,134 @@
+"""
+Module containing the facade scraping every series at once.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from .records import to_record
+from .scrapers import SCRAPERS
+
+
+class MultiSeriesResult(list):
+    """
+    Records of several series, in the order of the scraper's ``series``.
+
+    Series that failed are left out of the list and reported in ``errors``
+    with the exception they raised. ``skipped`` lists the series without
+    data for the category and year.
+    """
+    def __init__(self, records=()):
+        super().__init__(records)
+        self.errors = {}
+        self.skipped = []
+
+    @property
+    def ok(self):
+        """
+        Whether every series with data was scraped successfully.
+        """
+        return not self.errors
+
+
+class MultiSeriesScraper:
+    """
+    Scrape one category and year of every series concurrently.
+
+    Rows are returned as typed records (``DriverStanding``, ``RaceResult``,
+    ``TeamStanding``, ...) with a ``series`` field, so the same attribute
+    names work for every series, e.g. ``record.name`` and ``record.points``
+    for Formula 1 and Formula E drivers alike. Fields a series does not
+    publish are None.
+    """
+    def __init__(self, series=None, scrapers=None, **options):
+        """
+        Create one scraper per series.
+
+        Args:
+            series: Iterable of series names, defaults to every key of
+                ``SCRAPERS``.
+            scrapers: Optional mapping of series name to scraper instance,
+                used instead of new scrapers.
+            **options: Options passed to the new scrapers, such as
+                ``transport`` or ``cache`` (see the README).
+        """
+        self.series = tuple(SCRAPERS if series is None else series)
+        scrapers = scrapers or {}
+        for name in self.series:
+            if name not in SCRAPERS:
+                raise ValueError(f"Invalid series: {name}")
+        self.scrapers = {name: scrapers.get(name) or SCRAPERS[name](**options) for name in self.series}
+
+    def get_data(self, category, year):
+        """
+        Scrape a category of one year for every series at once.
+
+        Args:
+            category: A category name, e.g. "drivers".
+            year: The year for which to retrieve data.
+
+        Returns:
+            A ``MultiSeriesResult`` list of records, series by series.
+        """
+        targets, result = self._targets(category, year)
+        if not targets:
+            return result
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            futures = [(name, executor.submit(self.scrapers[name].get_data, category, year))
+                       for name in targets]
+            for name, future in futures:
+                try:
+                    rows = future.result()
+                except Exception as error:  # pylint: disable=broad-except
+                    result.errors[name] = error
+                else:
+                    result.extend(to_record(name, category, row) for row in rows)
+        return result
+
+    async def aget_data(self, category, year):
+        """
+        Asynchronous counterpart of ``get_data``.
+        """
+        import asyncio
+
+        targets, result = self._targets(category, year)
+        outcomes = await asyncio.gather(
+            *(self.scrapers[name].aget_data(category, year) for name in targets),
+            return_exceptions=True,
+        )
+        for name, outcome in zip(targets, outcomes):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    # Cancellation is not a failure of the series, propagate it.
+                    raise outcome
+                result.errors[name] = outcome
+            else:
+                result.extend(to_record(name, category, row) for row in outcome)
+        return result
+
+    def get_drivers_data(self, year):
+        """
+        Scrape the driver standings of every series for a specific year.
+        """
+        return self.get_data("drivers", year)
+
+    def get_races_data(self, year):
+        """
+        Scrape the race calendars of every series for a specific year.
+        """
+        return self.get_data("races", year)
+
+    def get_teams_data(self, year):
+        """
+        Scrape the team standings of every series for a specific year.
+        """
+        return self.get_data("teams", year)
+
+    def _targets(self, category, year):
+        result = MultiSeriesResult()
+        targets = []
+        for name in self.series:
+            scraper = self.scrapers[name]
+            if scraper.supports(category) and scraper.available_years(category, [year]):
+                targets.append(name)
+            else:
+                result.skipped.append(name)
+        return targets, result
@@ -0,0 +1,333 @@
+"""
+Module containing the compact binary archive of scraped seasons.
+
+The archive stores each (series, category, year) season column by column.
+Names are interned in a shared string table, numbers are fixed-width, and
+an index at the end of the file gives the offset of every column, so a
+reader memory-maps the file and decodes only the columns it asks for.
+Processes opening the same file share one copy in the page cache.
+
+Layout (little-endian):
+
+- header: magic ``b"FSPK"``, version, string count, season count, offset
+  of the string table and offset of the index;
+- column data, each column 8-byte aligned: int32 for ints and dates (days
+  since 0001-01-01, ``-2**31`` for missing), float64 for floats (NaN for
+  missing), uint32 string ids (``2**32 - 1`` for missing);
+- string table: uint32 end offsets, then the UTF-8 bytes;
+- index: per season the series, category, year, row count and the
+  (name, type, offset) of each column.
+"""
+import datetime
+import math
+import mmap
+import os
+import struct
+
+from .records import FIELD_TYPES, RECORD_TYPES, to_record, Record
+
+_MAGIC = b"FSPK"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHIIQQ")
+_SEASON = struct.Struct("<IIHHI")
+_COLUMN = struct.Struct("<IBxxxQ")
+_NULL_INT = -2 ** 31
+_NULL_STRING = 2 ** 32 - 1
+_KINDS = {"int": "i", "float": "d", "date": "t"}
+
+
+def _column_type(name):
+    return _KINDS.get(FIELD_TYPES.get(name), "s")
+
+
+class PackedWriter:
+    """
+    Write seasons to a packed archive.
+
+    The file is written to a temporary path and moved into place by
+    ``close``, so readers never see a partial archive.
+    """
+    def __init__(self, path):
+        """
+        Open the archive for writing.
+
+        Args:
+            path: Path of the archive file.
+        """
+        self.path = path
+        self._temporary = f"{path}.tmp"
+        self._file = open(self._temporary, "wb")
+        self._file.write(b"\0" * _HEADER.size)
+        self._strings = {}
+        self._seasons = {}
+
+    def add(self, series, category, year, rows):
+        """
+        Add or replace a season.
+
+        Args:
+            series: The series name, e.g. "f1".
+            category: The category, e.g. "drivers".
+            year: The season year.
+            rows: The rows as returned by ``get_data`` or as typed records.
+        """
+        records = [row if isinstance(row, Record) else to_record(series, category, row)
+                   for row in rows]
+        self._intern(series)
+        self._intern(category)
+        columns = []
+        for name in RECORD_TYPES[category].__slots__:
+            if name == "series":
+                continue
+            kind = _column_type(name)
+            values = [getattr(record, name) for record in records]
+            self._align()
+            columns.append((self._intern(name), kind, self._file.tell()))
+            self._file.write(self._encode(kind, values))
+        self._seasons[(series, category, year)] = (len(records), columns)
+
+    def add_history(self, series, history):
+        """
+        Add every season of a bulk crawl.
+
+        Args:
+            series: The series name of the crawled scraper.
+            history: A ``CrawlResult`` as returned by ``get_history``.
+        """
+        for (year, category), rows in history.items():
+            self.add(series, category, year, rows)
+
+    def close(self):
+        """
+        Write the string table and the index and move the file into place.
+        """
+        self._align()
+        strings_offset = self._file.tell()
+        encoded = [string.encode("utf-8") for string in self._strings]
+        ends = []
+        end = 0
+        for data in encoded:
+            end += len(data)
+            ends.append(end)
+        self._file.write(struct.pack(f"<{len(ends)}I", *ends))
+        self._file.write(b"".join(encoded))
+
+        self._align()
+        index_offset = self._file.tell()
+        for (series, category, year), (rows, columns) in self._seasons.items():
+            self._file.write(_SEASON.pack(self._strings[series], self._strings[category], year,
+                                          len(columns), rows))
+            for name, kind, offset in columns:
+                self._file.write(_COLUMN.pack(name, ord(kind), offset))
+
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, 0, len(self._strings), len(self._seasons),
+                                      strings_offset, index_offset))
+        self._file.close()
+        os.replace(self._temporary, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+            os.remove(self._temporary)
+
+    def _intern(self, string):
+        identifier = self._strings.get(string)
+        if identifier is None:
+            identifier = self._strings[string] = len(self._strings)
+        return identifier
+
+    def _align(self):
+        padding = -self._file.tell() % 8
+        if padding:
+            self._file.write(b"\0" * padding)
+
+    def _encode(self, kind, values):
+        if kind == "i":
+            return struct.pack(f"<{len(values)}i", *(_NULL_INT if value is None else value
+                                                     for value in values))
+        if kind == "d":
+            return struct.pack(f"<{len(values)}d", *(math.nan if value is None else value
+                                                     for value in values))
+        if kind == "t":
+            return struct.pack(f"<{len(values)}i", *(_NULL_INT if value is None else value.toordinal()
+                                                     for value in values))
+        return struct.pack(f"<{len(values)}I", *(_NULL_STRING if value is None else self._intern(value)
+                                                 for value in values))
+
+
+def write_packed(path, seasons):
+    """
+    Write seasons to a packed archive in one go.
+
+    Args:
+        path: Path of the archive file.
+        seasons: Mapping or iterable of ((series, category, year), rows).
+    """
+    items = seasons.items() if hasattr(seasons, "items") else seasons
+    with PackedWriter(path) as writer:
+        for (series, category, year), rows in items:
+            writer.add(series, category, year, rows)
+
+
+class PackedArchive:
+    """
+    Read-only, memory-mapped view of a packed archive.
+
+    Opening the archive reads the header and the season index only; columns
+    and strings are decoded when requested.
+    """
+    def __init__(self, path):
+        """
+        Map the archive into memory.
+
+        Args:
+            path: Path of the archive file.
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, strings, seasons, strings_offset, index_offset = \
+            _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._map.close()
+            raise ValueError(f"Not a packed archive: {path}")
+
+        self._string_count = strings
+        self._ends_offset = strings_offset
+        self._blob_offset = strings_offset + 4 * strings
+        self._strings = {}
+
+        self._index = {}
+        offset = index_offset
+        for _ in range(seasons):
+            series, category, year, count, rows = _SEASON.unpack_from(self._map, offset)
+            offset += _SEASON.size
+            columns = {}
+            for _ in range(count):
+                name, kind, column_offset = _COLUMN.unpack_from(self._map, offset)
+                offset += _COLUMN.size
+                columns[self._string(name)] = (chr(kind), column_offset)
+            self._index[(self._string(series), self._string(category), year)] = (rows, columns)
+
+    def seasons(self):
+        """
+        Return the (series, category, year) keys of the archived seasons.
+        """
+        return list(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def column_names(self, series, category, year):
+        """
+        Return the column names of a season.
+        """
+        return list(self._season(series, category, year)[1])
+
+    def column(self, series, category, year, name):
+        """
+        Decode one column of a season.
+
+        Args:
+            series: The series name, e.g. "f1".
+            category: The category, e.g. "drivers".
+            year: The season year.
+            name: The column, a field of the category's record type.
+
+        Returns:
+            A list of ints, floats, dates or strings, with None for missing
+            values.
+        """
+        kind, raw = self.column_buffer(series, category, year, name)
+        if kind == "s":
+            return [None if value == _NULL_STRING else self._string(value)
+                    for value in raw.cast("I")]
+        if kind == "d":
+            return [None if math.isnan(value) else value for value in raw.cast("d")]
+        values = [None if value == _NULL_INT else value for value in raw.cast("i")]
+        if kind == "t":
+            return [None if value is None else datetime.date.fromordinal(value) for value in values]
+        return values
+
+    def column_buffer(self, series, category, year, name):
+        """
+        Return the raw bytes of a column without copying them.
+
+        The buffer can be handed to ``numpy.frombuffer`` with dtype "<i4"
+        (ints, dates), "<f8" (floats) or "<u4" (string ids, see ``string``).
+        It must be released before the archive is closed.
+
+        Returns:
+            A (type, memoryview) tuple, type being "i", "d", "t" or "s".
+        """
+        rows, columns = self._season(series, category, year)
+        if name not in columns:
+            raise KeyError(name)
+        kind, offset = columns[name]
+        width = 8 if kind == "d" else 4
+        return kind, memoryview(self._map)[offset:offset + rows * width]
+
+    def columns(self, series, category, year):
+        """
+        Decode every column of a season.
+
+        Returns:
+            A dictionary mapping each column name to its list of values.
+        """
+        return {name: self.column(series, category, year, name)
+                for name in self.column_names(series, category, year)}
+
+    def records(self, series, category, year):
+        """
+        Rebuild the typed records of a season.
+
+        Returns:
+            A list of records of the category's record type.
+        """
+        columns = self.columns(series, category, year)
+        record_type = RECORD_TYPES[category]
+        rows = self._season(series, category, year)[0]
+        return [record_type(series=series, **{name: values[index] for name, values in columns.items()})
+                for index in range(rows)]
+
+    def string(self, identifier):
+        """
+        Return the string of a string table id.
+        """
+        return self._string(identifier)
+
+    def close(self):
+        """
+        Unmap the archive.
+        """
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _season(self, series, category, year):
+        try:
+            return self._index[(series, category, year)]
+        except KeyError:
+            raise KeyError((series, category, year)) from None
+
+    def _string(self, identifier):
+        string = self._strings.get(identifier)
+        if string is None:
+            if identifier >= self._string_count:
+                raise KeyError(identifier)
+            start = (struct.unpack_from("<I", self._map, self._ends_offset + 4 * (identifier - 1))[0]
+                     if identifier else 0)
+            end = struct.unpack_from("<I", self._map, self._ends_offset + 4 * identifier)[0]
+            string = self._map[self._blob_offset + start:self._blob_offset + end].decode("utf-8")
+            self._strings[identifier] = string
+        return string
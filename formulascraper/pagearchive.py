@@ -0,0 +1,375 @@
+"""
+Module containing the append-only archive of raw scraped pages.
+
+Every page body fetched by a scraper created with ``archive=`` is appended
+to one file, compressed, with its URL, fetch time, series and year. When the
+site changes its markup and the extractors are fixed, ``reextract`` replays
+the archived pages through the current extractors in a process pool,
+without touching the network.
+
+Each record is a header (magic ``b"FSPA"``, metadata length, body length
+and CRC-32 of the body), the metadata as JSON and the zlib-compressed page.
+A record cut short by a crash is cut off the end of the file when the
+archive is opened or appended to, a damaged record in the middle is skipped,
+and the checksum is verified when a body is read.
+"""
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from .transport import Response
+
+_MAGIC = b"FSPA"
+_HEADER = struct.Struct("<4sIII")
+
+
+class ArchivedPage:
+    """
+    Metadata of one archived version of a page.
+
+    ``fetched`` is the fetch time in seconds since the epoch, ``size`` the
+    uncompressed size of the body and ``digest`` its SHA-256 in hex.
+    """
+    __slots__ = ("url", "fetched", "series", "year", "size", "digest", "_offset", "_length",
+                 "_checksum")
+
+    def __init__(self, url, fetched, series, year, size, digest, offset, length, checksum):
+        self.url = url
+        self.fetched = fetched
+        self.series = series
+        self.year = year
+        self.size = size
+        self.digest = digest
+        self._offset = offset
+        self._length = length
+        self._checksum = checksum
+
+    def __repr__(self):
+        return (f"ArchivedPage(url={self.url!r}, fetched={self.fetched!r}, "
+                f"series={self.series!r}, year={self.year!r}, size={self.size!r})")
+
+
+class PageArchive:
+    """
+    Compressed, append-only store of page bodies keyed by URL and fetch time.
+
+    A page is only appended when its body differs from the latest archived
+    version of the same URL, so pages served again from a ``ResponseCache``
+    or unchanged between fetches do not grow the archive. Several threads
+    and processes can append to the same file; records appended by other
+    processes are picked up on the next lookup.
+    """
+    def __init__(self, path, level=6):
+        """
+        Open the archive, creating the file if missing.
+
+        Args:
+            path: Path of the archive file.
+            level: zlib compression level of the page bodies, 1 to 9.
+        """
+        self.path = path
+        self.level = level
+        self._lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0),
+                           0o644)
+        self._pages = []
+        self._latest = {}
+        self._scanned = 0
+        with self._lock:
+            self._lock_file()
+            try:
+                self._scan(repair=True)
+            finally:
+                self._unlock_file()
+
+    def add(self, url, text, series=None, year=None, fetched=None):
+        """
+        Append a page unless it is identical to its latest archived version.
+
+        Args:
+            url: The URL of the page.
+            text: The page body as a string.
+            series: The series of the scraper that fetched it, e.g. "f1".
+            year: The season the page belongs to.
+            fetched: The fetch time, defaults to now.
+
+        Returns:
+            The new ``ArchivedPage``, or None if the body did not change.
+        """
+        body = text.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            self._lock_file()
+            try:
+                self._scan(repair=True)
+                latest = self._latest.get(url)
+                if latest is not None and latest.digest == digest:
+                    return None
+                meta = json.dumps({
+                    "url": url,
+                    "fetched": time.time() if fetched is None else fetched,
+                    "series": series,
+                    "year": year,
+                    "size": len(body),
+                    "digest": digest,
+                }).encode("utf-8")
+                data = zlib.compress(body, self.level)
+                os.write(self._fd, _HEADER.pack(_MAGIC, len(meta), len(data), zlib.crc32(data)) + meta + data)
+                self._scan()
+            finally:
+                self._unlock_file()
+            return self._latest[url]
+
+    def record(self, url, response, series=None, year=None):
+        """
+        Archive the body of a successful response.
+
+        Args:
+            url: The URL of the page.
+            response: The response object returned by the transport.
+            series: The series of the scraper.
+            year: The season the page belongs to.
+        """
+        if response.status_code == 200:
+            self.add(url, response.text, series, year)
+
+    def pages(self, url=None, series=None, year=None):
+        """
+        List archived pages in the order they were appended.
+
+        Args:
+            url: Optional URL to list the versions of.
+            series: Optional series to filter on.
+            year: Optional season to filter on.
+
+        Returns:
+            A list of ``ArchivedPage`` objects.
+        """
+        self.refresh()
+        return [page for page in self._pages
+                if (url is None or page.url == url)
+                and (series is None or page.series == series)
+                and (year is None or page.year == year)]
+
+    def latest(self, url, at=None):
+        """
+        Return the latest version of a page.
+
+        Args:
+            url: The URL of the page.
+            at: Optional time, in seconds since the epoch; the latest version
+                fetched at or before it is returned instead.
+
+        Returns:
+            The ``ArchivedPage``, or None if the page was never archived.
+        """
+        self.refresh()
+        if at is None:
+            return self._latest.get(url)
+        versions = [page for page in self._pages if page.url == url and page.fetched <= at]
+        return versions[-1] if versions else None
+
+    def read(self, page):
+        """
+        Read and decompress the body of an archived page.
+
+        Args:
+            page: An ``ArchivedPage`` of this archive.
+
+        Returns:
+            The page body as a string.
+        """
+        data = self._read(page._length, page._offset)
+        if zlib.crc32(data) != page._checksum:
+            raise ValueError(f"Corrupted archive record: {page.url}")
+        return zlib.decompress(data).decode("utf-8")
+
+    def get(self, url, at=None):
+        """
+        Return the body of the latest version of a page.
+
+        Args:
+            url: The URL of the page.
+            at: Optional time limiting the versions considered, see ``latest``.
+
+        Returns:
+            The page body as a string, or None if the page was never archived.
+        """
+        page = self.latest(url, at)
+        return self.read(page) if page is not None else None
+
+    def years(self, series):
+        """
+        Return the sorted seasons with archived pages for a series.
+        """
+        self.refresh()
+        return sorted({page.year for page in self._pages
+                       if page.series == series and page.year is not None})
+
+    def refresh(self):
+        """
+        Index records appended since the archive was opened or last refreshed.
+        """
+        with self._lock:
+            self._scan()
+
+    def close(self):
+        """
+        Close the archive file.
+        """
+        os.close(self._fd)
+
+    def __len__(self):
+        self.refresh()
+        return len(self._pages)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _scan(self, repair=False):
+        # With ``repair`` the file lock is held, so a record that cannot be
+        # parsed at the end of the file was cut short and is dropped.
+        size = os.fstat(self._fd).st_size
+        offset = self._scanned
+        while offset + _HEADER.size <= size:
+            page = self._parse(offset, size)
+            if page is None:
+                following = self._resync(offset + 1, size)
+                if following is None:
+                    break
+                offset = following
+                continue
+            self._pages.append(page)
+            self._latest[page.url] = page
+            offset = page._offset + page._length
+        if repair and offset < size:
+            os.ftruncate(self._fd, offset)
+        self._scanned = offset
+
+    def _parse(self, offset, size):
+        magic, meta_length, length, checksum = _HEADER.unpack(self._read(_HEADER.size, offset))
+        end = offset + _HEADER.size + meta_length + length
+        if magic != _MAGIC or end > size:
+            return None
+        try:
+            meta = json.loads(self._read(meta_length, offset + _HEADER.size))
+            return ArchivedPage(meta["url"], meta["fetched"], meta["series"], meta["year"],
+                                meta["size"], meta["digest"], end - length, length, checksum)
+        except (ValueError, TypeError, KeyError):
+            return None
+
+    def _resync(self, offset, size):
+        # Offset of the next record header that parses, skipping a damaged
+        # record in the middle of the file.
+        while offset + _HEADER.size <= size:
+            data = self._read(min(size - offset, 1 << 20), offset)
+            found = data.find(_MAGIC)
+            while found != -1:
+                if self._parse(offset + found, size) is not None:
+                    return offset + found
+                found = data.find(_MAGIC, found + 1)
+            offset += max(1, len(data) - len(_MAGIC) + 1)
+        return None
+
+    def _lock_file(self):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+
+    def _unlock_file(self):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _read(self, length, offset):
+        if hasattr(os, "pread"):
+            return os.pread(self._fd, length, offset)
+        with self._read_lock:
+            os.lseek(self._fd, offset, os.SEEK_SET)
+            return os.read(self._fd, length)
+
+
+class ArchiveTransport:
+    """
+    Transport serving pages from a ``PageArchive`` instead of the network.
+
+    Pages that were never archived raise ``LookupError``.
+    """
+    def __init__(self, archive, at=None):
+        """
+        Initialize the transport.
+
+        Args:
+            archive: The ``PageArchive`` to read.
+            at: Optional time in seconds since the epoch; pages are served
+                as they were archived at that time.
+        """
+        self.archive = archive
+        self.at = at
+
+    def get(self, url, headers=None, **kwargs):
+        """
+        Return the archived version of a page.
+
+        Args:
+            url: The URL of the page.
+            headers: Ignored, accepted for compatibility with ``HTTPTransport``.
+            **kwargs: Ignored.
+
+        Returns:
+            A ``Response`` with status 200 and the archived body.
+        """
+        text = self.archive.get(url, self.at)
+        if text is None:
+            raise LookupError(f"Page not archived: {url}")
+        return Response(url, 200, {}, text.encode("utf-8"), "utf-8")
+
+
+def reextract(archive, series, years=None, categories=None, processes=None, max_workers=8,
+              parser="html.parser", at=None):
+    """
+    Replay archived pages through the current extractors.
+
+    Archived pages are read in threads and parsed in a process pool with
+    ``bulk.parse_page``, the same worker as ``get_history(processes=...)``;
+    the per-race categories follow their race links inside the archive.
+    Nothing is downloaded.
+
+    Args:
+        archive: The ``PageArchive`` holding the pages.
+        series: The series to re-extract, e.g. "f1".
+        years: Iterable of years, defaults to every season archived for the
+            series.
+        categories: Iterable of category names, defaults to the scraper's
+            ``categories``.
+        processes: Number of worker processes, or an existing
+            ``concurrent.futures.Executor``. Defaults to one per CPU.
+        max_workers: Number of threads reading the archive.
+        parser: HTML parser backend used by the extractors.
+        at: Optional time in seconds since the epoch; pages are replayed as
+            they were archived at that time.
+
+    Returns:
+        A ``CrawlResult`` mapping (year, category) to the extracted data.
+        Pages missing from the archive are reported in ``errors``.
+    """
+    from .bulk import crawl
+    from .scrapers import SCRAPERS
+
+    scraper = SCRAPERS[series](transport=ArchiveTransport(archive, at), parser=parser)
+    scraper.cache = None
+    if years is None:
+        years = archive.years(series)
+    return crawl(scraper, years, categories, max_workers=max_workers, per_host=max_workers,
+                 processes=processes or os.cpu_count() or 1)
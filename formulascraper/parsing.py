@@ -0,0 +1,207 @@
+"""
+Module containing the HTML parser backends used by the scrapers.
+
+Only the results tables are parsed: the BeautifulSoup backends use a
+``SoupStrainer`` and selectolax only serializes the matching rows, so no
+nodes are built for navigation, scripts or footers.
+"""
+import importlib
+import json
+import re
+import warnings
+
+PARSERS = ("html.parser", "lxml", "selectolax")
+
+
+class _SoupTable:
+    """
+    Results table parsed by BeautifulSoup.
+    """
+    def __init__(self, tag):
+        self.tag = tag
+
+    def rows(self, name):
+        return self.tag.find_all(name)
+
+
+class _SelectolaxTable:
+    """
+    Results table parsed by selectolax, rows are returned as markup.
+    """
+    def __init__(self, node):
+        self.node = node
+
+    def rows(self, name):
+        return [row.html for row in self.node.css(name)]
+
+
+def resolve_parser(parser):
+    """
+    Check a parser backend name and fall back to "html.parser" if the
+    backend is not installed.
+
+    Args:
+        parser: One of ``PARSERS``.
+
+    Returns:
+        The name of the backend that will be used.
+    """
+    if parser not in PARSERS:
+        raise ValueError(f"Invalid parser: {parser}")
+    try:
+        if parser == "lxml":
+            importlib.import_module("lxml")
+        elif parser == "selectolax":
+            _selectolax_parser()
+    except ImportError:
+        warnings.warn(f"{parser} is not installed, falling back to html.parser", stacklevel=3)
+        return "html.parser"
+    return parser
+
+
+def _selectolax_parser():
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+        return LexborHTMLParser
+    except ImportError:
+        from selectolax.parser import HTMLParser
+        return HTMLParser
+
+
+def parse_tables(markup, table_class, parser="html.parser"):
+    """
+    Parse the tables with a given class attribute out of a page.
+
+    Args:
+        markup: The page HTML.
+        table_class: The exact ``class`` attribute of the tables.
+        parser: The backend returned by ``resolve_parser``.
+
+    Returns:
+        A list of tables. ``table.rows(name)`` returns the ``name`` elements
+        of a table, either as BeautifulSoup tags or as markup strings, both
+        accepted by ``RowSpec.extract``.
+    """
+    if parser == "selectolax":
+        tree = _selectolax_parser()(markup)
+        return [_SelectolaxTable(node) for node in tree.css(f'table[class="{table_class}"]')]
+
+    from bs4 import BeautifulSoup, SoupStrainer
+    strainer = SoupStrainer("table", class_=table_class)
+    soup = BeautifulSoup(markup, features=parser, parse_only=strainer)
+    return [_SoupTable(tag) for tag in soup.find_all("table", class_=table_class)]
+
+
+def iter_rows(chunks, table_class, name, skip=0, parser="html.parser"):
+    """
+    Incrementally scan a page for the rows of the tables with a given class.
+
+    Rows are yielded as soon as their closing tag has been received, so only
+    the current row is held in memory. Each row is parsed on its own, which
+    gives the same markup as parsing the whole table.
+
+    Args:
+        chunks: Iterable of text chunks of the page.
+        table_class: The exact ``class`` attribute of the tables.
+        name: The row element name, e.g. "tr" or "th".
+        skip: Number of leading elements to skip in each table.
+        parser: The backend returned by ``resolve_parser``.
+
+    Yields:
+        Each row, as accepted by ``RowSpec.extract``.
+    """
+    if parser == "selectolax":
+        # Outside of a table the HTML parser drops row and cell tags.
+        html_parser = _selectolax_parser()
+        for markup in _iter_elements(chunks, table_class, name, skip):
+            yield html_parser(f"<table>{markup}</table>").css_first(name).html
+        return
+
+    from bs4 import BeautifulSoup
+    for markup in _iter_elements(chunks, table_class, name, skip):
+        yield BeautifulSoup(markup, features="html.parser").find(name)
+
+
+def _iter_elements(chunks, table_class, name, skip):
+    table_start = re.compile(rf'<table\b[^>]*\bclass="{re.escape(table_class)}"[^>]*>')
+    element_start = re.compile(rf'<{name}(?=[\s>/])')
+    element_end = f"</{name}>"
+    buffer = ""
+    in_table = False
+    seen = 0
+
+    for chunk in chunks:
+        buffer += chunk
+        while True:
+            if not in_table:
+                match = table_start.search(buffer)
+                if match is None:
+                    buffer = buffer[-1024:]
+                    break
+                buffer = buffer[match.end():]
+                in_table = True
+                seen = 0
+
+            match = element_start.search(buffer)
+            table_end = buffer.find("</table>")
+            if table_end != -1 and (match is None or table_end < match.start()):
+                buffer = buffer[table_end + len("</table>"):]
+                in_table = False
+                continue
+            if match is None:
+                buffer = buffer[-1024:]
+                break
+            end = buffer.find(element_end, match.end())
+            if end == -1:
+                buffer = buffer[match.start():]
+                break
+
+            end += len(element_end)
+            if seen >= skip:
+                yield buffer[match.start():end]
+            seen += 1
+            buffer = buffer[end:]
+
+
+def iter_json_array(chunks, key=None):
+    """
+    Incrementally decode the items of a JSON array.
+
+    Args:
+        chunks: Iterable of text chunks of the JSON document.
+        key: None if the document is an array, otherwise the key of the
+            array in the top-level object, e.g. "races".
+
+    Yields:
+        Each decoded item of the array.
+    """
+    decoder = json.JSONDecoder()
+    start = re.compile(r"\[" if key is None else rf'"{re.escape(key)}"\s*:\s*\[')
+    buffer = ""
+    started = False
+
+    for chunk in chunks:
+        buffer += chunk
+        if not started:
+            match = start.search(buffer)
+            if match is None:
+                continue
+            buffer = buffer[match.end():]
+            started = True
+
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position == len(buffer):
+                break
+            if buffer[position] == "]":
+                return
+            try:
+                item, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break
+            yield item
+        buffer = buffer[position:]
+
+    raise ValueError("Unexpected end of JSON array")
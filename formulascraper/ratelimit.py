@@ -0,0 +1,294 @@
+"""
+Module containing the per-host rate limiter and the retry policy used by the
+HTTP transports.
+"""
+import email.utils
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+def parse_retry_after(value):
+    """
+    Parse a ``Retry-After`` header.
+
+    Args:
+        value: The header value, either a number of seconds or an HTTP date.
+
+    Returns:
+        The number of seconds to wait, or None if the value is missing or
+        cannot be parsed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Retries with jittered exponential backoff.
+
+    The n-th retry waits a random time between 0 and
+    ``min(max_backoff, backoff * 2 ** n)`` seconds ("full jitter"), unless the
+    server sent a ``Retry-After`` header, which is honored as long as it does
+    not exceed ``max_retry_after``.
+    """
+    def __init__(self, retries=3, backoff=0.5, max_backoff=30.0, max_retry_after=120.0,
+                 statuses=(429, 500, 502, 503, 504)):
+        """
+        Initialize the policy.
+
+        Args:
+            retries: Maximum number of retries per request, 0 disables retries.
+            backoff: Base delay in seconds.
+            max_backoff: Upper bound of the computed delay in seconds.
+            max_retry_after: Longest ``Retry-After`` in seconds worth waiting
+                for; longer waits give up at once.
+            statuses: Response status codes that are retried.
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = frozenset(statuses)
+
+    def delay(self, attempt, retry_after=None):
+        """
+        Return how long to wait before retrying.
+
+        Args:
+            attempt: Number of retries already made.
+            retry_after: Seconds requested by the server, if any.
+
+        Returns:
+            The delay in seconds, or None if the request should not be retried.
+        """
+        if attempt >= self.retries:
+            return None
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            return retry_after + random.uniform(0, self.backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at ``rate`` tokens per second up to ``burst``.
+
+    The bucket is not thread-safe on its own, ``RateLimiter`` guards it.
+    """
+    __slots__ = ("rate", "burst", "_tokens", "_updated")
+
+    def __init__(self, rate, burst=None):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Capacity of the bucket, defaults to ``max(1, rate)``.
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    def try_acquire(self, now=None):
+        """
+        Take a token if one is available.
+
+        Args:
+            now: The current ``time.monotonic()``, looked up if omitted.
+
+        Returns:
+            0.0 if a token was taken, otherwise the seconds until one is.
+        """
+        if now is None:
+            now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+
+class _HostState:
+    __slots__ = ("bucket", "limit", "inflight", "blocked_until", "latency", "baseline",
+                 "last_decrease")
+
+    def __init__(self, bucket, limit):
+        self.bucket = bucket
+        self.limit = limit
+        self.inflight = 0
+        self.blocked_until = 0.0
+        self.latency = None
+        self.baseline = None
+        self.last_decrease = 0.0
+
+
+class RateLimiter:
+    """
+    Per-host request rate cap with adaptive concurrency.
+
+    Each host gets a token bucket of ``rate`` requests per second and a
+    concurrency limit. The limit grows additively (about one slot per round
+    of successful requests) and is cut multiplicatively when the host
+    answers 429/5xx, times out, or its smoothed latency exceeds
+    ``latency_tolerance`` times the best latency seen. ``Retry-After``
+    pauses the whole host.
+
+    ``try_acquire`` and ``release`` never block, so one limiter can be
+    shared by threads and event loops; ``acquire`` and ``aacquire`` wait on
+    top of them.
+    """
+    def __init__(self, rate=None, burst=None, initial_concurrency=4, min_concurrency=1,
+                 max_concurrency=32, latency_tolerance=2.0, decrease=0.5):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Requests per second per host, None for no rate cap.
+            burst: Requests allowed back to back, defaults to ``max(1, rate)``.
+            initial_concurrency: Requests in flight per host at start.
+            min_concurrency: Lower bound of the concurrency limit.
+            max_concurrency: Upper bound of the concurrency limit.
+            latency_tolerance: Ratio of smoothed to best latency treated as
+                congestion, None to only react to errors.
+            decrease: Factor applied to the limit on congestion.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.initial_concurrency = initial_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.latency_tolerance = latency_tolerance
+        self.decrease = decrease
+        self._hosts = {}
+        self._condition = threading.Condition()
+
+    def try_acquire(self, url):
+        """
+        Reserve a request slot for a URL without waiting.
+
+        Args:
+            url: The URL about to be requested.
+
+        Returns:
+            A (granted, wait) tuple. If the slot was not granted, wait is the
+            number of seconds until a retry can succeed, or None if it depends
+            on a request in flight being released.
+        """
+        with self._condition:
+            return self._try_acquire(self._host(url))
+
+    def release(self, url, latency=None, throttled=False, retry_after=None):
+        """
+        Release a slot reserved with ``try_acquire`` and adapt the limit.
+
+        Args:
+            url: The URL that was requested.
+            latency: Seconds until the response arrived, None if unknown.
+            throttled: Whether the host signaled overload (429, 5xx or timeout).
+            retry_after: Seconds the host asked to wait, pauses every request.
+
+        Without ``latency`` nor ``throttled`` (e.g. the request failed with an
+        error unrelated to the host's load) only the slot is released.
+        """
+        with self._condition:
+            state = self._host(url)
+            state.inflight = max(0, state.inflight - 1)
+            if latency is None and not throttled and not retry_after:
+                self._condition.notify_all()
+                return
+            now = time.monotonic()
+            if retry_after:
+                state.blocked_until = max(state.blocked_until, now + retry_after)
+
+            congested = throttled
+            if latency is not None and not throttled:
+                state.latency = latency if state.latency is None else 0.8 * state.latency + 0.2 * latency
+                if state.baseline is None or state.latency < state.baseline:
+                    state.baseline = state.latency
+                else:
+                    state.baseline += 0.01 * (state.latency - state.baseline)
+                congested = (self.latency_tolerance is not None
+                             and state.latency > self.latency_tolerance * state.baseline)
+
+            if congested:
+                if now - state.last_decrease >= (state.latency or 0.0):
+                    state.limit = max(self.min_concurrency, state.limit * self.decrease)
+                    state.last_decrease = now
+            else:
+                state.limit = min(self.max_concurrency, state.limit + 1 / state.limit)
+            self._condition.notify_all()
+
+    def acquire(self, url):
+        """
+        Reserve a request slot for a URL, blocking the thread until granted.
+        """
+        with self._condition:
+            state = self._host(url)
+            while True:
+                granted, wait = self._try_acquire(state)
+                if granted:
+                    return
+                self._condition.wait(wait)
+
+    async def aacquire(self, url):
+        """
+        Reserve a request slot for a URL, waiting on the event loop.
+        """
+        import asyncio
+
+        poll = 0.005
+        while True:
+            granted, wait = self.try_acquire(url)
+            if granted:
+                return
+            if wait is None:
+                wait, poll = poll, min(poll * 2, 0.05)
+            await asyncio.sleep(wait)
+
+    def stats(self):
+        """
+        Return the current state of every host.
+
+        Returns:
+            A dictionary mapping each host to its concurrency ``limit``,
+            requests ``inflight`` and smoothed ``latency`` in seconds.
+        """
+        with self._condition:
+            return {
+                host: {"limit": state.limit, "inflight": state.inflight, "latency": state.latency}
+                for host, state in self._hosts.items()
+            }
+
+    def _host(self, url):
+        host = urlsplit(url).netloc
+        state = self._hosts.get(host)
+        if state is None:
+            bucket = TokenBucket(self.rate, self.burst) if self.rate else None
+            state = self._hosts[host] = _HostState(bucket, float(self.initial_concurrency))
+        return state
+
+    def _try_acquire(self, state):
+        now = time.monotonic()
+        if state.blocked_until > now:
+            return False, state.blocked_until - now
+        if state.inflight >= max(1, int(state.limit)):
+            return False, None
+        if state.bucket is not None:
+            wait = state.bucket.try_acquire(now)
+            if wait:
+                return False, wait
+        state.inflight += 1
+        return True, 0.0
@@ -0,0 +1,314 @@
+"""
+Module containing compact typed records for the scraped data.
+
+Records use ``__slots__`` and hold converted values: positions and laps are
+ints (None when not classified), points are floats, lap times are seconds
+and dates are ``datetime.date`` objects. Each record also behaves like a
+read-only mapping with the keys of the dictionaries returned by the
+``get_*_data`` methods of its series, so existing code keeps working.
+"""
+import datetime
+import re
+
+_DATE = re.compile(r"(\d{1,2})\s*([A-Za-z]{3})[A-Za-z]*\.?\s+(\d{4})")
+_MONTHS = {
+    month: number for number, month in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"),
+        start=1,
+    )
+}
+
+
+def parse_int(value):
+    """
+    Convert a position or lap count to an int.
+
+    Args:
+        value: The scraped value, e.g. "1", 3 or "NC".
+
+    Returns:
+        The int, or None if the value is not a number.
+    """
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_float(value):
+    """
+    Convert points to a float.
+
+    Args:
+        value: The scraped value, e.g. "395.5" or 26.
+
+    Returns:
+        The float, or None if the value is not a number.
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_lap_time(value):
+    """
+    Convert a lap time to seconds.
+
+    Args:
+        value: The scraped lap time, e.g. "1:32.608".
+
+    Returns:
+        The lap time in seconds, or None if it cannot be parsed.
+    """
+    try:
+        seconds = 0.0
+        for part in value.strip().split(":"):
+            seconds = seconds * 60 + float(part)
+        return seconds
+    except (AttributeError, ValueError):
+        return None
+
+
+def parse_date(value):
+    """
+    Convert a race date to a ``datetime.date``.
+
+    Args:
+        value: The scraped date, e.g. "28 Mar 2021", "26-28 Mar 2021" or
+            "2023-01-14". For date ranges the last day is used.
+
+    Returns:
+        The date, or None if it cannot be parsed.
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.date.fromisoformat(value[:10])
+    except ValueError:
+        pass
+    matches = _DATE.findall(value)
+    if not matches:
+        return None
+    day, month, year = matches[-1]
+    try:
+        return datetime.date(int(year), _MONTHS[month.lower()], int(day))
+    except (KeyError, ValueError):
+        return None
+
+
+class Record:
+    """
+    Base class for the typed records.
+
+    ``_keys`` maps each series to the (dictionary key, attribute) pairs of
+    the dictionaries returned for that series.
+    """
+    __slots__ = ()
+    _keys = {}
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            setattr(self, name, values.get(name))
+
+    def keys(self):
+        """
+        Return the dictionary keys of the record's series.
+        """
+        return [key for key, _ in self._keys[self.series]]
+
+    def values(self):
+        """
+        Return the values in the order of ``keys``.
+        """
+        return [getattr(self, name) for _, name in self._keys[self.series]]
+
+    def items(self):
+        """
+        Return the (key, value) pairs in the order of ``keys``.
+        """
+        return [(key, getattr(self, name)) for key, name in self._keys[self.series]]
+
+    def get(self, key, default=None):
+        """
+        Return the value of a dictionary key, or ``default`` if missing.
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self):
+        """
+        Return the record as a dictionary with the keys of its series.
+        """
+        return dict(self.items())
+
+    def __getitem__(self, key):
+        for name, attribute in self._keys[self.series]:
+            if name == key:
+                return getattr(self, attribute)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self._keys[self.series])
+
+    def __contains__(self, key):
+        return any(name == key for name, _ in self._keys[self.series])
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self):
+        # Consistent with __eq__, so records can be deduplicated in sets;
+        # a record used as a key must not be modified.
+        return hash((type(self),) + tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+
+class DriverStanding(Record):
+    """
+    A driver's championship standing.
+    """
+    __slots__ = ("series", "position", "name", "first_name", "last_name",
+                 "nationality", "team", "points")
+    _keys = {
+        "f1": (("position", "position"), ("name", "name"), ("nationality", "nationality"),
+               ("car", "team"), ("points", "points")),
+        "f1academy": (("position", "position"), ("name", "name"), ("points", "points")),
+        "f2": (("position", "position"), ("name", "name"), ("points", "points")),
+        "f3": (("position", "position"), ("name", "name"), ("points", "points")),
+        "fe": (("driverTeamName", "team"), ("driverPosition", "position"),
+               ("driverFirstName", "first_name"), ("driverLastName", "last_name"),
+               ("driverCountry", "nationality"), ("driverPoints", "points")),
+    }
+
+
+class RaceResult(Record):
+    """
+    A race of the season calendar, with its winner when available.
+    """
+    __slots__ = ("series", "grandprix", "date", "winner", "team", "laps")
+    _keys = {
+        "f1": (("grandprix", "grandprix"), ("date", "date"), ("winner", "winner"),
+               ("car", "team"), ("laps", "laps")),
+        "f1academy": (("grandprix", "grandprix"), ("date", "date")),
+        "f2": (("grandprix", "grandprix"), ("date", "date")),
+        "f3": (("grandprix", "grandprix"), ("date", "date")),
+        "fe": (("raceName", "grandprix"), ("raceDate", "date")),
+    }
+
+
+class TeamStanding(Record):
+    """
+    A team's championship standing.
+    """
+    __slots__ = ("series", "position", "team", "points")
+    _keys = {
+        "f1": (("position", "position"), ("team", "team"), ("points", "points")),
+        "f1academy": (("position", "position"), ("team", "team"), ("points", "points")),
+        "f2": (("position", "position"), ("team", "team"), ("points", "points")),
+        "f3": (("position", "position"), ("team", "team"), ("points", "points")),
+        "fe": (("teamName", "team"), ("teamPosition", "position"), ("teamPoints", "points")),
+    }
+
+
+class FastestLap(Record):
+    """
+    The fastest lap of a grand prix.
+    """
+    __slots__ = ("series", "grandprix", "driver", "team", "lap_time")
+    _keys = {
+        "f1": (("grandprix", "grandprix"), ("driver", "driver"), ("team", "team"),
+               ("lap_time", "lap_time")),
+    }
+
+
+class RaceClassification(Record):
+    """
+    A driver's result in one race.
+    """
+    __slots__ = ("series", "grandprix", "date", "position", "number", "driver", "first_name",
+                 "last_name", "team", "laps", "time", "points")
+    _keys = {
+        "f1": (("grandprix", "grandprix"), ("date", "date"), ("position", "position"),
+               ("number", "number"), ("driver", "driver"), ("car", "team"), ("laps", "laps"),
+               ("time", "time"), ("points", "points")),
+        "fe": (("raceName", "grandprix"), ("raceDate", "date"), ("driverPosition", "position"),
+               ("driverNumber", "number"), ("driverFirstName", "first_name"),
+               ("driverLastName", "last_name"), ("driverTeamName", "team"),
+               ("driverLaps", "laps"), ("driverTime", "time"), ("driverPoints", "points")),
+    }
+
+
+RECORD_TYPES = {
+    "drivers": DriverStanding,
+    "races": RaceResult,
+    "teams": TeamStanding,
+    "fastest_laps": FastestLap,
+    "race_results": RaceClassification,
+}
+
+# Types of the non-string record fields, and of the season year the columnar
+# exports add to every row. Other fields are strings.
+FIELD_TYPES = {
+    "year": "int",
+    "position": "int",
+    "laps": "int",
+    "number": "int",
+    "points": "float",
+    "lap_time": "float",
+    "date": "date",
+}
+
+
+def to_record(series, category, row):
+    """
+    Convert a dictionary returned by a ``get_*_data`` method to a record.
+
+    Args:
+        series: The series of the scraper, e.g. "f1" or "fe".
+        category: The category of the data, e.g. "drivers".
+        row: The dictionary to convert.
+
+    Returns:
+        The matching ``DriverStanding``, ``RaceResult``, ``TeamStanding``,
+        ``FastestLap`` or ``RaceClassification`` record.
+    """
+    record_type = RECORD_TYPES[category]
+    values = {attribute: row[key] for key, attribute in record_type._keys[series]}
+    values["series"] = series
+
+    if record_type is DriverStanding:
+        values["position"] = parse_int(values["position"])
+        values["points"] = parse_float(values["points"])
+        if series == "fe":
+            values["name"] = f'{values["first_name"]} {values["last_name"]}'
+    elif record_type is RaceResult:
+        values["date"] = parse_date(values["date"])
+        values["laps"] = parse_int(values.get("laps"))
+    elif record_type is TeamStanding:
+        values["position"] = parse_int(values["position"])
+        values["points"] = parse_float(values["points"])
+    elif record_type is RaceClassification:
+        if series == "fe":
+            values["driver"] = f'{values["first_name"] or ""} {values["last_name"] or ""}'.strip()
+        values["date"] = parse_date(values["date"])
+        values["position"] = parse_int(values["position"])
+        values["number"] = parse_int(values["number"])
+        values["laps"] = parse_int(values["laps"])
+        values["points"] = parse_float(values["points"])
+    else:
+        values["lap_time"] = parse_lap_time(values["lap_time"])
+
+    return record_type(**values)
@@ -0,0 +1,1302 @@
+"""
+Module containing classes for scraping data from Formula websites.
+"""
+import contextvars
+import datetime
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+from .bulk import crawl
+from .cache import get_default_cache
+from .extract import RowSpec
+from .memo import SingleFlight
+from .metrics import ScrapeEvent, current_call, end_call, start_call
+from .parsing import iter_json_array, iter_rows, parse_tables, resolve_parser
+from .records import to_record
+from .transport import HTTPStatusError, Response, _accepts, get_default_transport
+
+
+_F1_DRIVER_ROW = RowSpec(
+    ("position", r'<td class="dark">(.*?)</td>'),
+    ("name", r'<span class="hide-for-tablet">(.*?)</span>', False),
+    ("surname", r'<span class="hide-for-mobile">(.*?)</span>'),
+    ("nationality", r'<td class="dark semi-bold uppercase">(.*?)</td>'),
+    ("car", r'.html">(.*?)</a>'),
+    ("points", r'<td class="dark bold">(.*?)</td>'),
+)
+
+_F1_RACE_ROW = RowSpec(
+    ("grandprix", r'html">\n {24}(.*?)\n {20}</a>'),
+    ("date", r'<td class="dark hide-for-mobile">(.*?)</td>', False),
+    ("winner_name", r'<span class="hide-for-tablet">(.*?)</span>', False),
+    ("winner_surname", r'<span class="hide-for-mobile">(.*?)</span>'),
+    ("car", r'<td class="semi-bold uppercase">(.*?)</td>'),
+    ("laps", r'<td class="bold hide-for-mobile">(.*?)</td>'),
+)
+
+_F1_TEAM_ROW = RowSpec(
+    ("position", r'<td class="dark">(.*?)</td>'),
+    ("team", r'.html">(.*?)</a>\n</td>\n'),
+    ("points", r'<td class="dark bold">(.*?)</td>'),
+)
+
+_F1_FASTEST_LAP_ROW = RowSpec(
+    ("grandprix", r'<td class="width30 dark">(.*?)</td>', False),
+    ("driver_surname", r'<span class="hide-for-mobile">(.*?)</span>', False),
+    ("team", r'<td class="width25 semi-bold uppercase">(.*?)</td>'),
+    ("lap_time", r'<td class="dark bold">(.*?)</td>', False),
+)
+
+_F1_RACE_LINK = RowSpec(
+    ("grandprix", r'html">\n {24}(.*?)\n {20}</a>'),
+    ("date", r'<td class="dark hide-for-mobile">(.*?)</td>', False),
+    ("href", r'href="([^"]*?/race-result\.html)"'),
+)
+
+# Laps, time and points are the three cells following the car cell.
+_F1_RACE_RESULT_ROW = RowSpec(
+    ("position", r'<td class="dark">(.*?)</td>'),
+    ("number", r'<td class="dark hide-for-mobile">(.*?)</td>'),
+    ("name", r'<span class="hide-for-tablet">(.*?)</span>', False),
+    ("surname", r'<span class="hide-for-mobile">(.*?)</span>'),
+    ("car", r'<td class="semi-bold uppercase hide-for-tablet">(.*?)</td>'),
+    ("laps", r'hide-for-tablet">[^<]*</td>\s*<td[^>]*>(.*?)</td>'),
+    ("time", r'hide-for-tablet">[^<]*</td>\s*<td[^>]*>.*?</td>\s*<td[^>]*>(.*?)</td>'),
+    ("points", r'hide-for-tablet">[^<]*</td>\s*<td[^>]*>.*?</td>\s*<td[^>]*>.*?</td>\s*<td[^>]*>(.*?)</td>'),
+)
+
+_STANDINGS_ROW = RowSpec(
+    ("position", r'<div class="pos">(.*?)</div>'),
+    ("name", r'<span class="visible-desktop-up">(.*?)</span>'),
+    ("points", r'<div class="total-points">(.*?)</div>'),
+)
+
+_STANDINGS_RACE_HEADER = RowSpec(
+    ("grandprix", r'<div class="country-name"><span>(.*?)</span></div>'),
+    ("date", r'<div class="dates">(.*?)</div>'),
+)
+
+
+def _copy_rows(rows):
+    return [dict(row) for row in rows]
+
+
+def _check_status(response):
+    if not 200 <= response.status_code < 300:
+        raise HTTPStatusError(response)
+    return response
+
+
+def _advance(steps, text):
+    # Race pages are scraped by generators that yield the URL they need next
+    # and receive its body, so the sync and async getters can drive them.
+    try:
+        return False, steps.send(text)
+    except StopIteration as stop:
+        return True, stop.value
+
+
+class _BaseScraper:
+    """
+    Base class holding the HTTP transports shared by all scrapers.
+
+    Every category is scraped in two steps: ``_build_url`` validates the year
+    and returns the page to download, ``_parse_page`` turns the page body into
+    a list of dictionaries. The sync and async getters only differ in how the
+    page is downloaded.
+
+    ``extra_categories`` are scraped with one request per race: the season
+    calendar is downloaded, then every race page is fetched concurrently.
+    They are only crawled when asked for explicitly.
+    """
+    series = None
+    categories = ()
+    extra_categories = ()
+
+    def __init__(self, transport=None, async_transport=None, cache=None, parser="html.parser",
+                 collector=None, race_workers=8, archive=None, memo=None):
+        """
+        Initialize the scraper with its HTTP transports.
+
+        Args:
+            transport: Object with a ``get(url)`` method used for all requests.
+                Defaults to the shared, connection-pooled ``HTTPTransport``.
+            async_transport: Object with a coroutine ``get(url)`` method used by
+                the ``aget_*`` methods. Defaults to the shared
+                ``AsyncHTTPTransport`` of the running event loop.
+            cache: ``ResponseCache`` used for all requests. Defaults to the
+                cache set with ``set_default_cache``, if any.
+            parser: HTML parser backend, one of "html.parser", "lxml" or
+                "selectolax". Falls back to "html.parser" if not installed.
+            collector: Callable receiving a ``ScrapeEvent`` for every request,
+                parse, extraction and getter call, e.g. a ``StatsCollector``.
+                Nothing is measured when it is None.
+            race_workers: Number of race pages fetched at the same time for
+                the per-race categories.
+            archive: ``PageArchive`` receiving the body of every page
+                fetched, so it can be re-extracted later without the network.
+            memo: ``Memo`` reusing the results of ``get_data``/``aget_data``
+                for its TTL. Without it, only concurrent calls for the same
+                category and year are coalesced into one scrape.
+        """
+        self._transport = transport
+        self.async_transport = async_transport
+        self.cache = cache if cache is not None else get_default_cache()
+        self.parser = resolve_parser(parser)
+        self.collector = collector
+        self.race_workers = race_workers
+        self.archive = archive
+        self.memo = memo
+        self._flight = SingleFlight()
+
+    @property
+    def transport(self):
+        """
+        The HTTP transport, the shared ``HTTPTransport`` unless one was passed.
+        """
+        if self._transport is None:
+            self._transport = get_default_transport()
+        return self._transport
+
+    @transport.setter
+    def transport(self, transport):
+        self._transport = transport
+
+    def get_data(self, category, year):
+        """
+        Scrape the data of any supported category for a specific year.
+
+        Concurrent calls for the same category and year share one scrape,
+        and every caller receives its own copy of the rows.
+
+        Args:
+            category: One of the names in ``categories``, e.g. "drivers".
+            year: The year for which to retrieve data.
+
+        Returns:
+            A list of dictionaries, as returned by the matching ``get_*_data``.
+        """
+        if self.memo is not None:
+            rows = self.memo.get_or_compute((self.series, category, year), self._get_data, category, year)
+        else:
+            rows = self._flight.do((category, year), self._get_data, category, year)
+        return _copy_rows(rows)
+
+    def supports(self, category):
+        """
+        Return whether a category, including the per-race ones, can be scraped.
+        """
+        return category in self.categories or category in self.extra_categories
+
+    def available_years(self, category, years=None):
+        """
+        Return the years for which a category can be scraped.
+
+        Args:
+            category: One of the names in ``categories``, e.g. "drivers".
+            years: Iterable of candidate years, defaults to 1950 up to the
+                current year.
+
+        Returns:
+            A list of the candidate years the scraper accepts.
+        """
+        self._check_category(category)
+        if years is None:
+            years = range(1950, datetime.date.today().year + 1)
+        available = []
+        for year in years:
+            try:
+                self._build_url(category, year)
+            except ValueError:
+                continue
+            available.append(year)
+        return available
+
+    def get_records(self, category, year):
+        """
+        Scrape the data of a category as compact typed records.
+
+        Args:
+            category: One of the names in ``categories``, e.g. "drivers".
+            year: The year for which to retrieve data.
+
+        Returns:
+            A list of ``DriverStanding``, ``RaceResult``, ``TeamStanding``,
+            ``FastestLap`` or ``RaceClassification`` records, which can also
+            be read like the dictionaries returned by ``get_data``.
+        """
+        return [to_record(self.series, category, row) for row in self.get_data(category, year)]
+
+    def iter_records(self, category, year):
+        """
+        Streaming counterpart of ``get_records``.
+        """
+        for row in self.iter_data(category, year):
+            yield to_record(self.series, category, row)
+
+    def get_history(self, years, categories=None, max_workers=8, per_host=4, processes=None):
+        """
+        Scrape many seasons and categories in parallel.
+
+        Failed items do not abort the crawl, they are reported in the
+        ``errors`` attribute of the result instead.
+
+        Args:
+            years: Iterable of years, e.g. ``range(1950, 2024)``.
+            categories: Iterable of category names, defaults to ``categories``.
+            max_workers: Number of threads fetching and parsing pages.
+            per_host: Maximum number of requests in flight per host.
+            processes: Number of worker processes parsing the pages, or an
+                existing process pool, for crawls limited by parsing speed.
+                Defaults to parsing in the download threads.
+
+        Returns:
+            A ``CrawlResult`` dictionary mapping (year, category) to the data.
+        """
+        return crawl(self, years, categories, max_workers=max_workers, per_host=per_host,
+                     processes=processes)
+
+    def iter_data(self, category, year):
+        """
+        Stream the data of any supported category for a specific year.
+
+        The page is downloaded in chunks and each row is yielded as soon as
+        it has been received and parsed, so memory use stays flat.
+
+        Args:
+            category: One of the names in ``categories``, e.g. "drivers".
+            year: The year for which to retrieve data.
+
+        Yields:
+            The dictionaries returned by the matching ``get_*_data``, one by one.
+        """
+        url = self._build_url(category, year)
+        if category in self.extra_categories:
+            yield from self._iter_races(category, self._fetch(url, year).text, year)
+            return
+        yield from self._iter_page(category, self._stream(url, year), year)
+
+    def iter_drivers_data(self, year):
+        """
+        Streaming counterpart of ``get_drivers_data``.
+        """
+        return self.iter_data("drivers", year)
+
+    def iter_races_data(self, year):
+        """
+        Streaming counterpart of ``get_races_data``.
+        """
+        return self.iter_data("races", year)
+
+    def iter_teams_data(self, year):
+        """
+        Streaming counterpart of ``get_teams_data``.
+        """
+        return self.iter_data("teams", year)
+
+    async def aget_data(self, category, year):
+        """
+        Asynchronously scrape the data of any supported category for a year.
+
+        The page is downloaded on the event loop and parsed in a worker thread.
+
+        Args:
+            category: One of the names in ``categories``, e.g. "drivers".
+            year: The year for which to retrieve data.
+
+        Returns:
+            A list of dictionaries, as returned by the matching ``get_*_data``.
+        """
+        if self.memo is not None:
+            rows = await self.memo.aget_or_compute((self.series, category, year), self._aget_data,
+                                                   category, year)
+        else:
+            rows = await self._flight.ado((category, year), self._aget_data, category, year)
+        return _copy_rows(rows)
+
+    async def _aget_data(self, category, year):
+        url = self._build_url(category, year)
+        if self.collector is None:
+            return await self._ascrape(category, url, year)
+
+        stats, token = start_call(category, year)
+        start = time.perf_counter()
+        rows = error = None
+        try:
+            rows = await self._ascrape(category, url, year)
+            return rows
+        except Exception as exception:
+            error = exception
+            raise
+        finally:
+            end_call(token)
+            self._emit_call(stats, time.perf_counter() - start, rows, error)
+
+    async def aget_drivers_data(self, year):
+        """
+        Asynchronous counterpart of ``get_drivers_data``.
+        """
+        return await self.aget_data("drivers", year)
+
+    async def aget_races_data(self, year):
+        """
+        Asynchronous counterpart of ``get_races_data``.
+        """
+        return await self.aget_data("races", year)
+
+    async def aget_teams_data(self, year):
+        """
+        Asynchronous counterpart of ``get_teams_data``.
+        """
+        return await self.aget_data("teams", year)
+
+    def _get_data(self, category, year):
+        if self.collector is None:
+            return self._scrape(category, year)
+        return self._observed(self._scrape, category, year)
+
+    def _check_category(self, category):
+        if not self.supports(category):
+            raise ValueError(f"Invalid category: {category}")
+
+    def _is_final(self, year):
+        return year is not None and year < datetime.date.today().year
+
+    def _scrape(self, category, year):
+        url = self._build_url(category, year)
+        response = self._fetch(url, year)
+        if category in self.extra_categories:
+            return list(self._iter_races(category, response.text, year))
+        return self._parse_page(category, response.text, year)
+
+    async def _ascrape(self, category, url, year):
+        import asyncio
+
+        response = await self._afetch(url, year)
+        if category not in self.extra_categories:
+            return await asyncio.to_thread(self._parse_page, category, response.text, year)
+
+        races = await asyncio.to_thread(self._unique_races, category, response.text, year)
+        semaphore = asyncio.Semaphore(self.race_workers)
+
+        async def scrape_race(race):
+            steps = self._race_steps(category, race, year)
+            async with semaphore:
+                done, value = _advance(steps, None)
+                while not done:
+                    text = (await self._afetch(value, year)).text
+                    done, value = await asyncio.to_thread(_advance, steps, text)
+            return value
+
+        results = await asyncio.gather(*(scrape_race(race) for race in races))
+        return [row for rows in results for row in rows]
+
+    def _iter_races(self, category, text, year, fetch=None):
+        # fetch(url, year) downloads the race pages, defaults to _fetch.
+        races = self._unique_races(category, text, year)
+        if not races:
+            return
+        fetch = fetch or self._fetch
+        with ThreadPoolExecutor(max_workers=max(1, min(self.race_workers, len(races)))) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, self._scrape_race,
+                                       category, race, year, fetch)
+                       for race in races]
+            for future in futures:
+                yield from future.result()
+
+    def _unique_races(self, category, text, year):
+        races = {}
+        for key, race in self._race_index(category, text, year):
+            races.setdefault(key, race)
+        return list(races.values())
+
+    def _scrape_race(self, category, race, year, fetch):
+        steps = self._race_steps(category, race, year)
+        done, value = _advance(steps, None)
+        while not done:
+            done, value = _advance(steps, fetch(value, year).text)
+        return value
+
+    def _observed(self, function, category, year):
+        stats, token = start_call(category, year)
+        start = time.perf_counter()
+        rows = error = None
+        try:
+            rows = function(category, year)
+            return rows
+        except Exception as exception:
+            error = exception
+            raise
+        finally:
+            end_call(token)
+            self._emit_call(stats, time.perf_counter() - start, rows, error)
+
+    def _emit(self, kind, category, year, **values):
+        self.collector(ScrapeEvent(kind, self.series, category, year, **values))
+
+    def _emit_call(self, stats, duration, rows, error):
+        count = len(rows) if rows is not None else None
+        self._emit("parse", stats.category, stats.year, duration=stats.parse)
+        self._emit("extract", stats.category, stats.year, rows=count,
+                   duration=max(0.0, duration - stats.network - stats.parse))
+        self._emit("call", stats.category, stats.year, rows=count, duration=duration,
+                   error=repr(error) if error is not None else None)
+
+    def _emit_request(self, url, year, response, duration, error=None):
+        stats = current_call()
+        if stats is not None:
+            stats.network += duration
+            year = stats.year
+        values = {"url": url, "duration": duration}
+        if error is not None:
+            values["error"] = repr(error)
+        else:
+            # Timings of the last attempt, without the back-off between retries.
+            latency = getattr(response, "latency", None)
+            if latency is not None:
+                values["duration"] = latency
+            elapsed = getattr(response, "elapsed", None)
+            ttfb = elapsed.total_seconds() if elapsed is not None else None
+            values.update(status=response.status_code, bytes=len(response.content), ttfb=ttfb,
+                          transfer=max(0.0, values["duration"] - ttfb) if ttfb is not None else None)
+        self._emit("request", stats.category if stats is not None else None, year, **values)
+
+    def _emit_cache_hit(self, url, year, response, duration):
+        stats = current_call()
+        if stats is not None:
+            stats.network += duration
+            year = stats.year
+        self._emit("cache_hit", stats.category if stats is not None else None, year, url=url,
+                   bytes=len(response.content), duration=duration)
+
+    def _timed_parse(self, function, *args):
+        stats = current_call() if self.collector is not None else None
+        if stats is None:
+            return function(*args)
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            stats.parse += time.perf_counter() - start
+
+    def _fetch(self, url, year=None):
+        if self.cache is None:
+            response = self._request(url, year)
+        else:
+            final = self._is_final(year)
+            start = time.perf_counter()
+            cached, headers = self.cache.lookup(url)
+            if cached is not None:
+                response = cached
+                if self.collector is not None:
+                    self._emit_cache_hit(url, year, response, time.perf_counter() - start)
+            else:
+                response = self.cache.update(url, self._request(url, year, headers), final)
+                if response.status_code == 304:
+                    # The cached body was evicted after the lookup.
+                    response = self.cache.update(url, self._request(url, year), final)
+        _check_status(response)
+        if self.archive is not None:
+            self.archive.record(url, response, self.series, year)
+        return response
+
+    def _request(self, url, year, headers=None):
+        kwargs = {"headers": headers} if headers and _accepts(self.transport.get, "headers") else {}
+        if self.collector is None:
+            return self.transport.get(url, **kwargs)
+        start = time.perf_counter()
+        try:
+            response = self.transport.get(url, **kwargs)
+        except Exception as error:
+            self._emit_request(url, year, None, time.perf_counter() - start, error)
+            raise
+        self._emit_request(url, year, response, time.perf_counter() - start)
+        return response
+
+    def _stream(self, url, year=None):
+        final = self._is_final(year)
+        if self.cache is not None:
+            cached, headers = self.cache.lookup(url)
+            if cached is not None:
+                yield cached.text
+                return
+            if headers:
+                # A stale copy is revalidated, usually a body-less 304.
+                yield self._fetch(url, year).text
+                return
+        stream = getattr(self.transport, "stream", None)
+        if stream is None:
+            yield self._fetch(url, year).text
+            return
+        # The status is checked before the body is read, and the response is
+        # kept for its validators. Pages with an unknown status are neither
+        # cached nor archived.
+        responses = []
+        kwargs = {}
+        if _accepts(stream, "on_response"):
+            kwargs["on_response"] = lambda response: responses.append(_check_status(response))
+        if self.cache is None and self.archive is None:
+            yield from stream(url, **kwargs)
+            return
+        chunks = []
+        for chunk in stream(url, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        if not responses or responses[0].status_code != 200:
+            return
+        text = "".join(chunks)
+        if self.cache is not None:
+            self.cache.update(url, Response(url, 200, responses[0].headers, text.encode("utf-8"), "utf-8"),
+                              final)
+        if self.archive is not None:
+            self.archive.add(url, text, self.series, year)
+
+    async def _afetch(self, url, year=None):
+        import asyncio
+
+        if self.cache is None:
+            response = await self._arequest(url, year)
+        else:
+            final = self._is_final(year)
+            start = time.perf_counter()
+            cached, headers = await asyncio.to_thread(self.cache.lookup, url)
+            if cached is not None:
+                response = cached
+                if self.collector is not None:
+                    self._emit_cache_hit(url, year, response, time.perf_counter() - start)
+            else:
+                response = await self._arequest(url, year, headers)
+                response = await asyncio.to_thread(self.cache.update, url, response, final)
+                if response.status_code == 304:
+                    response = await self._arequest(url, year)
+                    response = await asyncio.to_thread(self.cache.update, url, response, final)
+        _check_status(response)
+        if self.archive is not None:
+            await asyncio.to_thread(self.archive.record, url, response, self.series, year)
+        return response
+
+    async def _arequest(self, url, year, headers=None):
+        transport = self.async_transport
+        if transport is None:
+            from .aio import get_default_async_transport
+            transport = get_default_async_transport()
+        kwargs = {"headers": headers} if headers and _accepts(transport.get, "headers") else {}
+        if self.collector is None:
+            return await transport.get(url, **kwargs)
+        start = time.perf_counter()
+        try:
+            response = await transport.get(url, **kwargs)
+        except Exception as error:
+            self._emit_request(url, year, None, time.perf_counter() - start, error)
+            raise
+        self._emit_request(url, year, response, time.perf_counter() - start)
+        return response
+
+    def _build_url(self, category, year):
+        raise NotImplementedError
+
+    def _parse_page(self, category, text, year):
+        raise NotImplementedError
+
+    def _iter_page(self, category, chunks, year):
+        raise NotImplementedError
+
+    def _race_index(self, category, text, year):
+        raise NotImplementedError
+
+    def _race_steps(self, category, race, year):
+        raise NotImplementedError
+
+
+class Formula1Scraper(_BaseScraper):
+    """
+    Class for scraping Formula 1 data from the official website.
+    """
+    series = "f1"
+    categories = ("drivers", "races", "teams", "fastest_laps")
+    extra_categories = ("race_results",)
+
+    def __init__(self, **options):
+        """
+        Initialize the class with the base URL for the website.
+
+        Args:
+            **options: Options shared by all scrapers, such as ``transport``
+                or ``cache`` (see the README).
+        """
+        super().__init__(**options)
+        self.base_url_f1 = "https://www.formula1.com/en/results.html/"
+
+    def get_drivers_data(self, year):
+        """
+        Scrape the driver data for a specific year.
+
+        Args:
+            year: The year for which to retrieve driver data.
+
+        Returns:
+            A list of dictionaries containing driver information for each driver.
+        """
+        return self.get_data("drivers", year)
+
+    def get_races_data(self, year):
+        """
+        Scrape the race data for a specific year.
+
+        Args:
+            year: The year for which to retrieve race data.
+
+        Returns:
+            A list of dictionaries containing race information for each race.
+        """
+        return self.get_data("races", year)
+
+    def get_teams_data(self, year):
+        """
+        Scrape the team data for a specific year.
+
+        Args:
+            year: The year for which to retrieve race data.
+
+        Returns:
+            A list of dictionaries containing team information for each team.
+        """
+        return self.get_data("teams", year)
+
+    def get_fastest_laps_data(self, year):
+        """
+        Scrape the fastest laps data for a specific year.
+
+        Args:
+            year: The year for which to retrieve fastest laps data.
+
+        Returns:
+            A list of dictionaries containing team information of fastests for each grandprix.
+        """
+        return self.get_data("fastest_laps", year)
+
+    def get_race_results_data(self, year):
+        """
+        Scrape the full classification of every race of a specific year.
+
+        The race result pages are fetched concurrently, ``race_workers`` at
+        a time.
+
+        Args:
+            year: The year for which to retrieve race results.
+
+        Returns:
+            A list of dictionaries with one entry per driver and race, in
+            calendar and finishing order.
+        """
+        return self.get_data("race_results", year)
+
+    async def aget_race_results_data(self, year):
+        """
+        Asynchronous counterpart of ``get_race_results_data``.
+        """
+        return await self.aget_data("race_results", year)
+
+    def iter_fastest_laps_data(self, year):
+        """
+        Streaming counterpart of ``get_fastest_laps_data``.
+        """
+        return self.iter_data("fastest_laps", year)
+
+    async def aget_fastest_laps_data(self, year):
+        """
+        Asynchronous counterpart of ``get_fastest_laps_data``.
+        """
+        return await self.aget_data("fastest_laps", year)
+
+    def _build_url(self, category, year):
+        self._check_category(category)
+        if year < (1958 if category == "teams" else 1950):
+            raise ValueError(f"Invalid year: {year}")
+        page = {
+            "drivers": "drivers.html",
+            "races": "races.html",
+            "teams": "team.html",
+            "fastest_laps": "fastest-laps.html",
+            "race_results": "races.html",
+        }[category]
+        return f"{self.base_url_f1}{year}/{page}"
+
+    def _parse_page(self, category, text, year):
+        extract = self._row_extractor(category)
+        data = []
+        for table in self._timed_parse(parse_tables, text, 'resultsarchive-table', self.parser):
+            for row in table.rows('tr')[1:]:
+                data.append(extract(row))
+
+        return data
+
+    def _iter_page(self, category, chunks, year):
+        extract = self._row_extractor(category)
+        for row in iter_rows(chunks, 'resultsarchive-table', 'tr', 1, self.parser):
+            yield extract(row)
+
+    def _race_index(self, category, text, year):
+        for table in self._timed_parse(parse_tables, text, 'resultsarchive-table', self.parser):
+            for row in table.rows('tr')[1:]:
+                grandprix, date, href = _F1_RACE_LINK.extract(row)
+                url = urljoin(self.base_url_f1, href)
+                yield url, {"grandprix": grandprix, "date": date, "url": url}
+
+    def _race_steps(self, category, race, year):
+        text = yield race["url"]
+        data = []
+        for table in self._timed_parse(parse_tables, text, 'resultsarchive-table', self.parser):
+            for row in table.rows('tr')[1:]:
+                data.append(self._extract_race_result_info(row, race))
+
+        return data
+
+    def _row_extractor(self, category):
+        return {
+            "drivers": self._extract_driver_info,
+            "races": self._extract_race_info,
+            "teams": self._extract_team_info,
+            "fastest_laps": self._extract_fastest_lap_info,
+        }[category]
+
+    def _extract_driver_info(self, row):
+        position, driver_name, driver_surname, nationality, car, points = _F1_DRIVER_ROW.extract(row)
+
+        driver_info = {
+            "position": position,
+            "name": f"{driver_name} {driver_surname}",
+            "nationality": nationality,
+            "car": car,
+            "points": points
+        }
+
+        return driver_info
+
+    def _extract_race_info(self, row):
+        grandprix, date, winner_name, winner_surname, car, laps = _F1_RACE_ROW.extract(row)
+
+        race_info = {
+            "grandprix": grandprix,
+            "date": date,
+            "winner": f"{winner_name} {winner_surname}",
+            "car": car,
+            "laps": laps
+        }
+
+        return race_info
+
+    def _extract_team_info(self, row):
+        position, team, points = _F1_TEAM_ROW.extract(row)
+
+        team_info = {
+            "position": position,
+            "team": team,
+            "points": points
+        }
+
+        return team_info
+
+    def _extract_race_result_info(self, row, race):
+        position, number, driver_name, driver_surname, car, laps, race_time, points = \
+            _F1_RACE_RESULT_ROW.extract(row)
+
+        race_result_info = {
+            "grandprix": race["grandprix"],
+            "date": race["date"],
+            "position": position,
+            "number": number,
+            "driver": f"{driver_name} {driver_surname}",
+            "car": car,
+            "laps": laps,
+            "time": race_time,
+            "points": points
+        }
+
+        return race_result_info
+
+    def _extract_fastest_lap_info(self, row):
+        grandprix, driver_surname, team, lap_time = _F1_FASTEST_LAP_ROW.extract(row)
+
+        fastest_lap_info = {
+            "grandprix": grandprix,
+            "driver": f"{driver_surname}",
+            "team": team,
+            "lap_time": lap_time
+        }
+
+        return fastest_lap_info
+
+class _StandingsScraper(_BaseScraper):
+    """
+    Base class for the series sharing the FIA standings website layout
+    (Formula 1 Academy, Formula 2 and Formula 3).
+    """
+    categories = ("drivers", "races", "teams")
+
+    def __init__(self, page_ttl=0, **options):
+        """
+        Initialize the page memo shared by the getters.
+
+        The drivers and races data come from the same standings page, so
+        concurrent getters, sync or async, download and parse it once, and
+        parsed pages can be kept for ``page_ttl`` seconds to be reused by
+        getters called back to back.
+
+        Args:
+            page_ttl: Seconds a parsed page is reused, 0 disables the memo.
+            **options: Options shared by all scrapers, such as ``transport``
+                or ``cache`` (see the README).
+        """
+        super().__init__(**options)
+        self.page_ttl = page_ttl
+        self._pages = OrderedDict()
+        self._pages_lock = threading.Lock()
+        self._page_flight = SingleFlight()
+
+    def get_season_bundle(self, year):
+        """
+        Scrape the drivers, races and teams data of a season, downloading
+        and parsing each distinct page once.
+
+        Args:
+            year: The year for which to retrieve data.
+
+        Returns:
+            A dictionary with the "drivers", "races" and "teams" lists.
+        """
+        pages = {}
+
+        def scrape(category, year):
+            url = self._build_url(category, year)
+            if url not in pages:
+                pages[url] = self._page_tables(url, year)
+            return self._extract_tables(category, pages[url], year)
+
+        if self.collector is None:
+            return {category: scrape(category, year) for category in self.categories}
+        return {category: self._observed(scrape, category, year) for category in self.categories}
+
+    def get_drivers_data(self, year):
+        """
+        Scrape the driver data for a specific year.
+
+        Args:
+            year: The year for which to retrieve driver data.
+
+        Returns:
+            A list of dictionaries containing driver information for each driver.
+        """
+        return self.get_data("drivers", year)
+
+    def get_races_data(self, year):
+        """
+        Scrape the race data for a specific year.
+
+        Args:
+            year: The year for which to retrieve race data.
+
+        Returns:
+            A list of dictionaries containing race information for each race.
+        """
+        return self.get_data("races", year)
+
+    def get_teams_data(self, year):
+        """
+        Scrape the team data for a specific year.
+
+        Args:
+            year: The year for which to retrieve race data.
+
+        Returns:
+            A list of dictionaries containing team information for each team.
+        """
+        return self.get_data("teams", year)
+
+    def _build_url(self, category, year):
+        self._check_category(category)
+        return self._standings_url("Team" if category == "teams" else "Driver", year)
+
+    def _standings_url(self, page, year):
+        raise NotImplementedError
+
+    def _scrape(self, category, year):
+        url = self._build_url(category, year)
+        return self._extract_tables(category, self._page_tables(url, year), year)
+
+    async def _ascrape(self, category, url, year):
+        import asyncio
+
+        tables = self._cached_tables(url)
+        if tables is None:
+            tables = await self._page_flight.ado(url, self._aload_tables, url, year)
+        return await asyncio.to_thread(self._extract_tables, category, tables, year)
+
+    def _page_tables(self, url, year):
+        tables = self._cached_tables(url)
+        if tables is None:
+            tables = self._page_flight.do(url, self._load_tables, url, year)
+        return tables
+
+    def _cached_tables(self, url):
+        with self._pages_lock:
+            entry = self._pages.get(url)
+            if entry is not None and entry[0] > time.monotonic():
+                self._pages.move_to_end(url)
+                return entry[1]
+        return None
+
+    def _load_tables(self, url, year):
+        tables = self._timed_parse(parse_tables, self._fetch(url, year).text, 'table table-bordered',
+                                   self.parser)
+        self._keep_tables(url, tables)
+        return tables
+
+    async def _aload_tables(self, url, year):
+        import asyncio
+
+        text = (await self._afetch(url, year)).text
+        tables = await asyncio.to_thread(self._timed_parse, parse_tables, text, 'table table-bordered',
+                                         self.parser)
+        self._keep_tables(url, tables)
+        return tables
+
+    def _keep_tables(self, url, tables):
+        if self.page_ttl > 0:
+            with self._pages_lock:
+                self._pages[url] = (time.monotonic() + self.page_ttl, tables)
+                self._pages.move_to_end(url)
+                while len(self._pages) > 8:
+                    self._pages.popitem(last=False)
+
+    def _parse_page(self, category, text, year):
+        tables = self._timed_parse(parse_tables, text, 'table table-bordered', self.parser)
+        return self._extract_tables(category, tables, year)
+
+    def _iter_page(self, category, chunks, year):
+        if category == "races":
+            for row in iter_rows(chunks, 'table table-bordered', 'th', 2, self.parser):
+                yield self._extract_race_info(row, year)
+        elif category == "drivers":
+            for row in iter_rows(chunks, 'table table-bordered', 'tr', 1, self.parser):
+                yield self._extract_driver_info(row)
+        else:
+            for row in iter_rows(chunks, 'table table-bordered', 'tr', 1, self.parser):
+                yield self._extract_team_info(row)
+
+    def _extract_tables(self, category, tables, year):
+        data = []
+        for table in tables:
+            if category == "races":
+                for row in table.rows("th")[2:]:
+                    data.append(self._extract_race_info(row, year))
+            elif category == "drivers":
+                for row in table.rows("tr")[1:]:
+                    data.append(self._extract_driver_info(row))
+            else:
+                for row in table.rows("tr")[1:]:
+                    data.append(self._extract_team_info(row))
+
+        return data
+
+    def _extract_driver_info(self, row):
+        position, driver_name, points = _STANDINGS_ROW.extract(row)
+
+        driver_info = {
+            "position": position,
+            "name": driver_name,
+            "points": points
+        }
+
+        return driver_info
+
+    def _extract_race_info(self, row, year):
+        grandprix, date = _STANDINGS_RACE_HEADER.extract(row)
+
+        race_info = {
+            "grandprix": grandprix,
+            "date": f'{date} {year}'
+        }
+
+        return race_info
+
+    def _extract_team_info(self, row):
+        position, team, points = _STANDINGS_ROW.extract(row)
+
+        team_info = {
+            "position": position,
+            "team": team,
+            "points": points
+        }
+
+        return team_info
+
+class Formula1AcademyScraper(_StandingsScraper):
+    """
+    Class for scraping Formula 1 Academy data from the official website.
+    """
+    series = "f1academy"
+
+    def __init__(self, **options):
+        """
+        Initialize the class with the base URL for the website.
+
+        Args:
+            **options: Options shared by all scrapers, such as ``transport``
+                or ``cache`` (see the README).
+        """
+        super().__init__(**options)
+        self.base_url_f1a = "https://www.f1academy.com/Standings/"
+
+    def _standings_url(self, page, year):
+        if year != 2023:
+            raise ValueError(f"Invalid year: {year}")
+        return f"{self.base_url_f1a}{page}?seasonId=1"
+
+class Formula2Scraper(_StandingsScraper):
+    """
+    Class for scraping Formula 2 data from the official website.
+    """
+    series = "f2"
+
+    def __init__(self, **options):
+        """
+        Initialize the class with the base URL for the website.
+
+        Args:
+            **options: Options shared by all scrapers, such as ``transport``
+                or ``cache`` (see the README).
+        """
+        super().__init__(**options)
+        self.base_url_f2 = "https://www.fiaformula2.com/Standings/"
+
+    def _standings_url(self, page, year):
+        if year < 2017:
+            raise ValueError(f"Invalid year: {year}")
+        return f"{self.base_url_f2}{page}?seasonId={year-1843}"
+
+class Formula3Scraper(_StandingsScraper):
+    """
+    Class for scraping Formula 3 data from the official website.
+    """
+    series = "f3"
+
+    def __init__(self, **options):
+        """
+        Initialize the class with the base URL for the website.
+
+        Args:
+            **options: Options shared by all scrapers, such as ``transport``
+                or ``cache`` (see the README).
+        """
+        super().__init__(**options)
+        self.base_url_f3 = "https://www.fiaformula3.com/Standings/"
+
+    def _standings_url(self, page, year):
+        if year < 2019:
+            raise ValueError(f"Invalid year: {year}")
+        return f"{self.base_url_f3}{page}?seasonId={year-1843}"
+
+class FormulaEScraper(_BaseScraper):
+    """
+    Class for scraping Formula E data from the official website.
+    """
+    series = "fe"
+    categories = ("drivers", "races", "teams")
+    extra_categories = ("race_results",)
+
+    def __init__(self, **options):
+        """
+        Initialize the class with the base URL for the website and seasonsId.
+
+        Args:
+            **options: Options shared by all scrapers, such as ``transport``
+                or ``cache`` (see the README).
+        """
+        super().__init__(**options)
+        self.base_url_fe = "https://api.formula-e.pulselive.com/formula-e/v1/"
+        self.season_ids = {
+            2024: "84467676-4d5d-4c97-ae07-0b7520bb95ea",
+            2023: "bc4a0209-f233-46c8-afce-842d1c48358f",
+            2022: "1335d68f-d1ae-4200-8ca5-c53cd1a7690b",
+            2021: "bd46d6ec-6d0e-427a-9f8c-f5a5bcc12d1c",
+            2020: "0cdedbd9-d9f9-4283-ac31-828792b6b224",
+            2019: "7a56ae01-e0c0-43f3-a354-47300118f7b9",
+            2018: "ea980dfa-e65a-4d0a-8523-c1faa7eb6bc0",
+            2017: "f59db73b-450e-4840-a5f8-2a216072b837",
+            2016: "a5f3e09b-74b8-46eb-8211-7028942b6707",
+            2015: "88a88a4b-a48d-4d06-9e52-d609bb7824a3",
+        }
+
+    def get_drivers_data(self, year):
+        """
+        Scrape the driver data for a specific year.
+
+        Args:
+            year: The year for which to retrieve driver data.
+
+        Returns:
+            A list of dictionaries containing driver information for each driver.
+        """
+        return self.get_data("drivers", year)
+
+    def get_teams_data(self, year):
+        """
+        Scrape the team data for a specific year.
+
+        Args:
+            year: The year for which to retrieve race data.
+
+        Returns:
+            A list of dictionaries containing team information for each team.
+        """
+        return self.get_data("teams", year)
+
+    def get_races_data(self, year):
+        """
+        Scrape the race data for a specific year.
+
+        Args:
+            year: The year for which to retrieve race data.
+
+        Returns:
+            A list of dictionaries containing race information for each race.
+        """
+        return self.get_data("races", year)
+
+    def get_race_results_data(self, year):
+        """
+        Scrape the classification of every race of a specific year.
+
+        The results of each race are looked up by race id, with the races
+        fetched concurrently, ``race_workers`` at a time.
+
+        Args:
+            year: The year for which to retrieve race results.
+
+        Returns:
+            A list of dictionaries with one entry per driver and race, in
+            calendar and finishing order. Races not run yet are left out.
+        """
+        return self.get_data("race_results", year)
+
+    async def aget_race_results_data(self, year):
+        """
+        Asynchronous counterpart of ``get_race_results_data``.
+        """
+        return await self.aget_data("race_results", year)
+
+    def _build_url(self, category, year):
+        self._check_category(category)
+        if year not in self.season_ids:
+            raise ValueError(f"Invalid year: {year}")
+
+        championship = f"championshipId={self.season_ids[year]}"
+        if category == "drivers":
+            return f"{self.base_url_fe}standings/drivers?{championship}"
+        if category == "teams":
+            return f"{self.base_url_fe}standings/teams?{championship}"
+        return f"{self.base_url_fe}races?{championship}"
+
+    def _parse_page(self, category, text, year):
+        data = self._timed_parse(json.loads, text)
+
+        if category == "drivers":
+            return self._extract_driver_data(data)
+        if category == "teams":
+            return [self._extract_team_data(team_data) for team_data in data]
+        return [self._extract_race_data(race_data) for race_data in data["races"]]
+
+    def _iter_page(self, category, chunks, year):
+        if category == "drivers":
+            for driver in iter_json_array(chunks):
+                yield self._extract_driver_info(driver)
+        elif category == "teams":
+            for team_data in iter_json_array(chunks):
+                yield self._extract_team_data(team_data)
+        else:
+            for race_data in iter_json_array(chunks, "races"):
+                yield self._extract_race_data(race_data)
+
+    def _race_index(self, category, text, year):
+        for race_data in self._timed_parse(json.loads, text)["races"]:
+            yield race_data["id"], {"id": race_data["id"], **self._extract_race_data(race_data)}
+
+    def _race_steps(self, category, race, year):
+        race_url = f"{self.base_url_fe}races/{race['id']}"
+        sessions = self._timed_parse(json.loads, (yield f"{race_url}/sessions"))
+        if isinstance(sessions, dict):
+            sessions = sessions.get("sessions", [])
+        race_sessions = [session for session in sessions
+                         if str(session.get("sessionName", "")).lower() == "race"]
+        if not race_sessions:
+            return []
+
+        results = self._timed_parse(json.loads, (yield f"{race_url}/sessions/{race_sessions[-1]['id']}/results"))
+        if isinstance(results, dict):
+            results = results.get("results", [])
+        return [self._extract_race_result_data(result, race) for result in results]
+
+    def _extract_driver_data(self, driver_data):
+        return [self._extract_driver_info(driver) for driver in driver_data]
+
+    def _extract_driver_info(self, driver):
+        driver_info = {
+            "driverTeamName": driver["driverTeamName"],
+            "driverPosition": driver["driverPosition"],
+            "driverFirstName": driver["driverFirstName"],
+            "driverLastName": driver["driverLastName"],
+            "driverCountry": driver["driverCountry"],
+            "driverPoints": driver["driverPoints"],
+        }
+
+        return driver_info
+
+    def _extract_team_data(self, team_data):
+        teams_data = {
+            "teamName": team_data["teamName"],
+            "teamPosition": team_data["teamPosition"],
+            "teamPoints": team_data["teamPoints"],
+        }
+
+        return teams_data
+
+    def _extract_race_result_data(self, result, race):
+        race_result_data = {
+            "raceName": race["raceName"],
+            "raceDate": race["raceDate"],
+            "driverPosition": result.get("driverPosition"),
+            "driverNumber": result.get("driverNumber"),
+            "driverFirstName": result.get("driverFirstName"),
+            "driverLastName": result.get("driverLastName"),
+            "driverTeamName": result.get("driverTeamName", result.get("teamName")),
+            "driverLaps": result.get("laps"),
+            "driverTime": result.get("sessionTime"),
+            "driverPoints": result.get("points", result.get("driverPoints")),
+        }
+
+        return race_result_data
+
+    def _extract_race_data(self, race_data):
+        races_data = {
+            "raceName": race_data["name"],
+            "raceDate": race_data["date"],
+        }
+
+        return races_data
+
+
+SCRAPERS = {
+    scraper.series: scraper
+    for scraper in (
+        Formula1Scraper,
+        Formula1AcademyScraper,
+        Formula2Scraper,
+        Formula3Scraper,
+        FormulaEScraper,
+    )
+}
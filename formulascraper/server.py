@@ -0,0 +1,339 @@
+"""
+Module containing the local HTTP/JSON server of scraped seasons.
+
+    python -m formulascraper.server --db formula.db --years 2015-2024 --port 8000
+    curl http://127.0.0.1:8000/f1/drivers/2021
+
+Every season is served from memory as a JSON body serialized, compressed
+and hashed ahead of time, so a request only looks up a dictionary and
+writes prepared bytes. Seasons come from a ``SQLiteStore``; a background
+thread syncs the stale ones and swaps in their new bodies. Requests never
+trigger a scrape: seasons that are not loaded yet answer 404.
+"""
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import threading
+import time
+from email.utils import formatdate
+
+from .store import SQLiteStore
+
+_REASONS = {200: b"OK", 304: b"Not Modified", 400: b"Bad Request", 404: b"Not Found",
+            405: b"Method Not Allowed", 431: b"Request Header Fields Too Large"}
+_MAX_HEAD = 65536
+
+
+class _Resource:
+    """
+    A JSON body prepared in both identity and gzip encodings.
+    """
+    __slots__ = ("etag", "gzip_etag", "body", "gzip_body", "head", "gzip_head", "not_modified",
+                 "gzip_not_modified")
+
+    def __init__(self, value, max_age):
+        self.body = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.gzip_body = gzip.compress(self.body, mtime=0)
+        digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.etag = f'"{digest}"'.encode("ascii")
+        self.gzip_etag = f'"{digest}-gz"'.encode("ascii")
+        common = (b"Content-Type: application/json; charset=utf-8\r\n"
+                  b"Vary: Accept-Encoding\r\n"
+                  + f"Cache-Control: public, max-age={max_age}\r\n".encode("ascii"))
+        self.head = (b"HTTP/1.1 200 OK\r\n" + common + b"ETag: " + self.etag + b"\r\n"
+                     + f"Content-Length: {len(self.body)}\r\n".encode("ascii"))
+        self.gzip_head = (b"HTTP/1.1 200 OK\r\n" + common + b"ETag: " + self.gzip_etag + b"\r\n"
+                          b"Content-Encoding: gzip\r\n"
+                          + f"Content-Length: {len(self.gzip_body)}\r\n".encode("ascii"))
+        self.not_modified = b"HTTP/1.1 304 Not Modified\r\n" + common + b"ETag: " + self.etag + b"\r\n"
+        self.gzip_not_modified = (b"HTTP/1.1 304 Not Modified\r\n" + common + b"ETag: "
+                                  + self.gzip_etag + b"\r\n")
+
+    def matches(self, header):
+        for tag in header.split(b","):
+            tag = tag.strip()
+            if tag.startswith(b"W/"):
+                tag = tag[2:]
+            if tag in (self.etag, self.gzip_etag, b"*"):
+                return True
+        return False
+
+
+class FormulaServer:
+    """
+    Asyncio HTTP/1.1 server answering ``/{series}/{category}/{year}``.
+
+    ``GET /`` lists the loaded seasons, ``GET /f1/drivers/2021`` returns the
+    rows of a season as ``get_data`` does. Responses carry an ETag and
+    answer ``If-None-Match`` with 304, are gzip-compressed when the client
+    accepts it, and connections are kept alive and may pipeline requests.
+    """
+    def __init__(self, store=None, series=None, categories=None, years=None, refresh_interval=300,
+                 max_age=60):
+        """
+        Initialize the server.
+
+        Args:
+            store: ``SQLiteStore`` the seasons are read from and synced into.
+                Defaults to an in-memory store.
+            series: Series synced in the background, a name, an iterable of
+                names or None for all.
+            categories: Categories synced, defaults to all of each series.
+            years: Years synced, defaults to every available year.
+            refresh_interval: Seconds between two background syncs. Running
+                seasons are re-scraped when older than the store's
+                ``stale_after``.
+            max_age: Seconds clients may cache a response
+                (``Cache-Control: max-age``).
+        """
+        self.store = store if store is not None else SQLiteStore(":memory:", stale_after=refresh_interval)
+        self.series = series
+        self.categories = categories
+        self.years = None if years is None else list(years)
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.requests = 0
+        self.refreshes = 0
+        self.last_error = None
+        self._resources = {}
+        self._index = _Resource({"seasons": []}, max_age)
+        self._stop = threading.Event()
+        self._thread = None
+        self._server = None
+        self._date = (0, b"")
+
+    def load(self):
+        """
+        Prepare the responses of every season in the store, without scraping.
+
+        Returns:
+            The number of seasons loaded.
+        """
+        seasons = self.store.seasons()
+        for series, category, year, _, _ in seasons:
+            self._publish(series, category, year)
+        self._publish_index()
+        return len(seasons)
+
+    def refresh(self):
+        """
+        Sync the stale seasons into the store and swap in their responses.
+
+        Returns:
+            The ``CrawlResult`` of the sync, keyed by (series, category, year).
+        """
+        report = self.store.sync(self.series, self.categories, self.years)
+        for series, category, year in report:
+            self._publish(series, category, year)
+        if report:
+            self._publish_index()
+        self.refreshes += 1
+        self.last_error = next(iter(report.errors.values()), None)
+        return report
+
+    async def start(self, host="127.0.0.1", port=8000):
+        """
+        Load the stored seasons, start listening and start the refresh thread.
+
+        Args:
+            host: The interface to listen on.
+            port: The TCP port, 0 for any free port.
+
+        Returns:
+            The ``asyncio.Server``.
+        """
+        self.load()
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(lambda: _HTTPProtocol(self), host, port)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, name="formulascraper-refresh",
+                                        daemon=True)
+        self._thread.start()
+        return self._server
+
+    async def close(self):
+        """
+        Stop listening and stop the refresh thread.
+        """
+        self._stop.set()
+        if self._server is not None:
+            self._server.close()
+            if hasattr(self._server, "close_clients"):
+                self._server.close_clients()
+            await self._server.wait_closed()
+        if self._thread is not None:
+            await asyncio.to_thread(self._thread.join)
+
+    def run(self, host="127.0.0.1", port=8000):
+        """
+        Serve until interrupted.
+        """
+        async def serve():
+            server = await self.start(host, port)
+            try:
+                await server.serve_forever()
+            finally:
+                await self.close()
+
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            pass
+
+    def _refresh_loop(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as error:  # pylint: disable=broad-except
+                self.last_error = error
+            self._stop.wait(self.refresh_interval)
+
+    def _publish(self, series, category, year):
+        rows = self.store.get_data(series, category, year, sync_missing=False)
+        self._resources[f"/{series}/{category}/{year}".encode("ascii")] = _Resource(rows, self.max_age)
+
+    def _publish_index(self):
+        seasons = [{"series": series, "category": category, "year": year, "final": final,
+                    "fetched_at": fetched_at, "path": f"/{series}/{category}/{year}"}
+                   for series, category, year, fetched_at, final in self.store.seasons()]
+        self._index = _Resource({"seasons": seasons}, self.max_age)
+
+    def _respond(self, head):
+        # Returns the response bytes and whether to keep the connection open.
+        self.requests += 1
+        lines = head.split(b"\r\n")
+        parts = lines[0].split(b" ")
+        if len(parts) != 3:
+            return self._error(400, False), False
+        method, target, version = parts
+        accept_gzip = False
+        etags = None
+        connection = b""
+        for line in lines[1:]:
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+            if name == b"accept-encoding":
+                accept_gzip = _accepts_gzip(value)
+            elif name == b"if-none-match":
+                etags = value
+            elif name == b"connection":
+                connection = value.strip().lower()
+        keep_alive = connection != b"close" if version == b"HTTP/1.1" else connection == b"keep-alive"
+        if method not in (b"GET", b"HEAD"):
+            return self._error(405, False), False
+
+        path = target.partition(b"?")[0]
+        resource = self._index if path == b"/" else self._resources.get(path.rstrip(b"/"))
+        if resource is None:
+            return self._error(404, keep_alive), keep_alive
+
+        tail = self._tail(keep_alive)
+        if etags is not None and resource.matches(etags):
+            return (resource.gzip_not_modified if accept_gzip else resource.not_modified) + tail, keep_alive
+        if accept_gzip:
+            response = resource.gzip_head + tail
+            body = resource.gzip_body
+        else:
+            response = resource.head + tail
+            body = resource.body
+        return (response if method == b"HEAD" else response + body), keep_alive
+
+    def _error(self, status, keep_alive):
+        body = json.dumps({"error": _REASONS[status].decode("ascii")}).encode("ascii")
+        return (f"HTTP/1.1 {status} ".encode("ascii") + _REASONS[status] + b"\r\n"
+                b"Content-Type: application/json\r\n"
+                + f"Content-Length: {len(body)}\r\n".encode("ascii")
+                + self._tail(keep_alive) + body)
+
+    def _tail(self, keep_alive):
+        now = int(time.time())
+        if self._date[0] != now:
+            self._date = (now, b"Date: " + formatdate(now, usegmt=True).encode("ascii") + b"\r\n")
+        return self._date[1] + (b"\r\n" if keep_alive else b"Connection: close\r\n\r\n")
+
+
+def _accepts_gzip(value):
+    # "gzip;q=0" refuses gzip, and "*" covers it unless gzip is listed.
+    wildcard = None
+    for coding in value.lower().split(b","):
+        name, *parameters = coding.split(b";")
+        name = name.strip()
+        quality = 1.0
+        for parameter in parameters:
+            key, _, number = parameter.partition(b"=")
+            if key.strip() == b"q":
+                try:
+                    quality = float(number)
+                except ValueError:
+                    quality = 0.0
+        if name in (b"gzip", b"x-gzip"):
+            return quality > 0
+        if name == b"*":
+            wildcard = quality > 0
+    return bool(wildcard)
+
+
+class _HTTPProtocol(asyncio.Protocol):
+    def __init__(self, server):
+        super().__init__()
+        self.server = server
+        self.transport = None
+        self.buffer = bytearray()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        self.buffer += data
+        responses = []
+        keep_alive = True
+        while keep_alive:
+            end = self.buffer.find(b"\r\n\r\n")
+            if end < 0:
+                if len(self.buffer) > _MAX_HEAD:
+                    responses.append(self.server._error(431, False))
+                    keep_alive = False
+                break
+            head = bytes(self.buffer[:end])
+            del self.buffer[:end + 4]
+            response, keep_alive = self.server._respond(head)
+            responses.append(response)
+        if responses:
+            self.transport.write(b"".join(responses))
+        if not keep_alive:
+            self.transport.close()
+
+    def connection_lost(self, exc):
+        self.transport = None
+
+
+def main(argv=None):
+    """
+    Run the server from the command line.
+
+    Args:
+        argv: The arguments, defaults to ``sys.argv[1:]``.
+    """
+    from .cli import SERIES, parse_years
+
+    parser = argparse.ArgumentParser(prog="python -m formulascraper.server",
+                                     description="Serve scraped Formula racing data as JSON.")
+    parser.add_argument("--db", default=":memory:", help="SQLite store holding the seasons")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="TCP port")
+    parser.add_argument("--series", action="append", choices=SERIES, help="series to sync, repeatable")
+    parser.add_argument("--category", action="append", help="category to sync, repeatable")
+    parser.add_argument("--years", type=parse_years, help='years to sync, e.g. "2015-2024"')
+    parser.add_argument("--refresh", type=float, default=300, help="seconds between background syncs")
+    arguments = parser.parse_args(argv)
+
+    store = SQLiteStore(arguments.db, stale_after=arguments.refresh)
+    server = FormulaServer(store, arguments.series, arguments.category, arguments.years,
+                           refresh_interval=arguments.refresh)
+    server.run(arguments.host, arguments.port)
+
+
+if __name__ == "__main__":
+    main()
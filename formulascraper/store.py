@@ -0,0 +1,260 @@
+"""
+Module containing the local SQLite store of scraped data.
+"""
+import json
+import sqlite3
+import threading
+import time
+
+from .bulk import CrawlResult
+from .records import to_record
+from .scrapers import SCRAPERS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    series TEXT NOT NULL,
+    category TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    final INTEGER NOT NULL,
+    PRIMARY KEY (series, category, year)
+);
+CREATE TABLE IF NOT EXISTS rows (
+    series TEXT NOT NULL,
+    category TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    ord INTEGER NOT NULL,
+    driver TEXT,
+    team TEXT,
+    position INTEGER,
+    points REAL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (series, category, year, ord)
+);
+CREATE INDEX IF NOT EXISTS rows_year ON rows (year, series);
+CREATE INDEX IF NOT EXISTS rows_driver ON rows (driver, series, year);
+CREATE INDEX IF NOT EXISTS rows_team ON rows (team, series, year);
+"""
+
+
+class SQLiteStore:
+    """
+    Local SQLite database of scraped seasons with incremental sync.
+
+    A season fetched after it finished is never downloaded again. A season
+    that was still running when fetched is refreshed once it is older than
+    ``stale_after`` seconds, and one last time after it finishes. Seasons
+    that failed are not stored and stay due, and a finished season that
+    came back empty is refreshed like a running one.
+    """
+    def __init__(self, path, stale_after=3600, scrapers=None):
+        """
+        Open (and create if needed) the database.
+
+        Args:
+            path: Path of the SQLite file, or ":memory:".
+            stale_after: Seconds after which a running season is re-fetched.
+            scrapers: Optional mapping of series name to scraper instance,
+                used instead of new scrapers with default options.
+        """
+        self.path = path
+        self.stale_after = stale_after
+        self.scrapers = dict(scrapers or {})
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def sync(self, series=None, categories=None, years=None, force=False, max_workers=8):
+        """
+        Fetch the seasons that are missing, still running and stale, or
+        finished since they were fetched.
+
+        Args:
+            series: A series name, an iterable of names, or None for all.
+            categories: Iterable of categories, defaults to all categories of
+                each series.
+            years: Iterable of years, defaults to every available year.
+            force: Re-fetch every selected season.
+            max_workers: Number of threads fetching pages per series.
+
+        Returns:
+            A ``CrawlResult`` mapping (series, category, year) to the number of
+            rows stored, with failed seasons in ``errors``.
+        """
+        if series is None:
+            series = list(SCRAPERS)
+        elif isinstance(series, str):
+            series = [series]
+
+        report = CrawlResult()
+        for name in series:
+            scraper = self._scraper(name)
+            for category in categories or scraper.categories:
+                if not scraper.supports(category):
+                    continue
+                candidates = scraper.available_years(category, years)
+                due = [year for year in candidates
+                       if force or self._is_due(scraper, name, category, year)]
+                if not due:
+                    continue
+                # Pages answered with an error status are raised by the
+                # scraper, so they end up in errors and the season stays due.
+                result = scraper.get_history(due, [category], max_workers=max_workers)
+                for (year, _), rows in result.items():
+                    # An empty season is not trusted to be complete, it is
+                    # fetched again once stale.
+                    self._write(name, category, year, rows, scraper._is_final(year) and bool(rows))
+                    report[(name, category, year)] = len(rows)
+                for (year, _), error in result.errors.items():
+                    report.errors[(name, category, year)] = error
+        return report
+
+    def get_data(self, series, category, year, sync_missing=True):
+        """
+        Return a stored season, as returned by the scraper's ``get_*_data``.
+
+        Args:
+            series: The series name, e.g. "f1".
+            category: The category, e.g. "drivers".
+            year: The year.
+            sync_missing: Whether to fetch the season if it is not stored yet.
+
+        Returns:
+            A list of dictionaries.
+        """
+        if sync_missing and not self.has_season(series, category, year):
+            report = self.sync(series, [category], [year])
+            if report.errors:
+                raise next(iter(report.errors.values()))
+        with self._lock:
+            cursor = self._connection.execute(
+                "SELECT data FROM rows WHERE series = ? AND category = ? AND year = ? ORDER BY ord",
+                (series, category, year),
+            )
+            return [json.loads(data) for data, in cursor.fetchall()]
+
+    def driver_rows(self, driver, series=None, category="drivers"):
+        """
+        Return every stored row of a driver.
+
+        Args:
+            driver: The driver's full name, e.g. "Lewis Hamilton". For races
+                the winner and for fastest laps the driver column is used.
+            series: Optional series name to restrict the search.
+            category: The category to search.
+
+        Returns:
+            A list of (series, year, row) tuples ordered by series and year.
+        """
+        return self._select("driver", driver, series, category)
+
+    def team_rows(self, team, series=None, category="teams"):
+        """
+        Return every stored row of a team.
+
+        Args:
+            team: The team name as scraped, e.g. "Mercedes".
+            series: Optional series name to restrict the search.
+            category: The category to search.
+
+        Returns:
+            A list of (series, year, row) tuples ordered by series and year.
+        """
+        return self._select("team", team, series, category)
+
+    def has_season(self, series, category, year):
+        """
+        Whether a season is stored.
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "SELECT 1 FROM seasons WHERE series = ? AND category = ? AND year = ?",
+                (series, category, year),
+            )
+            return cursor.fetchone() is not None
+
+    def seasons(self, series=None):
+        """
+        Return the stored seasons.
+
+        Args:
+            series: Optional series name to restrict the list.
+
+        Returns:
+            A list of (series, category, year, fetched_at, final) tuples.
+        """
+        query = "SELECT series, category, year, fetched_at, final FROM seasons"
+        parameters = ()
+        if series is not None:
+            query += " WHERE series = ?"
+            parameters = (series,)
+        with self._lock:
+            return [(name, category, year, fetched_at, bool(final))
+                    for name, category, year, fetched_at, final
+                    in self._connection.execute(query + " ORDER BY series, category, year", parameters)]
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _scraper(self, series):
+        if series not in SCRAPERS:
+            raise ValueError(f"Invalid series: {series}")
+        if series not in self.scrapers:
+            self.scrapers[series] = SCRAPERS[series]()
+        return self.scrapers[series]
+
+    def _is_due(self, scraper, series, category, year):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT fetched_at, final FROM seasons WHERE series = ? AND category = ? AND year = ?",
+                (series, category, year),
+            ).fetchone()
+        if row is None:
+            return True
+        fetched_at, final = row
+        if final:
+            return False
+        return scraper._is_final(year) or time.time() - fetched_at >= self.stale_after
+
+    def _write(self, series, category, year, rows, final):
+        values = []
+        for order, row in enumerate(rows):
+            record = to_record(series, category, row)
+            driver = (getattr(record, "name", None) or getattr(record, "winner", None)
+                      or getattr(record, "driver", None))
+            values.append((
+                series, category, year, order, driver, getattr(record, "team", None),
+                getattr(record, "position", None), getattr(record, "points", None),
+                json.dumps(row),
+            ))
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM rows WHERE series = ? AND category = ? AND year = ?",
+                (series, category, year),
+            )
+            self._connection.executemany("INSERT INTO rows VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO seasons VALUES (?, ?, ?, ?, ?)",
+                (series, category, year, time.time(), int(final)),
+            )
+
+    def _select(self, column, value, series, category):
+        query = f"SELECT series, year, data FROM rows WHERE {column} = ? AND category = ?"
+        parameters = [value, category]
+        if series is not None:
+            query += " AND series = ?"
+            parameters.append(series)
+        with self._lock:
+            cursor = self._connection.execute(query + " ORDER BY series, year, ord", parameters)
+            return [(name, year, json.loads(data)) for name, year, data in cursor.fetchall()]
@@ -0,0 +1,273 @@
+"""
+Module containing the HTTP transport shared by the scrapers.
+"""
+import codecs
+import inspect
+import json
+import threading
+import time
+
+from .ratelimit import RetryPolicy, parse_retry_after
+
+
+class Response:
+    """
+    Minimal response object returned by transports not built on requests.
+
+    It exposes the subset of ``requests.Response`` used by the scrapers.
+    """
+    def __init__(self, url, status_code, headers, content, encoding=None):
+        """
+        Initialize the response.
+
+        Args:
+            url: The URL that was fetched.
+            status_code: The HTTP status code.
+            headers: Mapping of response headers.
+            content: The raw response body as bytes.
+            encoding: Text encoding of the body, defaults to UTF-8.
+        """
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+        self.latency = None
+
+    @property
+    def text(self):
+        """
+        The response body decoded to a string.
+        """
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        """
+        Decode the response body as JSON.
+        """
+        return json.loads(self.text)
+
+
+class HTTPStatusError(Exception):
+    """
+    Raised when a page is answered with an error status.
+
+    ``response`` holds the failed response, ``status_code`` and ``url`` its
+    status and URL.
+    """
+    def __init__(self, response, retries=None):
+        self.response = response
+        self.status_code = response.status_code
+        self.url = response.url
+        message = f"HTTP {response.status_code} for {response.url}"
+        if retries is not None:
+            message += f", giving up after {retries} retries"
+        super().__init__(message)
+
+
+class HTTPTransport:
+    """
+    Connection-pooled HTTP transport built on a requests session.
+
+    requests is only imported when the first transport is created, so
+    importing the package stays fast.
+
+    A single transport keeps TCP/TLS connections alive between calls, so
+    scrapers sharing it only pay the handshake once per host. Any object
+    with a compatible ``get(url, **kwargs)`` method can be injected into the
+    scrapers instead.
+
+    Timeouts, connection errors, 429 and 5xx responses are retried with
+    jittered exponential backoff, and an optional ``RateLimiter`` paces the
+    requests sent to each host. A retried status still answered after the
+    last retry raises ``HTTPStatusError``.
+    """
+    def __init__(self, timeout=5, pool_connections=10, pool_maxsize=10,
+                 host_pool_sizes=None, keep_alive=True, headers=None, rewrite=None,
+                 retry=None, limiter=None):
+        """
+        Initialize the transport and mount the connection pools.
+
+        Args:
+            timeout: Request timeout in seconds, or a (connect, read) tuple.
+            pool_connections: Number of per-host pools to keep.
+            pool_maxsize: Maximum number of connections kept per host.
+            host_pool_sizes: Optional mapping of host to pool size, e.g.
+                {"www.formula1.com": 20}, overriding ``pool_maxsize``.
+            keep_alive: Whether to ask servers to keep connections open.
+            headers: Optional headers sent with every request.
+            rewrite: Optional mapping of URL prefix to replacement prefix, e.g.
+                {"https://www.formula1.com": "http://127.0.0.1:8000"}, used to
+                point the scrapers at a local stand-in server.
+            retry: ``RetryPolicy`` for failed requests, defaults to 3 retries;
+                ``RetryPolicy(retries=0)`` disables retries.
+            limiter: Optional ``RateLimiter`` shared by the requests.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.timeout = timeout
+        self.rewrite = dict(rewrite or {})
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.limiter = limiter
+        self.session = requests.Session()
+        self._retried_errors = (requests.ConnectionError, requests.Timeout)
+
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        for host, size in (host_pool_sizes or {}).items():
+            host_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+            self.session.mount(f"https://{host}/", host_adapter)
+            self.session.mount(f"http://{host}/", host_adapter)
+
+        self.session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+        if headers:
+            self.session.headers.update(headers)
+
+    def resolve(self, url):
+        """
+        Apply the configured prefix rewrites to a URL.
+
+        Args:
+            url: The URL requested by a scraper.
+
+        Returns:
+            The URL that is actually fetched.
+        """
+        for prefix, replacement in self.rewrite.items():
+            if url.startswith(prefix):
+                return replacement + url[len(prefix):]
+        return url
+
+    def get(self, url, **kwargs):
+        """
+        Send a GET request through the pooled session.
+
+        Args:
+            url: The URL to fetch.
+            **kwargs: Extra keyword arguments passed to ``requests.Session.get``.
+
+        Returns:
+            The ``requests.Response`` object. Its ``latency`` attribute holds
+            the seconds taken by the last attempt, retries excluded.
+
+        Raises:
+            HTTPStatusError: The retries were exhausted on a retried status.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self._send(self.resolve(url), kwargs)
+
+    def stream(self, url, chunk_size=65536, on_response=None, **kwargs):
+        """
+        Download a page incrementally through the pooled session.
+
+        Args:
+            url: The URL to fetch.
+            chunk_size: Number of bytes read at a time.
+            on_response: Optional callable receiving the response before its
+                body is read, e.g. to look at the status and headers.
+            **kwargs: Extra keyword arguments passed to ``requests.Session.get``.
+
+        Yields:
+            The decoded text of the page, chunk by chunk.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        kwargs["stream"] = True
+        with self._send(self.resolve(url), kwargs) as response:
+            if on_response is not None:
+                on_response(response)
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+            for chunk in response.iter_content(chunk_size):
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+            text = decoder.decode(b"", final=True)
+            if text:
+                yield text
+
+    def _send(self, url, kwargs):
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                self.limiter.acquire(url)
+            start = time.monotonic()
+            latency = retry_after = None
+            throttled = False
+            try:
+                try:
+                    response = self.session.get(url, **kwargs)
+                except self._retried_errors:
+                    throttled = True
+                    delay = self.retry.delay(attempt)
+                    if delay is None:
+                        raise
+                else:
+                    latency = response.latency = time.monotonic() - start
+                    throttled = response.status_code in self.retry.statuses
+                    retry_after = parse_retry_after(response.headers.get("Retry-After")) if throttled else None
+                    delay = self.retry.delay(attempt, retry_after) if throttled else None
+                    if delay is None:
+                        if throttled:
+                            response.close()
+                            raise HTTPStatusError(response, attempt)
+                        return response
+                    response.close()
+            finally:
+                # The slot is given back whatever happened, only the outcome
+                # of the attempt feeds the concurrency limit.
+                if self.limiter is not None:
+                    self.limiter.release(url, latency, throttled, retry_after)
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self):
+        """
+        Close all pooled connections.
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+_default_transport = None
+_default_lock = threading.Lock()
+
+
+def _accepts(function, name):
+    try:
+        parameters = inspect.signature(function).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(parameter.name == name or parameter.kind is parameter.VAR_KEYWORD
+               for parameter in parameters)
+
+
+def get_default_transport():
+    """
+    Return the transport shared by scrapers created without one.
+
+    Returns:
+        The module-wide ``HTTPTransport``, created on first use.
+    """
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = HTTPTransport()
+        return _default_transport
+
+
+def set_default_transport(transport):
+    """
+    Replace the transport shared by scrapers created without one.
+
+    Args:
+        transport: The transport to use, or None to reset to a fresh default.
+    """
+    global _default_transport
+    with _default_lock:
+        _default_transport = transport
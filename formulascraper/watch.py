@@ -0,0 +1,243 @@
+"""
+Module containing the polling watcher emitting changed rows.
+
+A watcher polls one page with conditional requests: a 304 answer, or a body
+with the same hash as the previous one, is not parsed again. Parsed rows are
+diffed against the previous snapshot and only the differences are emitted.
+"""
+import hashlib
+import threading
+import time
+
+from .records import to_record
+from .transport import HTTPStatusError
+
+
+class RowChange:
+    """
+    A row added, removed or changed between two polls.
+
+    ``kind`` is "added", "removed" or "changed", ``key`` identifies the row
+    (e.g. the driver name), ``old`` and ``new`` are the row before and after
+    the change (None for added and removed rows respectively).
+    """
+    __slots__ = ("kind", "key", "old", "new", "series", "category", "year")
+
+    def __init__(self, kind, key, old, new, series, category, year):
+        self.kind = kind
+        self.key = key
+        self.old = old
+        self.new = new
+        self.series = series
+        self.category = category
+        self.year = year
+
+    @property
+    def row(self):
+        """
+        The current row, or the removed row for "removed" changes.
+        """
+        return self.new if self.new is not None else self.old
+
+    def __repr__(self):
+        return (f"RowChange(kind={self.kind!r}, key={self.key!r}, "
+                f"old={self.old!r}, new={self.new!r})")
+
+
+def row_key(series, category, row):
+    """
+    Return the default key identifying a row across polls.
+
+    Drivers are identified by name, teams by team name, races and fastest
+    laps by grand prix and date.
+
+    Args:
+        series: The series of the scraper, e.g. "f1".
+        category: The category of the row.
+        row: The dictionary returned by the scraper.
+
+    Returns:
+        A hashable key.
+    """
+    record = to_record(series, category, row)
+    if category == "drivers":
+        return record.name
+    if category == "teams":
+        return record.team
+    return record.grandprix, getattr(record, "date", None)
+
+
+class Watcher:
+    """
+    Poll a category of one season and report the rows that changed.
+
+    The first poll reports every row as added. Later polls send
+    ``If-None-Match``/``If-Modified-Since`` so unchanged pages cost a 304,
+    and skip parsing when the body hash did not change. Requests go through
+    the scraper, so its collector sees them and its cache and archive keep
+    the new pages. Error responses (any status outside 2xx besides 304) are
+    skipped without touching the snapshot.
+    ``polls``, ``not_modified``, ``unchanged``, ``parsed`` and ``failed``
+    count what each poll did.
+    """
+    def __init__(self, scraper, category, year, key=None):
+        """
+        Initialize the watcher.
+
+        Args:
+            scraper: The scraper instance whose transports and parser are used.
+            category: One of the scraper's ``categories``, e.g. "drivers".
+            year: The season to watch.
+            key: Optional function of a row returning its key, defaults to
+                ``row_key``.
+        """
+        if category not in scraper.categories:
+            raise ValueError(f"Invalid category: {category}")
+        self.scraper = scraper
+        self.category = category
+        self.year = year
+        self.url = scraper._build_url(category, year)
+        self.key = key or (lambda row: row_key(scraper.series, category, row))
+        self.rows = []
+        self.polls = 0
+        self.not_modified = 0
+        self.unchanged = 0
+        self.parsed = 0
+        self.failed = 0
+        self._snapshot = {}
+        self._digest = None
+        self._etag = None
+        self._last_modified = None
+
+    def poll(self):
+        """
+        Fetch the page once and return the changes since the previous poll.
+
+        Returns:
+            A list of ``RowChange`` objects, empty if nothing changed.
+        """
+        try:
+            response = self.scraper._request(self.url, self.year, self._conditional_headers())
+        except HTTPStatusError:
+            response = None
+        text = self._accept(response)
+        if text is None:
+            return []
+        self._keep(response)
+        return self._diff(self.scraper._parse_page(self.category, text, self.year))
+
+    async def apoll(self):
+        """
+        Asynchronous counterpart of ``poll``, parsing in a worker thread.
+        """
+        import asyncio
+
+        try:
+            response = await self.scraper._arequest(self.url, self.year, self._conditional_headers())
+        except HTTPStatusError:
+            response = None
+        text = self._accept(response)
+        if text is None:
+            return []
+        await asyncio.to_thread(self._keep, response)
+        rows = await asyncio.to_thread(self.scraper._parse_page, self.category, text, self.year)
+        return self._diff(rows)
+
+    def run(self, callback, interval=5.0, stop=None, polls=None):
+        """
+        Poll until stopped, calling ``callback(change)`` for every change.
+
+        Args:
+            callback: Callable receiving each ``RowChange``.
+            interval: Seconds between the start of two polls.
+            stop: Optional ``threading.Event`` ending the loop when set.
+            polls: Optional number of polls after which to return.
+        """
+        stop = stop or threading.Event()
+        count = 0
+        while not stop.is_set():
+            start = time.monotonic()
+            for change in self.poll():
+                callback(change)
+            count += 1
+            if polls is not None and count >= polls:
+                return
+            stop.wait(max(0.0, interval - (time.monotonic() - start)))
+
+    async def changes(self, interval=5.0):
+        """
+        Poll forever, yielding every change.
+
+        Args:
+            interval: Seconds between the start of two polls.
+
+        Yields:
+            ``RowChange`` objects, as they are detected.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            for change in await self.apoll():
+                yield change
+            await asyncio.sleep(max(0.0, interval - (loop.time() - start)))
+
+    def _conditional_headers(self):
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+        return headers
+
+    def _accept(self, response):
+        # Retries exhausted by the transport are raised and arrive as None.
+        self.polls += 1
+        if response is not None and response.status_code == 304:
+            self.not_modified += 1
+            return None
+        if response is None or not 200 <= response.status_code < 300:
+            self.failed += 1
+            return None
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
+        digest = hashlib.sha256(response.content).digest()
+        if digest == self._digest:
+            self.unchanged += 1
+            return None
+        self._digest = digest
+        self.parsed += 1
+        return response.text
+
+    def _keep(self, response):
+        scraper = self.scraper
+        if scraper.cache is not None:
+            scraper.cache.update(self.url, response, scraper._is_final(self.year))
+        if scraper.archive is not None:
+            scraper.archive.record(self.url, response, scraper.series, self.year)
+
+    def _diff(self, rows):
+        snapshot = {}
+        seen = {}
+        for row in rows:
+            key = self.key(row)
+            occurrence = seen.get(key, 0)
+            seen[key] = occurrence + 1
+            snapshot[(key, occurrence) if occurrence else key] = row
+
+        series = self.scraper.series
+        changes = []
+        for key, row in snapshot.items():
+            old = self._snapshot.get(key)
+            if old is None:
+                changes.append(RowChange("added", key, None, row, series, self.category, self.year))
+            elif old != row:
+                changes.append(RowChange("changed", key, old, row, series, self.category, self.year))
+        for key, row in self._snapshot.items():
+            if key not in snapshot:
+                changes.append(RowChange("removed", key, row, None, series, self.category, self.year))
+
+        self._snapshot = snapshot
+        self.rows = rows
+        return changes
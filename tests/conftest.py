@@ -0,0 +1,39 @@
+"""
+Shared fixtures of the test suite, built on the recorded benchmark pages.
+"""
+import os
+
+import pytest
+
+from benchmarks.cases import fixture_path
+from benchmarks.server import FIXTURES
+from formulascraper.transport import Response
+
+
+class FixtureTransport:
+    """
+    Transport answering scraper URLs with the recorded fixtures.
+
+    ``statuses`` maps a URL to the error status it is answered with, and
+    every call is recorded in ``calls`` as (url, headers).
+    """
+    def __init__(self):
+        self.statuses = {}
+        self.calls = []
+
+    def get(self, url, headers=None):
+        self.calls.append((url, headers))
+        status = self.statuses.get(url)
+        if status is not None:
+            return Response(url, status, {}, b"<html><body>Service Unavailable</body></html>")
+        with open(os.path.join(FIXTURES, fixture_path(url)), "rb") as file:
+            body = file.read()
+        etag = f'"{len(body)}"'
+        if headers and headers.get("If-None-Match") == etag:
+            return Response(url, 304, {"ETag": etag}, b"")
+        return Response(url, 200, {"ETag": etag}, body)
+
+
+@pytest.fixture
+def transport():
+    return FixtureTransport()
@@ -0,0 +1,24 @@
+"""
+Tests of the default asyncio transport.
+"""
+import asyncio
+
+from formulascraper import aio
+
+
+def test_default_transport_is_closed_with_its_loop(monkeypatch):
+    closed = []
+
+    async def aclose(self):
+        closed.append(self)
+
+    monkeypatch.setattr(aio.AsyncHTTPTransport, "aclose", aclose)
+
+    async def main():
+        transport = aio.get_default_async_transport()
+        assert aio.get_default_async_transport() is transport
+        await asyncio.sleep(0)
+        return transport
+
+    transport = asyncio.run(main())
+    assert closed == [transport]
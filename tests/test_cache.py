@@ -0,0 +1,61 @@
+"""
+Tests of the on-disk response cache.
+"""
+import os
+
+from formulascraper import Formula1Scraper, ResponseCache
+from formulascraper.transport import Response
+
+DRIVERS_2021 = "https://www.formula1.com/en/results.html/2021/drivers.html"
+
+
+def test_final_page_is_served_without_request(transport, tmp_path):
+    scraper = Formula1Scraper(transport=transport, cache=ResponseCache(str(tmp_path)))
+    rows = scraper.get_drivers_data(2021)
+    assert Formula1Scraper(transport=transport, cache=scraper.cache).get_drivers_data(2021) == rows
+    assert len(transport.calls) == 1
+
+
+def test_mid_season_page_is_revalidated_after_the_season_ends(transport, tmp_path):
+    cache = ResponseCache(str(tmp_path), current_ttl=0)
+    # Stored while the season was running.
+    cache.update(DRIVERS_2021, transport.get(DRIVERS_2021), final=False)
+    etag = cache.lookup(DRIVERS_2021)[1]["If-None-Match"]
+    transport.calls.clear()
+
+    rows = Formula1Scraper(transport=transport, cache=cache).get_drivers_data(2021)
+    assert rows and transport.calls == [(DRIVERS_2021, {"If-None-Match": etag})]
+    # The 304 marked the page final, it is now served without a request.
+    assert cache.lookup(DRIVERS_2021)[0] is not None
+    Formula1Scraper(transport=transport, cache=cache).get_drivers_data(2021)
+    assert len(transport.calls) == 1
+
+
+def test_evicted_body_is_fetched_again(transport, tmp_path):
+    cache = ResponseCache(str(tmp_path), current_ttl=0)
+    cache.update(DRIVERS_2021, transport.get(DRIVERS_2021), final=False)
+    etag = cache.lookup(DRIVERS_2021)[1]["If-None-Match"]
+    lookup = cache.lookup
+
+    def evicting_lookup(url):
+        found = lookup(url)
+        os.remove(cache._path(url) + ".body")
+        return found
+
+    cache.lookup = evicting_lookup
+    transport.calls.clear()
+    rows = Formula1Scraper(transport=transport, cache=cache).get_drivers_data(2021)
+    # The 304 has no body left to serve, so the page is requested again.
+    assert rows
+    assert [headers for _, headers in transport.calls] == [{"If-None-Match": etag}, None]
+
+
+def test_error_responses_are_not_cached(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.update(DRIVERS_2021, Response(DRIVERS_2021, 503, {}, b"down"), final=True)
+    assert cache.lookup(DRIVERS_2021) == (None, {})
+
+
+def test_directory_expands_user(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert ResponseCache("~/pages").directory == str(tmp_path / "pages")
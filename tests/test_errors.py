@@ -0,0 +1,109 @@
+"""
+Tests of pages answered with an error status.
+"""
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from formulascraper import Formula1Scraper, HTTPStatusError, HTTPTransport, RetryPolicy
+from formulascraper.pagearchive import PageArchive
+from formulascraper.store import SQLiteStore
+
+DRIVERS_2021 = "https://www.formula1.com/en/results.html/2021/drivers.html"
+
+
+def test_get_data_raises_on_server_error(transport):
+    transport.statuses[DRIVERS_2021] = 503
+    with pytest.raises(HTTPStatusError) as info:
+        Formula1Scraper(transport=transport).get_drivers_data(2021)
+    assert info.value.status_code == 503
+
+
+def test_aget_data_raises_on_server_error(transport):
+    class AsyncTransport:
+        async def get(self, url, headers=None):
+            return transport.get(url, headers)
+
+    transport.statuses[DRIVERS_2021] = 503
+    scraper = Formula1Scraper(transport=transport, async_transport=AsyncTransport())
+    with pytest.raises(HTTPStatusError):
+        asyncio.run(scraper.aget_drivers_data(2021))
+
+
+def test_crawl_reports_error_pages(transport):
+    transport.statuses[DRIVERS_2021] = 503
+    result = Formula1Scraper(transport=transport).get_history([2021], ["drivers", "teams"])
+    assert list(result) == [(2021, "teams")]
+    assert isinstance(result.errors[(2021, "drivers")], HTTPStatusError)
+
+
+def test_missing_race_page_fails_race_results(transport):
+    scraper = Formula1Scraper(transport=transport)
+    scraper.get_race_results_data(2021)
+    index = scraper._build_url("race_results", 2021)
+    race = next(url for url, _ in transport.calls if url != index)
+    transport.statuses[race] = 404
+    result = Formula1Scraper(transport=transport).get_history([2021], ["race_results"])
+    assert not result and result.errors[(2021, "race_results")].status_code == 404
+
+
+def test_store_does_not_persist_error_pages(transport):
+    transport.statuses[DRIVERS_2021] = 503
+    store = SQLiteStore(":memory:", scrapers={"f1": Formula1Scraper(transport=transport)})
+    report = store.sync("f1", ["drivers"], [2021])
+    assert not report and ("f1", "drivers", 2021) in report.errors
+    assert store.seasons() == []
+
+    del transport.statuses[DRIVERS_2021]
+    report = store.sync("f1", ["drivers"], [2021])
+    assert report[("f1", "drivers", 2021)] > 0
+    assert store.seasons()[0][4] is True
+
+
+def test_error_pages_are_not_archived(transport, tmp_path):
+    transport.statuses[DRIVERS_2021] = 503
+    archive = PageArchive(str(tmp_path / "pages.fsa"))
+    with pytest.raises(HTTPStatusError):
+        Formula1Scraper(transport=transport, archive=archive).get_drivers_data(2021)
+    assert len(archive) == 0
+
+
+@pytest.fixture
+def unavailable_server():
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(self.path)
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", requests
+    server.shutdown()
+    server.server_close()
+
+
+def test_exhausted_retries_raise(unavailable_server):
+    url, requests = unavailable_server
+    transport = HTTPTransport(retry=RetryPolicy(retries=2, backoff=0.001),
+                              rewrite={"https://www.formula1.com": url})
+    result = Formula1Scraper(transport=transport).get_history([2021], ["drivers"])
+    error = result.errors[(2021, "drivers")]
+    assert isinstance(error, HTTPStatusError) and error.status_code == 503
+    assert len(requests) == 3
+
+
+def test_streamed_error_page_raises(unavailable_server):
+    url, _ = unavailable_server
+    transport = HTTPTransport(retry=RetryPolicy(retries=0), rewrite={"https://www.formula1.com": url})
+    with pytest.raises(HTTPStatusError):
+        list(Formula1Scraper(transport=transport).iter_drivers_data(2021))
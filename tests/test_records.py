@@ -0,0 +1,19 @@
+"""
+Tests of the typed records.
+"""
+from formulascraper import to_record
+
+ROW = {"position": "1", "name": "Max Verstappen", "nationality": "NED", "car": "Red Bull", "points": "395.5"}
+
+
+def test_equal_records_hash_alike():
+    first = to_record("f1", "drivers", ROW)
+    second = to_record("f1", "drivers", dict(ROW))
+    assert first == second and hash(first) == hash(second)
+    assert len({first, second}) == 1
+    assert {first: "champion"}[second] == "champion"
+
+
+def test_different_records_are_kept_apart():
+    other = to_record("f1", "drivers", dict(ROW, position="2"))
+    assert len({to_record("f1", "drivers", ROW), other}) == 2
@@ -0,0 +1,29 @@
+"""
+Tests of the local JSON server.
+"""
+import pytest
+
+from formulascraper.server import FormulaServer, _accepts_gzip
+
+
+@pytest.mark.parametrize("value, expected", [
+    (b"gzip", True),
+    (b"deflate, gzip;q=0.5", True),
+    (b"x-gzip", True),
+    (b"*", True),
+    (b"gzip;q=0", False),
+    (b"gzip; q=0.0, *", False),
+    (b"*;q=0", False),
+    (b"br, notgzip", False),
+    (b"identity", False),
+])
+def test_accept_encoding(value, expected):
+    assert _accepts_gzip(value) is expected
+
+
+def test_gzip_refused_with_zero_quality():
+    server = FormulaServer()
+    response, _ = server._respond(b"GET / HTTP/1.1\r\nAccept-Encoding: gzip;q=0")
+    assert b"Content-Encoding: gzip" not in response
+    response, _ = server._respond(b"GET / HTTP/1.1\r\nAccept-Encoding: gzip")
+    assert b"Content-Encoding: gzip" in response
@@ -0,0 +1,44 @@
+"""
+Tests of the polling watcher.
+"""
+from formulascraper import Formula1Scraper
+from formulascraper.watch import Watcher
+
+DRIVERS_2021 = "https://www.formula1.com/en/results.html/2021/drivers.html"
+
+
+class HeaderlessTransport:
+    """
+    Transport whose ``get`` takes no headers argument.
+    """
+    def __init__(self, transport):
+        self.transport = transport
+
+    def get(self, url):
+        return self.transport.get(url)
+
+
+def test_watcher_with_transport_without_headers(transport):
+    watcher = Watcher(Formula1Scraper(transport=HeaderlessTransport(transport)), "drivers", 2021)
+    changes = watcher.poll()
+    assert changes and all(change.kind == "added" for change in changes)
+    assert watcher.poll() == []
+    assert watcher.unchanged == 1
+    assert all(headers is None for _, headers in transport.calls)
+
+
+def test_watcher_skips_error_pages(transport):
+    watcher = Watcher(Formula1Scraper(transport=transport), "drivers", 2021)
+    rows = len(watcher.poll())
+    transport.statuses[DRIVERS_2021] = 503
+    assert watcher.poll() == []
+    assert watcher.failed == 1 and len(watcher.rows) == rows
+
+
+def test_watcher_reports_requests_to_the_collector(transport):
+    events = []
+    watcher = Watcher(Formula1Scraper(transport=transport, collector=events.append), "drivers", 2021)
+    watcher.poll()
+    watcher.poll()
+    assert [event.kind for event in events] == ["request", "request"]
+    assert watcher.not_modified == 1